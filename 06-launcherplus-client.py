@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Thin client for the launcher daemon (06-launcherplus.py --daemon).
+
+Forwards one operation over the daemon's Unix domain socket and prints its
+output as it streams back. Only the modules needed for a socket round trip
+are imported, so a call costs little more than interpreter startup.
+
+Usage:
+    python 06-launcherplus-client.py [--socket PATH] [--json] OPERATION [ARGS...]
+
+The socket defaults to launcher.sock in LAUNCHER_DATA_DIR (/tmp/cursor_launcher);
+LAUNCHER_SOCKET or --socket override it.
+
+Exit status is 0 on success, 1 when the operation failed and 2 when the
+daemon cannot be reached.
+"""
+
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET_PATH = os.path.join(os.environ.get("LAUNCHER_DATA_DIR", "/tmp/cursor_launcher"), "launcher.sock")
+
+
+def main(argv):
+    socket_path = os.environ.get("LAUNCHER_SOCKET", DEFAULT_SOCKET_PATH)
+    as_json = False
+    while argv and argv[0].startswith("--"):
+        option = argv.pop(0)
+        if option == "--socket" and argv:
+            socket_path = argv.pop(0)
+        elif option == "--json":
+            as_json = True
+        else:
+            print(__doc__.strip(), file=sys.stderr)
+            return 2
+    if not argv:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError as e:
+        print(f"Launcher daemon not reachable at {socket_path}: {e}", file=sys.stderr)
+        print("Start it with: python 06-launcherplus.py --daemon", file=sys.stderr)
+        return 2
+
+    with client, client.makefile("rb") as replies:
+        client.sendall(json.dumps({"operation": " ".join(argv)}).encode("utf-8") + b"\n")
+        try:
+            for line in replies:
+                event = json.loads(line)
+                if as_json:
+                    print(json.dumps(event), flush=True)
+                elif event["event"] == "chunk":
+                    sys.stdout.write(event["data"])
+                    sys.stdout.flush()
+                if event["event"] == "done":
+                    break
+            else:
+                print("Launcher daemon closed the connection", file=sys.stderr)
+                return 2
+        except KeyboardInterrupt:
+            return 130
+
+    if not as_json:
+        if event["status"] == "error":
+            print(event["message"], file=sys.stderr)
+        else:
+            print()
+    return 0 if event["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -17,296 +17,2861 @@ Features:
 import os
 import sys
 import json
+import signal
+import socket
 import subprocess
+import re
+import select
+import struct
+import pickle
 import logging
+import logging.handlers
+import atexit
 import time
 import sqlite3
-import hashlib
 import secrets
+import math
 import threading
-from datetime import datetime, timedelta
+import queue
+import bisect
+from array import array
+from collections import OrderedDict, deque
+import gzip
+import shutil
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-from functools import wraps
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, asdict, field, is_dataclass
+from functools import lru_cache, wraps
 from contextlib import contextmanager
 import traceback
-import platform
 
-# GUI imports
 try:
-    import tkinter as tk
-    from tkinter import ttk, messagebox, scrolledtext
-    GUI_AVAILABLE = True
-except ImportError:
-    GUI_AVAILABLE = False
-    print("Warning: GUI components not available, running in CLI mode")
-
-# Web interface imports
-try:
-    from flask import Flask, request, render_template_string, jsonify, session
-    from werkzeug.serving import make_server
-    WEB_AVAILABLE = True
-except ImportError:
-    WEB_AVAILABLE = False
-    print("Warning: Web interface not available")
+    import fcntl
+except ImportError:  # Windows: log files are then only coordinated within one process
+    fcntl = None
+
+# GUI and web imports are deferred until a mode needs them; tkinter and
+# Flask dominate import time and --help and --cli use neither.
+tk = ttk = messagebox = scrolledtext = None
+Flask = Response = request = jsonify = session = None
+SessionInterface = SessionMixin = CallbackDict = JSONProvider = None
+
+def load_gui() -> bool:
+    """Import tkinter on first use; return whether the GUI is available"""
+    global tk, ttk, messagebox, scrolledtext
+    if tk is None:
+        try:
+            import tkinter
+            import tkinter.ttk
+            import tkinter.messagebox
+            import tkinter.scrolledtext
+        except ImportError:
+            return False
+        tk, ttk = tkinter, tkinter.ttk
+        messagebox, scrolledtext = tkinter.messagebox, tkinter.scrolledtext
+    return True
+
+def load_web() -> bool:
+    """Import Flask on first use; return whether the web interface is available"""
+    global Flask, Response, request, jsonify, session
+    global SessionInterface, SessionMixin, CallbackDict, JSONProvider
+    if Flask is None:
+        try:
+            import flask
+            import flask.json.provider
+            import flask.sessions
+            import werkzeug.datastructures
+        except ImportError:
+            return False
+        Response, request, session = flask.Response, flask.request, flask.session
+        jsonify = flask.jsonify
+        SessionInterface, SessionMixin = flask.sessions.SessionInterface, flask.sessions.SessionMixin
+        CallbackDict = werkzeug.datastructures.CallbackDict
+        JSONProvider = flask.json.provider.JSONProvider
+        Flask = flask.Flask
+    return True
+
+def utc_isoformat(epoch: Optional[float] = None) -> str:
+    """ISO 8601 UTC time with a Z suffix, the form API payloads report times in"""
+    moment = datetime.now(timezone.utc) if epoch is None else datetime.fromtimestamp(epoch, timezone.utc)
+    return moment.isoformat().replace('+00:00', 'Z')
+
+# JSON serialization shared by the web API, the daemon, the stores and the
+# JSON reports; orjson is used when installed, stdlib json otherwise.
+@lru_cache(maxsize=None)
+def _load_orjson():
+    """Return the orjson module if installed, else None"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+def _json_default(value: Any) -> Any:
+    """Encode the few non-JSON types the launcher serializes: paths, sets, datetimes, dataclasses"""
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _replace_non_finite(value: Any) -> Any:
+    """Copy of `value` with NaN and infinities replaced by None, as orjson writes them"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+def json_dumpb(value: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact unless `pretty` (2-space indent)
+    
+    NaN and infinities become null with either encoder; other unsupported
+    types raise TypeError.
+    """
+    orjson = _load_orjson()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(value, default=_json_default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which stdlib json still encodes;
+            # genuinely unsupported types raise TypeError again below
+            pass
+    options = {'indent': 2} if pretty else {'separators': (',', ':')}
+    try:
+        text = json.dumps(value, ensure_ascii=False, allow_nan=False, default=_json_default, **options)
+    except ValueError:
+        # Non-finite floats are rare; only then pay for a sanitising copy
+        text = json.dumps(
+            _replace_non_finite(value), ensure_ascii=False, allow_nan=False,
+            default=lambda item: _replace_non_finite(_json_default(item)), **options
+        )
+    return text.encode('utf-8')
+
+def json_dumps(value: Any, pretty: bool = False) -> str:
+    """Serialize to a JSON string, compact unless `pretty`"""
+    return json_dumpb(value, pretty).decode('utf-8')
+
+def json_loads(data) -> Any:
+    """Parse JSON from str or bytes"""
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # Professional logging configuration
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands raw records to the listener thread without blocking
+    
+    When the queue is full ordinary records are dropped and counted. Records
+    from `lossless_logger` wait up to `block_seconds` for space and are then
+    passed to `overflow`, which writes them synchronously.
+    """
+    
+    def __init__(self, record_queue: queue.Queue, on_first_record: Optional[Callable[[], None]] = None,
+                 lossless_logger: Optional[str] = None, block_seconds: float = 1.0,
+                 overflow: Optional[Callable[[logging.LogRecord], None]] = None):
+        super().__init__(record_queue)
+        # Called before each enqueue until it clears itself; starts the listener lazily
+        self.on_first_record = on_first_record
+        self.lossless_logger = lossless_logger
+        self.block_seconds = block_seconds
+        self.overflow = overflow
+        self.dropped = 0
+        self.overflowed = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is deferred to the listener thread; the record is only
+        # consumed in-process so it does not need to be made picklable.
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        if self.on_first_record is not None:
+            self.on_first_record()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.name != self.lossless_logger or self.overflow is None:
+                self.dropped += 1
+                return
+            try:
+                self.queue.put(record, timeout=self.block_seconds)
+            except queue.Full:
+                self.overflowed += 1
+                self.overflow(record)
+
+class ForwardingSocketHandler(logging.handlers.SocketHandler):
+    """SocketHandler over an already connected socket, such as one end of a socketpair"""
+    
+    def __init__(self, sock: socket.socket):
+        super().__init__(None, None)
+        self.sock = sock
+    
+    def makeSocket(self, timeout: float = 1):
+        # The peer owns the other end; once this one fails there is nothing to reconnect to
+        raise OSError("log forwarding socket is closed")
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop() waits for space instead of failing on a full queue"""
+    
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+@contextmanager
+def _file_lock(path: Path, exclusive: bool = True):
+    """Hold an flock on `path` (created if missing) for the duration of the block"""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        os.close(fd)
+
+class LogArchiver:
+    """Background compressor and disk-budget enforcer for rotated log segments
+    
+    Compression and deletion run under an exclusive lock on the log
+    directory's .archive.lock, so archivers in several processes sharing
+    the directory never work on the same segment at once.
+    """
+    
+    SEGMENT_SUFFIX = ".gz"
+    LOCK_NAME = ".archive.lock"
+    
+    def __init__(self, log_dir: Path, disk_budget_bytes: int = 100 * 1024 * 1024,
+                 compress_level: int = 6):
+        self.log_dir = Path(log_dir)
+        self.disk_budget_bytes = disk_budget_bytes
+        self.compress_level = compress_level
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="log-archiver", daemon=True)
+        self._thread.start()
+        
+        # Segments left uncompressed by a previous process
+        for segment in self.log_dir.glob("*.log.*"):
+            if segment.suffix not in (self.SEGMENT_SUFFIX, ".tmp"):
+                self.submit(segment)
+        self.submit(None)
+    
+    def submit(self, segment: Optional[Path]):
+        """Queue a rotated segment for compression (None only enforces the budget)"""
+        self._queue.put(segment)
+    
+    def close(self, timeout: float = 10.0):
+        """Finish pending compressions and stop the archiver thread"""
+        self._queue.put(StopIteration)
+        self._thread.join(timeout)
+    
+    def restart_after_fork(self):
+        """Give a forked child its own queue and archiver thread"""
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="log-archiver", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        while True:
+            segment = self._queue.get()
+            if segment is StopIteration:
+                return
+            try:
+                with _file_lock(self.log_dir / self.LOCK_NAME):
+                    if segment is not None:
+                        self._compress(segment)
+                    self.enforce_budget()
+            except Exception as e:
+                # The logging pipeline cannot log its own failures safely
+                print(f"Log archiver error: {e}", file=sys.stderr)
+    
+    def _compress(self, segment: Path):
+        if not segment.exists():
+            return
+        target = segment.with_name(segment.name + self.SEGMENT_SUFFIX)
+        partial = target.with_name(target.name + ".tmp")
+        with open(segment, 'rb') as src, gzip.open(partial, 'wb', compresslevel=self.compress_level) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(partial, target)
+        segment.unlink()
+    
+    def enforce_budget(self):
+        """Delete the oldest rotated segments until the log directory fits the budget"""
+        files = [p for p in self.log_dir.iterdir() if p.is_file() and ".log" in p.name]
+        total = sum(p.stat().st_size for p in files)
+        if total <= self.disk_budget_bytes:
+            return
+        
+        rotated = sorted(
+            (p for p in files if ".log." in p.name and not p.name.endswith(".tmp")),
+            key=lambda p: p.stat().st_mtime
+        )
+        for segment in rotated:
+            if total <= self.disk_budget_bytes:
+                break
+            size = segment.stat().st_size
+            segment.unlink()
+            total -= size
+
+class ArchivingFileHandler(logging.handlers.BaseRotatingHandler):
+    """File handler that rotates by size or age and hands segments to a LogArchiver
+    
+    Rotation is a rename, so the writing thread never waits on compression.
+    Several processes may write the same file: each write holds a shared
+    flock and first reopens the file if the path no longer names the one
+    open here, and rotation holds the lock exclusively. Nobody writes into
+    a segment after it has been renamed, so archiving it loses nothing.
+    """
+    
+    def __init__(self, filename: Path, archiver: LogArchiver, max_bytes: int = 10 * 1024 * 1024,
+                 max_age_seconds: float = 24 * 3600):
+        base = Path(filename)
+        # No ".log" in the name, so segment listing and the disk budget ignore it
+        self.lock_path = base.with_name(f".{base.stem}.lock")
+        self._lock_fd: Optional[int] = None
+        self._lock_pid: Optional[int] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        super().__init__(str(filename), 'a', encoding='utf-8')
+        self.archiver = archiver
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.opened_at = time.time()
+    
+    def _open(self):
+        stream = super()._open()
+        stat = os.fstat(stream.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        return stream
+    
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        if fcntl is None:
+            yield
+            return
+        if self._lock_pid != os.getpid():
+            # flock belongs to the open file description, which a forked child shares
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._lock_pid = os.getpid()
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+    
+    def _reopen_if_moved(self):
+        """Reopen the path if another process rotated the file open here"""
+        try:
+            stat = os.stat(self.baseFilename)
+            current = (stat.st_dev, stat.st_ino)
+        except FileNotFoundError:
+            current = None
+        if self.stream is not None and current == self._identity:
+            return
+        if self.stream is not None:
+            self.stream.close()
+        self.stream = self._open()
+        self.opened_at = time.time()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            with self._locked(exclusive=False):
+                self._reopen_if_moved()
+                if not self.shouldRollover(record):
+                    logging.FileHandler.emit(self, record)
+                    return
+            with self._locked(exclusive=True):
+                # Another process may have rotated while this one waited
+                self._reopen_if_moved()
+                if self.shouldRollover(record):
+                    self.doRollover()
+                logging.FileHandler.emit(self, record)
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        super().close()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+        self._lock_fd = self._lock_pid = None
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        position = self.stream.tell()
+        if position == 0:
+            return False
+        if self.max_bytes and position >= self.max_bytes:
+            return True
+        return bool(self.max_age_seconds) and time.time() - self.opened_at >= self.max_age_seconds
+    
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        
+        base = Path(self.baseFilename)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        segment = base.with_name(f"{base.name}.{stamp}")
+        counter = 1
+        while segment.exists() or segment.with_name(segment.name + LogArchiver.SEGMENT_SUFFIX).exists():
+            segment = base.with_name(f"{base.name}.{stamp}-{counter:03d}")
+            counter += 1
+        
+        if base.exists():
+            os.rename(base, segment)
+            self.archiver.submit(segment)
+        
+        self.stream = self._open()
+        self.opened_at = time.time()
+
+def list_log_segments(log_dir: Path, log_name: str) -> List[Path]:
+    """Return a log's rotated segments oldest first, followed by the active file"""
+    log_dir = Path(log_dir)
+    segments: Dict[str, Path] = {}
+    for path in log_dir.glob(f"{log_name}.*"):
+        if path.name.endswith(".tmp"):
+            continue
+        stem = path.name[:-len(LogArchiver.SEGMENT_SUFFIX)] if path.suffix == LogArchiver.SEGMENT_SUFFIX else path.name
+        # An uncompressed segment wins over a compressed copy still being finalised
+        if stem not in segments or path.suffix != LogArchiver.SEGMENT_SUFFIX:
+            segments[stem] = path
+    
+    ordered = [segments[stem] for stem in sorted(segments)]
+    active = log_dir / log_name
+    if active.exists():
+        ordered.append(active)
+    return ordered
+
+def open_log_segment(path: Path):
+    """Open an active or rotated log segment as text, decompressing when needed"""
+    if Path(path).suffix == LogArchiver.SEGMENT_SUFFIX:
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+# Log files readable through the `logs` operation
+LOG_FILES = {'launcher': 'launcher.log', 'error': 'error.log', 'audit': 'audit.log'}
+
+# First line of a record from either ProfessionalLogger formatter; lines that
+# do not match continue the previous record (tracebacks, multi-line messages)
+_LOG_HEADER_RE = re.compile(
+    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ - (?:.*? - )?(DEBUG|INFO|WARNING|ERROR|CRITICAL|AUDIT) - '
+)
+
+def _parse_log_header(line: str) -> Optional[Tuple[str, int]]:
+    """Return (timestamp, levelno) for the first line of a record, else None"""
+    match = _LOG_HEADER_RE.match(line)
+    if match is None:
+        return None
+    level = match.group(2)
+    return match.group(1), logging.INFO if level == 'AUDIT' else logging.getLevelName(level)
+
+def _iter_lines_reverse(path: Path, end: Optional[int] = None, block_size: int = 64 * 1024) -> Iterator[str]:
+    """Yield the lines of an uncompressed file last to first, reading backwards in blocks"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END) if end is None else end
+        remainder = b''
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b'\n')
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode('utf-8', errors='replace')
+        yield remainder.decode('utf-8', errors='replace')
+
+def _iter_records(lines: Iterable[str]) -> Iterator[Tuple[str, Optional[Tuple[str, int]]]]:
+    """Group lines read first to last into (text, header) records"""
+    text: List[str] = []
+    header = None
+    for line in lines:
+        line = line.rstrip('\n')
+        parsed = _parse_log_header(line)
+        if parsed is not None:
+            if text:
+                yield "\n".join(text), header
+            text, header = [line], parsed
+        elif line:
+            text.append(line)
+    if text:
+        yield "\n".join(text), header
+
+class LogQuery:
+    """Record filter for reading logs: minimum level, time window and substring"""
+    
+    def __init__(self, level: Optional[str] = None, since_seconds: Optional[float] = None,
+                 grep: Optional[str] = None):
+        self.min_level: Optional[int] = None
+        if level:
+            self.min_level = logging.getLevelName(level.upper())
+            if not isinstance(self.min_level, int):
+                raise ValueError(f"unknown log level '{level}'")
+        # Log timestamps are local time in a sortable format, so they compare as strings
+        self.since: Optional[str] = None
+        if since_seconds:
+            self.since = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time() - since_seconds))
+        self.grep = grep.lower() if grep else None
+    
+    def before_window(self, timestamp: str) -> bool:
+        return self.since is not None and timestamp < self.since
+    
+    def matches(self, header: Optional[Tuple[str, int]], text: str) -> bool:
+        if header is None:
+            # Orphaned continuation lines carry neither level nor time
+            if self.min_level is not None or self.since is not None:
+                return False
+        else:
+            timestamp, levelno = header
+            if self.min_level is not None and levelno < self.min_level:
+                return False
+            if self.before_window(timestamp):
+                return False
+        return self.grep is None or self.grep in text.lower()
+
+class InotifyWatch:
+    """Minimal ctypes binding to Linux inotify, watching one directory"""
+    
+    IN_MODIFY = 0x002
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    _EVENT = struct.Struct('iIII')
+    _libc = None
+    
+    def __init__(self, fd: int):
+        self.fd = fd
+        self._poller = select.poll()
+        self._poller.register(fd, select.POLLIN)
+    
+    @classmethod
+    def open(cls, directory: Path) -> Optional['InotifyWatch']:
+        """Watch a directory for writes and renames, or return None without inotify"""
+        if not sys.platform.startswith('linux'):
+            return None
+        import ctypes
+        import ctypes.util
+        try:
+            if cls._libc is None:
+                cls._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = cls._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            mask = cls.IN_MODIFY | cls.IN_MOVED_FROM | cls.IN_MOVED_TO | cls.IN_CREATE
+            if cls._libc.inotify_add_watch(fd, os.fsencode(str(directory)), mask) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, "inotify_add_watch failed")
+        except (OSError, AttributeError) as e:
+            logger.debug("inotify unavailable, polling instead: %s", e)
+            return None
+        return cls(fd)
+    
+    def wait(self, timeout: float) -> set:
+        """Block until events arrive or the timeout passes; return the changed file names"""
+        names = set()
+        if not self._poller.poll(max(timeout, 0) * 1000):
+            return names
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            _wd, _mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            names.add(data[offset:offset + length].split(b'\0', 1)[0].decode('utf-8', errors='replace'))
+            offset += length
+        return names
+    
+    def close(self):
+        os.close(self.fd)
+
+class LogTailer:
+    """Reads the newest records of one launcher log across its rotated segments
+    
+    The active file and uncompressed segments are read backwards in blocks,
+    stopping once enough records matched or the time window is passed. Gzip
+    segments can only be streamed forward and keep just the newest matches;
+    segments rotated before the window are never opened.
+    """
+    
+    def __init__(self, log_dir: Path, log_name: str, query: LogQuery):
+        self.log_dir = Path(log_dir)
+        self.log_name = log_name
+        self.query = query
+        self.active = self.log_dir / log_name
+        # End offset of the active file covered by tail(); follow() starts here
+        self.position = 0
+    
+    def tail(self, count: int) -> List[str]:
+        """Return up to `count` matching records, oldest first"""
+        records: List[str] = []
+        segments = list_log_segments(self.log_dir, self.log_name)
+        self.position = self.active.stat().st_size if self.active.exists() else 0
+        
+        for segment in reversed(segments):
+            if segment != self.active and self._rotated_before_window(segment):
+                break
+            need = count - len(records)
+            if segment.suffix == LogArchiver.SEGMENT_SUFFIX:
+                newest, window_passed = self._scan_forward(segment, need)
+            else:
+                end = self.position if segment == self.active else None
+                newest, window_passed = self._scan_reverse(segment, need, end)
+            records.extend(newest)
+            if len(records) >= count or window_passed:
+                break
+        
+        return records[::-1]
+    
+    def _scan_reverse(self, path: Path, need: int, end: Optional[int]) -> Tuple[List[str], bool]:
+        records: List[str] = []
+        pending: List[str] = []
+        for line in _iter_lines_reverse(path, end):
+            if not line:
+                continue
+            header = _parse_log_header(line)
+            if header is None:
+                pending.append(line)
+                continue
+            if self.query.before_window(header[0]):
+                return records, True
+            text = "\n".join([line] + pending[::-1])
+            pending = []
+            if self.query.matches(header, text):
+                records.append(text)
+                if len(records) >= need:
+                    return records, False
+        
+        if pending:
+            text = "\n".join(pending[::-1])
+            if self.query.matches(None, text):
+                records.append(text)
+        return records, False
+    
+    def _scan_forward(self, path: Path, need: int) -> Tuple[List[str], bool]:
+        newest = deque(maxlen=need)
+        window_passed = False
+        with open_log_segment(path) as stream:
+            for text, header in _iter_records(stream):
+                if header is not None and self.query.before_window(header[0]):
+                    window_passed = True
+                elif self.query.matches(header, text):
+                    newest.append(text)
+        return list(reversed(newest)), window_passed
+    
+    def _rotated_before_window(self, segment: Path) -> bool:
+        """Segment names carry their rotation time, the newest record they can hold"""
+        if self.query.since is None:
+            return False
+        stamp = segment.name[len(self.log_name) + 1:][:15]
+        try:
+            rotated_at = time.strftime('%Y-%m-%d %H:%M:%S', time.strptime(stamp, '%Y%m%d-%H%M%S'))
+        except ValueError:
+            return False
+        return rotated_at < self.query.since
+    
+    def follow(self, deadline: float, poll_interval: float = 1.0) -> Iterator[str]:
+        """Yield matching records appended after tail() until the monotonic deadline
+        
+        Wakes on inotify events for the active file where available, otherwise
+        checks its size every `poll_interval` seconds. Rotation is detected by
+        inode and the new file is read from the start.
+        """
+        watch = InotifyWatch.open(self.log_dir)
+        stream = None
+        buffer = b''
+        matching = False
+        try:
+            while True:
+                if stream is None and self.active.exists():
+                    stream = open(self.active, 'rb')
+                    stream.seek(min(self.position, os.fstat(stream.fileno()).st_size))
+                    self.position = 0
+                
+                if stream is not None:
+                    buffer += stream.read()
+                    lines = buffer.split(b'\n')
+                    buffer = lines.pop()
+                    
+                    output: List[str] = []
+                    for raw in lines:
+                        line = raw.decode('utf-8', errors='replace')
+                        header = _parse_log_header(line)
+                        if header is not None:
+                            matching = self.query.matches(header, line)
+                        if matching and line:
+                            output.append(line)
+                    if output:
+                        yield "\n".join(output)
+                    
+                    try:
+                        rotated = os.stat(self.active).st_ino != os.fstat(stream.fileno()).st_ino
+                    except FileNotFoundError:
+                        rotated = True
+                    if rotated:
+                        # Everything written before the rename has been read above
+                        stream.close()
+                        stream = None
+                        buffer = b''
+                        continue
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                if watch is None:
+                    time.sleep(min(remaining, poll_interval))
+                else:
+                    while self.log_name not in watch.wait(remaining):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return
+        finally:
+            if stream is not None:
+                stream.close()
+            if watch is not None:
+                watch.close()
+
 class ProfessionalLogger:
-    """Professional logging system with multiple handlers and audit capabilities"""
+    """Professional logging system with multiple handlers and audit capabilities
+    
+    Callers only enqueue records; a single listener thread formats them and
+    performs all file and console I/O.
+    """
+    
+    def __init__(self, name: str, log_dir: str = "/tmp/cursor_launcher",
+                 level: int = logging.INFO, queue_size: int = 10000,
+                 max_bytes: int = 10 * 1024 * 1024, max_age_seconds: float = 24 * 3600,
+                 disk_budget_bytes: int = 100 * 1024 * 1024):
+        self.log_dir = Path(log_dir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.disk_budget_bytes = disk_budget_bytes
+        
+        # The logger level matches the most verbose handler so that
+        # filtered-out calls return before a LogRecord is built.
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(level)
+        self.logger.handlers.clear()
+        
+        # Audit logger propagates into the same queue; its file handler only
+        # accepts records from the audit logger.
+        self.audit_logger = logging.getLogger(f"{name}.audit")
+        
+        # Records queue up from the start; files and the I/O thread are only
+        # created when the first record arrives, so modes that never log
+        # never touch the log directory.
+        # Audit records are never dropped: they wait for queue space and
+        # are finally written from the calling thread.
+        self.queue_handler = NonBlockingQueueHandler(
+            queue.Queue(maxsize=queue_size), on_first_record=self.start,
+            lossless_logger=self.audit_logger.name, overflow=self._write_directly
+        )
+        self.logger.addHandler(self.queue_handler)
+        self.archiver: Optional[LogArchiver] = None
+        self.listener: Optional[DrainingQueueListener] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._restart_after_fork)
+    
+    def start(self):
+        """Open the log files and start the listener thread; safe to call repeatedly"""
+        with self._start_lock:
+            if self.listener is not None:
+                return
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self.archiver = LogArchiver(self.log_dir, disk_budget_bytes=self.disk_budget_bytes)
+            
+            def file_handler(filename: str) -> ArchivingFileHandler:
+                return ArchivingFileHandler(
+                    self.log_dir / filename, self.archiver,
+                    max_bytes=self.max_bytes, max_age_seconds=self.max_age_seconds
+                )
+            
+            # Create formatters
+            detailed_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+            )
+            
+            # File handlers
+            info_handler = file_handler('launcher.log')
+            info_handler.setLevel(logging.INFO)
+            info_handler.setFormatter(detailed_formatter)
+            
+            error_handler = file_handler('error.log')
+            error_handler.setLevel(logging.ERROR)
+            error_handler.setFormatter(detailed_formatter)
+            
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(detailed_formatter)
+            
+            audit_handler = file_handler('audit.log')
+            audit_formatter = logging.Formatter(
+                '%(asctime)s - AUDIT - %(message)s'
+            )
+            audit_handler.setFormatter(audit_formatter)
+            audit_handler.addFilter(logging.Filter(self.audit_logger.name))
+            
+            # Queue pipeline: one I/O thread owns every handler
+            self.listener = DrainingQueueListener(
+                self.queue_handler.queue,
+                info_handler, error_handler, console_handler, audit_handler,
+                respect_handler_level=True
+            )
+            self.listener.start()
+            self.queue_handler.on_first_record = None
+    
+    def debug(self, msg: str, *args): self.logger.debug(msg, *args, stacklevel=2)
+    def info(self, msg: str, *args): self.logger.info(msg, *args, stacklevel=2)
+    def warning(self, msg: str, *args): self.logger.warning(msg, *args, stacklevel=2)
+    def error(self, msg: str, *args): self.logger.error(msg, *args, stacklevel=2)
+    def critical(self, msg: str, *args): self.logger.critical(msg, *args, stacklevel=2)
+    
+    def audit(self, action: str, details: str = "", operation: Optional[str] = None):
+        """Log audit events; `operation` is appended to the action as ACTION:operation"""
+        if operation is None:
+            self.audit_logger.info("ACTION:%s | DETAILS:%s", action, details, stacklevel=2)
+        else:
+            self.audit_logger.info("ACTION:%s:%s | DETAILS:%s", action, operation, details, stacklevel=2)
+    
+    def _write_directly(self, record: logging.LogRecord):
+        """Hand a record straight to the file handlers, bypassing the full queue"""
+        listener = self.listener
+        if listener is None:
+            return
+        # Handlers serialise emit() with their own locks, so this is safe
+        # alongside the listener thread
+        listener.handle(record)
+    
+    def _restart_after_fork(self):
+        """Threads do not survive fork(); start a fresh queue and listener in the child"""
+        self._start_lock = threading.Lock()
+        if self._closed or self.listener is None:
+            return
+        if self.archiver is not None:
+            self.archiver.restart_after_fork()
+        self.queue_handler.queue = queue.Queue(maxsize=self.queue_handler.queue.maxsize)
+        self.listener = DrainingQueueListener(
+            self.queue_handler.queue, *self.listener.handlers, respect_handler_level=True
+        )
+        self.listener.start()
+    
+    def forward_to(self, sock: socket.socket):
+        """Send records to another process over `sock` instead of writing the log files here
+        
+        Pre-forked web workers use this so that only the parent writes,
+        rotates and archives the shared log files.
+        """
+        forwarder = ForwardingSocketHandler(sock)
+        with self._start_lock:
+            if self.listener is None:
+                self.listener = DrainingQueueListener(self.queue_handler.queue, forwarder)
+                self.listener.start()
+                self.queue_handler.on_first_record = None
+            else:
+                # Swapping handlers under the running listener keeps queued records
+                file_handlers = self.listener.handlers
+                self.listener.handlers = (forwarder,)
+                for handler in file_handlers:
+                    handler.close()
+            if self.archiver is not None:
+                self.archiver.close()
+                self.archiver = None
+    
+    def receive_from(self, sock: socket.socket) -> threading.Thread:
+        """Log the records another process's forward_to() sends over `sock` until it closes"""
+        def receive():
+            with sock, sock.makefile('rb') as stream:
+                while True:
+                    # SocketHandler framing: 4-byte big-endian length, then a pickled dict
+                    header = stream.read(4)
+                    if len(header) < 4:
+                        return
+                    length = struct.unpack('>L', header)[0]
+                    payload = stream.read(length)
+                    if len(payload) < length:
+                        return
+                    self.queue_handler.handle(logging.makeLogRecord(pickle.loads(payload)))
+        
+        thread = threading.Thread(target=receive, name="log-receiver", daemon=True)
+        thread.start()
+        return thread
+    
+    @property
+    def dropped_records(self) -> int:
+        """Records discarded because the queue was full"""
+        return self.queue_handler.dropped
+    
+    @property
+    def overflowed_records(self) -> int:
+        """Audit records written synchronously because the queue stayed full"""
+        return self.queue_handler.overflowed
+    
+    def close(self):
+        """Drain queued records and stop the listener thread"""
+        if self._closed:
+            return
+        if self.listener is None:
+            if self.queue_handler.queue.empty():
+                self._closed = True
+                return
+            # Records logged without going through start() still need writing
+            self.start()
+        self._closed = True
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        if self.archiver is not None:
+            self.archiver.close()
+
+# Logs, the database and the daemon socket live here; LAUNCHER_DATA_DIR
+# moves them, e.g. to keep test runs away from a real installation
+DATA_DIR = Path(os.environ.get('LAUNCHER_DATA_DIR', '/tmp/cursor_launcher'))
+
+# Global logger
+logger = ProfessionalLogger(__name__, log_dir=str(DATA_DIR))
+
+@dataclass
+class LauncherConfig:
+    """Professional launcher configuration"""
+    VERSION: str = "2.0.0"
+    APP_NAME: str = "Cursor Bundle Launcher Pro"
+    
+    # Security settings; LAUNCHER_SECRET_KEY pins the key across processes
+    # and restarts, otherwise secret_key() generates one on first use
+    SECRET_KEY: str = field(default_factory=lambda: os.environ.get('LAUNCHER_SECRET_KEY', ''))
+    SESSION_TIMEOUT_MINUTES: int = 30
+    MAX_COMMAND_LENGTH: int = 500
+    
+    # Session store settings; the cache TTL bounds how stale a session
+    # written by another worker process can be
+    SESSION_CACHE_SIZE: int = 1024
+    SESSION_CACHE_TTL_SECONDS: float = 2.0
+    SESSION_REFRESH_SECONDS: float = 60.0
+    SESSION_SWEEP_INTERVAL_SECONDS: float = 60.0
+    SESSION_SWEEP_BATCH: int = 500
+    
+    # File settings
+    BUNDLE_DIR: Path = Path(__file__).parent.absolute()
+    BUNDLE_SCAN_DEPTH: int = 2
+    BUNDLE_CHECK_INTERVAL_SECONDS: float = 1.0
+    LOG_DIR: Path = DATA_DIR
+    DATABASE_FILE: Path = DATA_DIR / "launcher.db"
+    
+    # Database settings
+    DB_POOL_SIZE: int = 8
+    DB_BUSY_TIMEOUT_MS: int = 5000
+    DB_SYNCHRONOUS: str = "NORMAL"
+    DB_STATEMENT_CACHE_SIZE: int = 128
+    
+    # Operations log write-behind settings
+    OPLOG_BATCH_SIZE: int = 100
+    OPLOG_FLUSH_INTERVAL_SECONDS: float = 0.5
+    OPLOG_QUEUE_SIZE: int = 10000
+    OPLOG_ENQUEUE_TIMEOUT_SECONDS: float = 0.05
+    
+    # Config store settings
+    CONFIG_WATCH_INTERVAL_SECONDS: float = 1.0
+    
+    # Health check settings
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 15.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    
+    # Log viewing settings for the `logs` operation
+    LOGS_DEFAULT_LINES: int = 50
+    LOGS_MAX_LINES: int = 5000
+    LOGS_FOLLOW_MAX_SECONDS: float = 300.0
+    
+    # Admission control for the web API, applied per worker process;
+    # a rate of 0 disables that bucket
+    RATE_LIMIT_CLIENT_PER_SECOND: float = 10.0
+    RATE_LIMIT_CLIENT_BURST: int = 50  # a full batch costs BATCH_MAX_OPERATIONS tokens
+    RATE_LIMIT_GLOBAL_PER_SECOND: float = 100.0
+    RATE_LIMIT_GLOBAL_BURST: int = 200
+    RATE_LIMIT_MAX_CLIENTS: int = 10000
+    MAX_IN_FLIGHT_OPERATIONS: int = 16
+    ADMISSION_QUEUE_SIZE: int = 64
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    
+    # Batch execution settings
+    BATCH_MAX_OPERATIONS: int = 50
+    BATCH_MAX_WORKERS: int = 8
+    
+    # Operations declaring a timeout run on a shared pool; a timed-out handler
+    # keeps its worker until it returns, so past this many the pool refuses work
+    OPERATION_MAX_WORKERS: int = 8
+    OPERATION_MAX_ABANDONED: int = 4
+    
+    # Web serving settings
+    WEB_HOST: str = "127.0.0.1"
+    WEB_PORT: int = 8080
+    WEB_WORKERS: int = 1
+    WEB_THREADS: int = 8
+    WEB_CLIENT_TIMEOUT_SECONDS: float = 5.0
+    WEB_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+    WEB_PAGE_MAX_AGE_SECONDS: int = 60
+    WEB_COMPRESS_MIN_BYTES: int = 1024
+    WEB_GZIP_LEVEL: int = 6
+    
+    # Process supervisor settings
+    PROCESS_STOP_TIMEOUT_SECONDS: float = 10.0
+    PROCESS_POLL_INTERVAL_SECONDS: float = 0.5
+    
+    # Daemon settings
+    DAEMON_SOCKET_PATH: Path = DATA_DIR / "launcher.sock"
+    
+    # Resource sampler settings (default capacity covers one hour)
+    RESOURCE_SAMPLE_INTERVAL_SECONDS: float = 5.0
+    RESOURCE_SAMPLE_CAPACITY: int = 720
+    
+    # GUI settings
+    WINDOW_WIDTH: int = 800
+    WINDOW_HEIGHT: int = 600
+    THEME: str = "default"
+    GUI_WORKERS: int = 4
+    GUI_POLL_INTERVAL_MS: int = 15
+    GUI_FRAME_BUDGET_MS: float = 8.0
+    GUI_OUTPUT_MAX_LINES: int = 5000
+    GUI_OUTPUT_CHUNK_CHARS: int = 32 * 1024
+    GUI_OUTPUT_MAX_PENDING_CHARS: int = 1024 * 1024
+    GUI_OUTPUT_LOAD_MORE_LINES: int = 1000
+    GUI_DASHBOARD_INTERVAL_MS: int = 1000
+    GUI_DASHBOARD_HISTORY: int = 120
+    GUI_DASHBOARD_FRAME_BUDGET_MS: float = 4.0
+    
+    # Allowed operations for security
+    ALLOWED_OPERATIONS: List[str] = None
+    
+    def __post_init__(self):
+        if self.ALLOWED_OPERATIONS is None:
+            self.ALLOWED_OPERATIONS = [
+                'status', 'version', 'check', 'info', 'help', 'launch',
+                'stop', 'restart', 'health', 'logs', 'config'
+            ]
+    
+    def secret_key(self) -> str:
+        """Return SECRET_KEY, generating a random one the first time it is needed"""
+        if not self.SECRET_KEY:
+            self.SECRET_KEY = secrets.token_hex(32)
+        return self.SECRET_KEY
+
+# Global configuration
+config = LauncherConfig()
+
+class Counter:
+    """Monotonic counter, optionally split by label values"""
+    
+    TYPE = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, *label_values: str, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+    
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+    
+    def total(self, **label_filter: str) -> float:
+        """Sum across all label combinations matching the given label values"""
+        positions = [(self.labelnames.index(k), v) for k, v in label_filter.items()]
+        with self._lock:
+            items = list(self._values.items())
+        return sum(v for labels, v in items if all(labels[i] == want for i, want in positions))
+    
+    def samples(self) -> List[Tuple[str, Tuple[str, ...], float]]:
+        with self._lock:
+            return [(self.name, labels, v) for labels, v in sorted(self._values.items())]
+
+class Gauge(Counter):
+    """Value that can go up and down, or be computed on scrape by a callback"""
+    
+    TYPE = "gauge"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+    
+    def set(self, value: float, *label_values: str):
+        with self._lock:
+            self._values[label_values] = value
+    
+    def dec(self, *label_values: str, amount: float = 1.0):
+        self.inc(*label_values, amount=-amount)
+    
+    def value(self, *label_values: str) -> float:
+        if self.function is not None:
+            return self.function()
+        return super().value(*label_values)
+    
+    def samples(self) -> List[Tuple[str, Tuple[str, ...], float]]:
+        if self.function is not None:
+            return [(self.name, (), self.function())]
+        return super().samples()
+
+class Histogram:
+    """Latency histogram with fixed upper bounds, optionally split by label values"""
+    
+    TYPE = "histogram"
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., overflow count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float, *label_values: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+    
+    def series(self) -> Dict[Tuple[str, ...], List[float]]:
+        """Copy of the raw per-bucket counts (non-cumulative) and sum per label set"""
+        with self._lock:
+            return {labels: list(values) for labels, values in self._series.items()}
+    
+    def samples(self) -> List[Tuple[str, Tuple[str, ...], float]]:
+        result = []
+        bounds = [repr(float(b)) for b in self.buckets] + ['+Inf']
+        for labels, values in sorted(self.series().items()):
+            cumulative = 0
+            for bound, count in zip(bounds, values[:-1]):
+                cumulative += count
+                result.append((f"{self.name}_bucket", labels + (bound,), cumulative))
+            result.append((f"{self.name}_sum", labels, values[-1]))
+            result.append((f"{self.name}_count", labels, cumulative))
+        return result
+    
+    def sample_labelnames(self, sample_name: str) -> Tuple[str, ...]:
+        if sample_name.endswith("_bucket"):
+            return self.labelnames + ('le',)
+        return self.labelnames
+
+class MetricsRegistry:
+    """Process-wide collection of metrics with Prometheus text exposition"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, function))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = Histogram.DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    def get(self, name: str):
+        return self._metrics.get(name)
+    
+    @staticmethod
+    def _escape(value: str) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format (0.0.4)"""
+        lines = []
+        with self._lock:
+            registered = list(self._metrics.values())
+        for metric in registered:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for sample_name, labels, value in metric.samples():
+                names = (metric.sample_labelnames(sample_name)
+                         if hasattr(metric, 'sample_labelnames') else metric.labelnames)
+                if labels:
+                    pairs = ",".join(f'{k}="{self._escape(v)}"' for k, v in zip(names, labels))
+                    lines.append(f"{sample_name}{{{pairs}}} {value}")
+                else:
+                    lines.append(f"{sample_name} {value}")
+        return "\n".join(lines) + "\n"
+
+# Process-wide metrics shared by every interface in this process
+PROCESS_START_TIME = time.time()
+metrics = MetricsRegistry()
+operations_total = metrics.counter(
+    'launcher_operations_total', 'Operations executed, by operation and result status',
+    ('operation', 'status')
+)
+operation_duration_seconds = metrics.histogram(
+    'launcher_operation_duration_seconds', 'Operation execution latency in seconds',
+    ('operation',)
+)
+metrics.gauge(
+    'launcher_process_start_time_seconds', 'Unix time the launcher process started',
+    function=lambda: PROCESS_START_TIME
+)
+metrics.gauge(
+    'launcher_uptime_seconds', 'Seconds since the launcher process started',
+    function=lambda: time.time() - PROCESS_START_TIME
+)
+metrics.gauge(
+    'launcher_log_records_dropped', 'Log records dropped because the logging queue was full',
+    function=lambda: logger.dropped_records
+)
+metrics.gauge(
+    'launcher_audit_records_overflowed', 'Audit records written synchronously because the logging queue stayed full',
+    function=lambda: logger.overflowed_records
+)
+requests_shed_total = metrics.counter(
+    'launcher_requests_shed_total', 'API requests rejected by admission control, by reason',
+    ('reason',)
+)
+requests_queued_total = metrics.counter(
+    'launcher_requests_queued_total', 'API requests that waited for an in-flight slot'
+)
+requests_in_flight = metrics.gauge(
+    'launcher_requests_in_flight', 'API requests currently holding an in-flight slot'
+)
+requests_queue_depth = metrics.gauge(
+    'launcher_requests_queue_depth', 'API requests waiting for an in-flight slot'
+)
+admission_wait_seconds = metrics.histogram(
+    'launcher_admission_wait_seconds', 'Time queued requests waited for an in-flight slot'
+)
+operations_abandoned_total = metrics.counter(
+    'launcher_operations_abandoned_total', 'Operations that timed out while their handler kept running',
+    ('operation',)
+)
+metrics.gauge(
+    'launcher_operations_abandoned', 'Timed-out operation handlers still holding a worker',
+    function=lambda: SecureCommandExecutor.abandoned_operations()
+)
+
+class ConnectionPool:
+    """Thread-safe pool of persistent SQLite connections in WAL mode"""
+    
+    def __init__(self, db_path: Path, size: int = 8, busy_timeout_ms: int = 5000,
+                 synchronous: str = "NORMAL", statement_cache_size: int = 128):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.synchronous = synchronous
+        self.statement_cache_size = statement_cache_size
+        
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=self.size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the pool's pragmas applied"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.statement_cache_size
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+    
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """Borrow a connection, opening a new one while below the pool size"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        
+        if can_create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No database connection available within {timeout}s")
+    
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, discarding any open transaction"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        
+        if self._closed:
+            self._discard(conn)
+            return
+        
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+    
+    def _discard(self, conn: sqlite3.Connection):
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Borrow a connection for the duration of a with-block"""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+    
+    def close(self):
+        """Close all idle connections and refuse further checkouts"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+class OperationLogWriter:
+    """Write-behind writer that batches operations_log rows on a background thread"""
+    
+    _STOP = object()
+    
+    def __init__(self, db: 'DatabaseManager', batch_size: int = 100, flush_interval: float = 0.5,
+                 max_queue: int = 10000, enqueue_timeout: float = 0.05):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="oplog-writer", daemon=True)
+        self._closed = False
+        self.sync_fallbacks = 0
+    
+    def start(self) -> 'OperationLogWriter':
+        self._thread.start()
+        return self
+    
+    def submit(self, record: Tuple):
+        """Queue a row; when the queue is full the caller writes it synchronously"""
+        if self._closed:
+            self.db.write_operations([record])
+            return
+        
+        try:
+            self._queue.put(record, timeout=self.enqueue_timeout)
+        except queue.Full:
+            # Backpressure: the producer pays for the disk write itself
+            self.sync_fallbacks += 1
+            self.db.write_operations([record])
+    
+    def flush(self):
+        """Block until every queued row has been written"""
+        self._queue.join()
+    
+    def close(self, timeout: float = 10.0):
+        """Flush pending rows and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+        
+        # Rows that raced with shutdown are written on the closing thread
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                leftovers.append(item)
+            self._queue.task_done()
+        if leftovers:
+            self.db.write_operations(leftovers)
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                self._queue.task_done()
+                return
+            
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            try:
+                self.db.write_operations(batch)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+            
+            if stopping:
+                return
+
+class DatabaseManager:
+    """Professional database management with proper error handling"""
+    
+    INSERT_OPERATION_SQL = (
+        "INSERT INTO operations_log (timestamp, operation, status, details, duration_ms) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    
+    # Rollup granularity and latency histogram upper bounds (ms); larger
+    # durations land in the overflow bucket stored as le_ms = -1.
+    ROLLUP_SECONDS = 60
+    LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+    
+    def __init__(self, db_path: Path, pool_size: Optional[int] = None, write_behind: bool = False):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.writer: Optional[OperationLogWriter] = None
+        self.pool = ConnectionPool(
+            db_path,
+            size=pool_size or config.DB_POOL_SIZE,
+            busy_timeout_ms=config.DB_BUSY_TIMEOUT_MS,
+            synchronous=config.DB_SYNCHRONOUS,
+            statement_cache_size=config.DB_STATEMENT_CACHE_SIZE
+        )
+        self.initialize_database()
+        
+        if write_behind:
+            self.writer = OperationLogWriter(
+                self,
+                batch_size=config.OPLOG_BATCH_SIZE,
+                flush_interval=config.OPLOG_FLUSH_INTERVAL_SECONDS,
+                max_queue=config.OPLOG_QUEUE_SIZE,
+                enqueue_timeout=config.OPLOG_ENQUEUE_TIMEOUT_SECONDS
+            ).start()
+    
+    def initialize_database(self):
+        """Initialize database schema"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Session table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS sessions (
+                        id TEXT PRIMARY KEY,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        expires_at TIMESTAMP NOT NULL,
+                        data TEXT
+                    )
+                """)
+                
+                # Operations log table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS operations_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        operation TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        details TEXT,
+                        duration_ms INTEGER
+                    )
+                """)
+                
+                # Configuration table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS config_store (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # Bumped by triggers on every config_store change, so other
+                # processes can detect writes with a single-row read
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS config_version (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        version INTEGER NOT NULL
+                    )
+                """)
+                cursor.execute("INSERT OR IGNORE INTO config_version (id, version) VALUES (1, 0)")
+                for event in ('INSERT', 'UPDATE', 'DELETE'):
+                    cursor.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS trg_config_store_{event.lower()}
+                        AFTER {event} ON config_store
+                        BEGIN
+                            UPDATE config_version SET version = version + 1 WHERE id = 1;
+                        END
+                    """)
+                
+                # Analytics indexes and rollups
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_sessions_expires_at
+                    ON sessions (expires_at)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_operations_log_operation_timestamp
+                    ON operations_log (operation, timestamp)
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS operations_rollup (
+                        operation TEXT NOT NULL,
+                        bucket_start INTEGER NOT NULL,
+                        count INTEGER NOT NULL DEFAULT 0,
+                        error_count INTEGER NOT NULL DEFAULT 0,
+                        total_ms INTEGER NOT NULL DEFAULT 0,
+                        max_ms INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (operation, bucket_start)
+                    ) WITHOUT ROWID
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_operations_rollup_bucket
+                    ON operations_rollup (bucket_start)
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS operations_latency_hist (
+                        operation TEXT NOT NULL,
+                        bucket_start INTEGER NOT NULL,
+                        le_ms INTEGER NOT NULL,
+                        count INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (operation, bucket_start, le_ms)
+                    ) WITHOUT ROWID
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_operations_latency_hist_bucket
+                    ON operations_latency_hist (bucket_start)
+                """)
+                conn.commit()
+                
+                self._install_rollup_trigger(conn)
+                logger.info("Database initialized successfully")
+        except Exception as e:
+            logger.error("Database initialization failed: %s", e)
+            raise
+    
+    def _bucket_sql(self, column: str) -> Tuple[str, str]:
+        """SQL expressions for a row's rollup bucket start and latency bucket"""
+        bucket_start = f"CAST(strftime('%s', {column}timestamp) AS INTEGER) / {self.ROLLUP_SECONDS} * {self.ROLLUP_SECONDS}"
+        cases = " ".join(
+            f"WHEN COALESCE({column}duration_ms, 0) <= {bound} THEN {bound}"
+            for bound in self.LATENCY_BUCKETS_MS
+        )
+        return bucket_start, f"CASE {cases} ELSE -1 END"
+    
+    def _install_rollup_trigger(self, conn: sqlite3.Connection):
+        """Maintain rollups on insert, backfilling rows written before the trigger existed"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_operations_log_rollup'"
+        ).fetchone()
+        if exists:
+            return
+        
+        new_bucket, new_le = self._bucket_sql("NEW.")
+        old_bucket, old_le = self._bucket_sql("")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_operations_log_rollup'"
+            ).fetchone():
+                conn.rollback()
+                return
+            
+            conn.execute(f"""
+                CREATE TRIGGER trg_operations_log_rollup AFTER INSERT ON operations_log
+                BEGIN
+                    INSERT INTO operations_rollup (operation, bucket_start, count, error_count, total_ms, max_ms)
+                    VALUES (NEW.operation, {new_bucket}, 1, NEW.status = 'error',
+                            COALESCE(NEW.duration_ms, 0), COALESCE(NEW.duration_ms, 0))
+                    ON CONFLICT (operation, bucket_start) DO UPDATE SET
+                        count = count + 1,
+                        error_count = error_count + excluded.error_count,
+                        total_ms = total_ms + excluded.total_ms,
+                        max_ms = MAX(max_ms, excluded.max_ms);
+                    INSERT INTO operations_latency_hist (operation, bucket_start, le_ms, count)
+                    VALUES (NEW.operation, {new_bucket}, {new_le}, 1)
+                    ON CONFLICT (operation, bucket_start, le_ms) DO UPDATE SET
+                        count = count + 1;
+                END
+            """)
+            conn.execute(f"""
+                INSERT INTO operations_rollup (operation, bucket_start, count, error_count, total_ms, max_ms)
+                SELECT operation, {old_bucket} AS bucket, COUNT(*), SUM(status = 'error'),
+                       SUM(COALESCE(duration_ms, 0)), MAX(COALESCE(duration_ms, 0))
+                FROM operations_log GROUP BY operation, bucket
+            """)
+            conn.execute(f"""
+                INSERT INTO operations_latency_hist (operation, bucket_start, le_ms, count)
+                SELECT operation, {old_bucket} AS bucket, {old_le} AS le, COUNT(*)
+                FROM operations_log GROUP BY operation, bucket, le
+            """)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    @contextmanager
+    def get_connection(self):
+        """Get a pooled database connection with proper cleanup"""
+        with self.pool.connection() as conn:
+            yield conn
+    
+    def log_operation(self, operation: str, status: str, details: str = "", duration_ms: int = 0):
+        """Log operation to database, deferred to the write-behind writer when enabled"""
+        record = (
+            time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime()),
+            operation, status, details, duration_ms
+        )
+        if self.writer is not None:
+            self.writer.submit(record)
+        else:
+            self.write_operations([record])
+    
+    def write_operations(self, records: List[Tuple]):
+        """Insert a batch of operations_log rows in a single transaction"""
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(self.INSERT_OPERATION_SQL, records)
+                conn.commit()
+        except Exception as e:
+            logger.error("Failed to log %s operation(s): %s", len(records), e)
+    
+    def flush(self):
+        """Wait for queued operations_log rows to reach the database"""
+        if self.writer is not None:
+            self.writer.flush()
+    
+    def close(self):
+        """Flush pending writes and release all pooled connections"""
+        if self.writer is not None:
+            self.writer.close()
+        self.pool.close()
+
+# Process-wide database manager shared by all interfaces
+_database: Optional[DatabaseManager] = None
+_database_lock = threading.Lock()
+
+def get_database() -> DatabaseManager:
+    """Return the shared write-behind DatabaseManager, creating it on first use"""
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = DatabaseManager(config.DATABASE_FILE, write_behind=True)
+    return _database
+
+def shutdown_database():
+    """Flush queued operation records and close the shared DatabaseManager"""
+    global _database
+    with _database_lock:
+        if _database is not None:
+            _database.close()
+            _database = None
+
+class SessionStore:
+    """Server-side sessions: a bounded LRU in front of the sessions table
+    
+    Writes go straight through to SQLite, so every worker process sees them;
+    cached entries are trusted for `cache_ttl_seconds` before being re-read.
+    Expired rows are deleted by a background sweeper in bounded batches.
+    """
+    
+    def __init__(self, db: DatabaseManager, timeout_minutes: int = 30, capacity: int = 1024,
+                 cache_ttl_seconds: float = 2.0, refresh_seconds: float = 60.0,
+                 sweep_interval_seconds: float = 60.0, sweep_batch: int = 500):
+        self.db = db
+        self.timeout_seconds = timeout_minutes * 60
+        self.capacity = capacity
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.refresh_seconds = refresh_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.sweep_batch = sweep_batch
+        
+        # sid -> (data, expires_at epoch, cached_at monotonic), least recently used first
+        self._cache: 'OrderedDict[str, Tuple[Dict, float, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @staticmethod
+    def _timestamp(epoch: float) -> str:
+        # Same UTC text format as operations_log, so expiry compares as strings
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(epoch))
+    
+    def start(self) -> 'SessionStore':
+        self._thread = threading.Thread(target=self._run, name="session-sweeper", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5)
+    
+    def _run(self):
+        while not self._stop.wait(self.sweep_interval_seconds):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error("Session sweep failed: %s", e)
+    
+    def new_id(self) -> str:
+        return secrets.token_urlsafe(32)
+    
+    def get(self, sid: str) -> Optional[Dict]:
+        """Return a copy of a live session's data, or None if unknown or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(sid)
+            if entry is not None:
+                data, expires_at, cached_at = entry
+                if expires_at <= now:
+                    del self._cache[sid]
+                    return None
+                if time.monotonic() - cached_at < self.cache_ttl_seconds:
+                    self._cache.move_to_end(sid)
+                    return dict(data)
+        
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT data, expires_at FROM sessions WHERE id = ? AND expires_at > ?",
+                (sid, self._timestamp(now))
+            ).fetchone()
+        if row is None:
+            with self._lock:
+                self._cache.pop(sid, None)
+            return None
+        
+        data = json_loads(row[0]) if row[0] else {}
+        expires_at = datetime.strptime(row[1], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+        self._remember(sid, data, expires_at)
+        return dict(data)
+    
+    def save(self, sid: str, data: Dict) -> float:
+        """Write a session through to the database; return its new expiry time"""
+        expires_at = time.time() + self.timeout_seconds
+        with self.db.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO sessions (id, expires_at, data) VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET expires_at = excluded.expires_at, data = excluded.data
+                """,
+                (sid, self._timestamp(expires_at), json_dumps(data))
+            )
+            conn.commit()
+        self._remember(sid, dict(data), expires_at)
+        return expires_at
+    
+    def delete(self, sid: str):
+        with self._lock:
+            self._cache.pop(sid, None)
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (sid,))
+            conn.commit()
+    
+    def expires_at(self, sid: str) -> Optional[float]:
+        with self._lock:
+            entry = self._cache.get(sid)
+        return entry[1] if entry is not None else None
+    
+    def needs_refresh(self, sid: str) -> bool:
+        """True once a session's sliding expiry is worth extending in the database"""
+        expires_at = self.expires_at(sid)
+        if expires_at is None:
+            return True
+        return time.time() + self.timeout_seconds - expires_at >= self.refresh_seconds
+    
+    def _remember(self, sid: str, data: Dict, expires_at: float):
+        with self._lock:
+            self._cache[sid] = (data, expires_at, time.monotonic())
+            self._cache.move_to_end(sid)
+            while len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+    
+    def sweep(self) -> int:
+        """Delete expired sessions in batches; return how many rows were removed"""
+        now = time.time()
+        with self._lock:
+            for sid in [sid for sid, entry in self._cache.items() if entry[1] <= now]:
+                del self._cache[sid]
+        
+        removed = 0
+        cutoff = self._timestamp(now)
+        while not self._stop.is_set():
+            # Short transactions keep the write lock free for request threads
+            with self.db.get_connection() as conn:
+                deleted = conn.execute(
+                    """
+                    DELETE FROM sessions WHERE id IN (
+                        SELECT id FROM sessions WHERE expires_at <= ? LIMIT ?
+                    )
+                    """,
+                    (cutoff, self.sweep_batch)
+                ).rowcount
+                conn.commit()
+            removed += deleted
+            if deleted < self.sweep_batch:
+                break
+        
+        if removed:
+            logger.info("Swept %s expired session(s)", removed)
+        return removed
+
+_session_store: Optional[SessionStore] = None
+_session_store_lock = threading.Lock()
+
+def get_session_store() -> SessionStore:
+    """Return the process-wide session store, starting its sweeper on first use"""
+    global _session_store
+    if _session_store is None:
+        with _session_store_lock:
+            if _session_store is None:
+                _session_store = SessionStore(
+                    get_database(),
+                    timeout_minutes=config.SESSION_TIMEOUT_MINUTES,
+                    capacity=config.SESSION_CACHE_SIZE,
+                    cache_ttl_seconds=config.SESSION_CACHE_TTL_SECONDS,
+                    refresh_seconds=config.SESSION_REFRESH_SECONDS,
+                    sweep_interval_seconds=config.SESSION_SWEEP_INTERVAL_SECONDS,
+                    sweep_batch=config.SESSION_SWEEP_BATCH
+                ).start()
+    return _session_store
+
+def shutdown_session_store():
+    """Stop the session sweeper if it was started"""
+    global _session_store
+    with _session_store_lock:
+        if _session_store is not None:
+            _session_store.stop()
+            _session_store = None
+
+class ConfigStore:
+    """Key-value settings in config_store, served from an in-process snapshot
+    
+    Reads are a lookup in an immutable dict that is swapped whole on reload.
+    A watcher thread compares the config_version row every
+    `watch_interval_seconds` and reloads when another process wrote, so
+    readers never touch the database. Values are stored as JSON.
+    """
+    
+    def __init__(self, db: DatabaseManager, watch_interval_seconds: float = 1.0):
+        self.db = db
+        self.watch_interval_seconds = watch_interval_seconds
+        self._values: Dict[str, Any] = {}
+        self._version = -1
+        self._listeners: List[Callable[[int], None]] = []
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reload()
+    
+    @property
+    def version(self) -> int:
+        return self._version
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+    
+    def all(self) -> Dict[str, Any]:
+        return dict(self._values)
+    
+    def set(self, key: str, value: Any):
+        """Store a JSON-serialisable value; visible locally on return"""
+        with self.db.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO config_store (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                """,
+                (key, json_dumps(value))
+            )
+            conn.commit()
+        self.reload()
+    
+    def delete(self, key: str):
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM config_store WHERE key = ?", (key,))
+            conn.commit()
+        self.reload()
+    
+    def subscribe(self, listener: Callable[[int], None]):
+        """Call `listener(version)` after every reload that saw a new version"""
+        self._listeners.append(listener)
+    
+    def reload(self, force: bool = False) -> bool:
+        """Re-read all values if the stored version moved; return True when it did"""
+        with self._reload_lock:
+            with self.db.get_connection() as conn:
+                # Version and values from one snapshot
+                conn.execute("BEGIN")
+                version = conn.execute("SELECT version FROM config_version WHERE id = 1").fetchone()[0]
+                if version == self._version and not force:
+                    return False
+                values = {}
+                for row in conn.execute("SELECT key, value FROM config_store"):
+                    try:
+                        values[row['key']] = json_loads(row['value'])
+                    except ValueError:
+                        values[row['key']] = row['value']
+            
+            self._values = values
+            self._version = version
+        
+        for listener in list(self._listeners):
+            try:
+                listener(version)
+            except Exception as e:
+                logger.error("Config listener failed: %s", e)
+        return True
+    
+    def start(self) -> 'ConfigStore':
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.watch_interval_seconds + 1)
+    
+    def _run(self):
+        while not self._stop.wait(self.watch_interval_seconds):
+            try:
+                if self.reload():
+                    logger.info("Config store reloaded at version %s", self._version)
+            except Exception as e:
+                logger.error("Config reload failed: %s", e)
+
+_config_store: Optional[ConfigStore] = None
+_config_store_lock = threading.Lock()
+
+def get_config_store() -> ConfigStore:
+    """Return the process-wide config store, starting its watcher on first use"""
+    global _config_store
+    if _config_store is None:
+        with _config_store_lock:
+            if _config_store is None:
+                _config_store = ConfigStore(
+                    get_database(), watch_interval_seconds=config.CONFIG_WATCH_INTERVAL_SECONDS
+                ).start()
+    return _config_store
+
+def shutdown_config_store():
+    """Stop the config watcher if it was started"""
+    global _config_store
+    with _config_store_lock:
+        if _config_store is not None:
+            _config_store.stop()
+            _config_store = None
+
+class OperationAnalytics:
+    """Latency percentile, error rate and throughput queries over the operations rollups"""
+    
+    MAX_WINDOW_SECONDS = 30 * 24 * 3600
     
-    def __init__(self, name: str, log_dir: str = "/tmp/cursor_launcher"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+    
+    @staticmethod
+    def _percentile(histogram: Dict[int, int], total: int, pct: float, max_ms: int) -> float:
+        """Estimate a percentile by linear interpolation inside its histogram bucket"""
+        if total == 0:
+            return 0.0
+        rank = pct / 100 * total
+        seen = 0
+        lower = 0
+        for bound in DatabaseManager.LATENCY_BUCKETS_MS + (-1,):
+            count = histogram.get(bound, 0)
+            upper = max_ms if bound == -1 else min(bound, max_ms)
+            if count and seen + count >= rank:
+                fraction = (rank - seen) / count
+                return round(lower + (max(upper, lower) - lower) * fraction, 2)
+            seen += count
+            if bound != -1:
+                lower = bound
+        return float(max_ms)
+    
+    def _summarise(self, start: int, width: int, row: Dict) -> Dict:
+        count = row['count']
+        return {
+            'start': utc_isoformat(start),
+            'count': count,
+            'errors': row['errors'],
+            'error_rate': round(row['errors'] / count, 4) if count else 0.0,
+            'throughput_per_sec': round(count / width, 4),
+            'avg_ms': round(row['total_ms'] / count, 2) if count else 0.0,
+            'p50_ms': self._percentile(row['hist'], count, 50, row['max_ms']),
+            'p95_ms': self._percentile(row['hist'], count, 95, row['max_ms']),
+            'p99_ms': self._percentile(row['hist'], count, 99, row['max_ms']),
+            'max_ms': row['max_ms']
+        }
+    
+    def stats(self, window_seconds: int = 3600, bucket_seconds: int = 300,
+              operation: Optional[str] = None) -> Dict:
+        """Per-operation stats over the last window, grouped into time buckets"""
+        step = DatabaseManager.ROLLUP_SECONDS
+        window_seconds = max(step, min(int(window_seconds), self.MAX_WINDOW_SECONDS))
+        bucket_seconds = max(step, int(bucket_seconds) // step * step)
+        now = int(time.time())
+        since = (now - window_seconds) // step * step
         
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
-        self.logger.handlers.clear()
+        where = "bucket_start >= ?"
+        params: List[Any] = [since]
+        if operation:
+            where = "operation = ? AND " + where
+            params.insert(0, operation)
         
-        # Create formatters
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
-        )
+        def empty() -> Dict:
+            return {'count': 0, 'errors': 0, 'total_ms': 0, 'max_ms': 0, 'hist': {}}
         
-        # File handlers
-        info_handler = logging.FileHandler(self.log_dir / 'launcher.log')
-        info_handler.setLevel(logging.INFO)
-        info_handler.setFormatter(detailed_formatter)
+        buckets: Dict[str, Dict[int, Dict]] = {}
+        totals: Dict[str, Dict] = {}
+        with self.db.get_connection() as conn:
+            # One read transaction so both tables come from the same snapshot
+            conn.execute("BEGIN")
+            for r in conn.execute(
+                f"SELECT operation, bucket_start, count, error_count, total_ms, max_ms "
+                f"FROM operations_rollup WHERE {where}", params
+            ):
+                start = r['bucket_start'] // bucket_seconds * bucket_seconds
+                for row in (buckets.setdefault(r['operation'], {}).setdefault(start, empty()),
+                            totals.setdefault(r['operation'], empty())):
+                    row['count'] += r['count']
+                    row['errors'] += r['error_count']
+                    row['total_ms'] += r['total_ms']
+                    row['max_ms'] = max(row['max_ms'], r['max_ms'])
+            
+            for r in conn.execute(
+                f"SELECT operation, bucket_start, le_ms, count "
+                f"FROM operations_latency_hist WHERE {where}", params
+            ):
+                start = r['bucket_start'] // bucket_seconds * bucket_seconds
+                for row in (buckets[r['operation']][start], totals[r['operation']]):
+                    row['hist'][r['le_ms']] = row['hist'].get(r['le_ms'], 0) + r['count']
+        
+        operations = {}
+        for name in sorted(buckets):
+            summary = self._summarise(since, now - since, totals[name])
+            summary.pop('start')
+            operations[name] = {
+                'summary': summary,
+                'buckets': [
+                    self._summarise(start, bucket_seconds, buckets[name][start])
+                    for start in sorted(buckets[name])
+                ]
+            }
         
-        error_handler = logging.FileHandler(self.log_dir / 'error.log')
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(detailed_formatter)
+        return {
+            'generated_at': utc_isoformat(),
+            'window_seconds': window_seconds,
+            'bucket_seconds': bucket_seconds,
+            'operations': operations
+        }
+
+class HealthCheckService:
+    """Health checks refreshed on a background schedule and served from the last snapshot
+    
+    Each check returns a status string ('healthy', 'warning: ...' or
+    'error: ...'). Checks run on a small pool with a per-check timeout, so a
+    hung check is reported as timed out instead of delaying the snapshot.
+    """
+    
+    def __init__(self, interval_seconds: float = 15.0, check_timeout_seconds: float = 2.0):
+        self.interval_seconds = interval_seconds
+        self.check_timeout_seconds = check_timeout_seconds
         
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(detailed_formatter)
+        self._checks: Dict[str, Callable[[], str]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-check")
+        self._refresh_lock = threading.Lock()
+        self._snapshot: Optional[Tuple[float, Dict]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def register(self, name: str, check: Callable[[], str]):
+        """Add a named check to every subsequent refresh"""
+        self._checks[name] = check
+    
+    def start(self) -> 'HealthCheckService':
+        self._thread = threading.Thread(target=self._run, name="health-refresher", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.check_timeout_seconds + 1)
+        self._pool.shutdown(wait=False)
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error("Health refresh failed: %s", e)
+            self._stop.wait(self.interval_seconds)
+    
+    def refresh(self) -> Dict:
+        """Run every check now and replace the cached snapshot"""
+        with self._refresh_lock:
+            futures = {}
+            for name, check in self._checks.items():
+                # A check still running from an earlier refresh is awaited, not re-submitted
+                pending = self._pending.get(name)
+                if pending is None or pending.done():
+                    pending = self._pool.submit(check)
+                    self._pending[name] = pending
+                futures[name] = pending
+            
+            deadline = time.monotonic() + self.check_timeout_seconds
+            checks = {}
+            for name, future in futures.items():
+                try:
+                    checks[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeout:
+                    checks[name] = f'error: timed out after {self.check_timeout_seconds}s'
+                except Exception as e:
+                    checks[name] = f'error: {e}'
+            
+            overall = 'healthy'
+            for status in checks.values():
+                if status.startswith('error'):
+                    overall = 'unhealthy'
+                    break
+                if status.startswith('warning'):
+                    overall = 'warning'
+            
+            checked_at = time.time()
+            snapshot = {
+                'overall': overall,
+                'checks': checks,
+                'checked_at': utc_isoformat(checked_at)
+            }
+            self._snapshot = (checked_at, snapshot)
+            return snapshot
+    
+    def snapshot(self) -> Dict:
+        """Return the most recent snapshot with its age in seconds"""
+        current = self._snapshot
+        if current is None:
+            self.refresh()
+            current = self._snapshot
+        checked_at, snapshot = current
+        return dict(snapshot, age_seconds=round(time.time() - checked_at, 3))
+
+def _check_bundle_directory() -> str:
+    if config.BUNDLE_DIR.exists():
+        return 'healthy'
+    return 'warning: directory not found'
+
+def _check_database() -> str:
+    with get_database().get_connection() as conn:
+        conn.execute("SELECT 1")
+    return 'healthy'
+
+_health_service: Optional[HealthCheckService] = None
+_health_service_lock = threading.Lock()
+
+def get_health_service() -> HealthCheckService:
+    """Return the process-wide health service, starting its refresher on first use"""
+    global _health_service
+    if _health_service is None:
+        with _health_service_lock:
+            if _health_service is None:
+                service = HealthCheckService(
+                    interval_seconds=config.HEALTH_CHECK_INTERVAL_SECONDS,
+                    check_timeout_seconds=config.HEALTH_CHECK_TIMEOUT_SECONDS
+                )
+                service.register('bundle_directory', _check_bundle_directory)
+                service.register('database', _check_database)
+                _health_service = service.start()
+    return _health_service
+
+def shutdown_health_service():
+    """Stop the background health refresher if it was started"""
+    global _health_service
+    with _health_service_lock:
+        if _health_service is not None:
+            _health_service.stop()
+            _health_service = None
+
+class ResourceSampler:
+    """Background psutil sampler writing host and launcher resources into ring buffers
+    
+    Every field is a fixed-size array('d'), so memory stays constant and
+    readers never call psutil themselves.
+    """
+    
+    FIELDS = ('timestamp', 'cpu_percent', 'memory_percent', 'disk_percent', 'process_rss_bytes')
+    
+    def __init__(self, interval_seconds: float = 5.0, capacity: int = 720):
+        self.interval_seconds = interval_seconds
+        self.capacity = max(1, capacity)
+        self.available = False
         
-        # Add handlers
-        self.logger.addHandler(info_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(console_handler)
+        self._buffers = {name: array('d', bytes(8 * self.capacity)) for name in self.FIELDS}
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._psutil = None
+        self._process = None
+    
+    def start(self) -> 'ResourceSampler':
+        try:
+            import psutil
+        except ImportError:
+            logger.warning("psutil not installed; resource sampling disabled")
+            return self
         
-        # Audit logger
-        self.audit_logger = logging.getLogger(f"{name}.audit")
-        audit_handler = logging.FileHandler(self.log_dir / 'audit.log')
-        audit_formatter = logging.Formatter(
-            '%(asctime)s - AUDIT - %(message)s'
+        self._psutil = psutil
+        self._process = psutil.Process()
+        # Prime the CPU counters; the first cpu_percent(None) call always returns 0.0
+        psutil.cpu_percent(interval=None)
+        self.available = True
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.interval_seconds + 1)
+    
+    def _run(self):
+        delay = min(1.0, self.interval_seconds)
+        while not self._stop.wait(delay):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning("Resource sample failed: %s", e)
+            delay = self.interval_seconds
+    
+    def sample(self):
+        """Take one sample and append it to the ring buffers"""
+        psutil = self._psutil
+        values = (
+            time.time(),
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            psutil.disk_usage('/').percent,
+            float(self._process.memory_info().rss)
         )
-        audit_handler.setFormatter(audit_formatter)
-        self.audit_logger.addHandler(audit_handler)
+        with self._lock:
+            for name, value in zip(self.FIELDS, values):
+                self._buffers[name][self._next] = value
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
     
-    def debug(self, msg: str): self.logger.debug(msg)
-    def info(self, msg: str): self.logger.info(msg)
-    def warning(self, msg: str): self.logger.warning(msg)
-    def error(self, msg: str): self.logger.error(msg)
-    def critical(self, msg: str): self.logger.critical(msg)
+    def latest(self) -> Optional[Dict[str, float]]:
+        """Most recent sample, or None before the first one"""
+        with self._lock:
+            if self._count == 0:
+                return None
+            index = (self._next - 1) % self.capacity
+            return {name: self._buffers[name][index] for name in self.FIELDS}
     
-    def audit(self, action: str, details: str = ""):
-        """Log audit events"""
-        audit_msg = f"ACTION:{action} | DETAILS:{details}"
-        self.audit_logger.info(audit_msg)
+    def series(self, since: Optional[float] = None, limit: Optional[int] = None) -> Dict[str, List[float]]:
+        """Samples oldest first as one list per field, optionally newer than `since`"""
+        with self._lock:
+            start = (self._next - self._count) % self.capacity
+            order = [(start + i) % self.capacity for i in range(self._count)]
+            columns = {name: [self._buffers[name][i] for i in order] for name in self.FIELDS}
+        
+        keep = len(columns['timestamp'])
+        if since is not None:
+            keep = sum(1 for ts in columns['timestamp'] if ts > since)
+        if limit is not None:
+            keep = min(keep, max(0, limit))
+        return {name: values[len(values) - keep:] for name, values in columns.items()}
 
-# Global logger
-logger = ProfessionalLogger(__name__)
+_resource_sampler: Optional[ResourceSampler] = None
+_resource_sampler_lock = threading.Lock()
+
+def get_resource_sampler() -> ResourceSampler:
+    """Return the process-wide resource sampler, starting it on first use"""
+    global _resource_sampler
+    if _resource_sampler is None:
+        with _resource_sampler_lock:
+            if _resource_sampler is None:
+                _resource_sampler = ResourceSampler(
+                    interval_seconds=config.RESOURCE_SAMPLE_INTERVAL_SECONDS,
+                    capacity=config.RESOURCE_SAMPLE_CAPACITY
+                ).start()
+    return _resource_sampler
+
+def shutdown_resource_sampler():
+    """Stop the background resource sampler if it was started"""
+    global _resource_sampler
+    with _resource_sampler_lock:
+        if _resource_sampler is not None:
+            _resource_sampler.stop()
+            _resource_sampler = None
 
 @dataclass
-class LauncherConfig:
-    """Professional launcher configuration"""
-    VERSION: str = "2.0.0"
-    APP_NAME: str = "Cursor Bundle Launcher Pro"
+class ManagedInstance:
+    """One process started by the ProcessSupervisor"""
+    popen: subprocess.Popen
+    argv: List[str]
+    cwd: str
+    started_at: float = field(default_factory=time.time)
+    ended_at: Optional[float] = None
+    exited: threading.Event = field(default_factory=threading.Event)
+    # (cpu seconds, monotonic time) at the last stats read, for CPU percent
+    last_cpu: Optional[Tuple[float, float]] = None
     
-    # Security settings
-    SECRET_KEY: str = secrets.token_hex(32)
-    SESSION_TIMEOUT_MINUTES: int = 30
-    MAX_COMMAND_LENGTH: int = 500
+    @property
+    def pid(self) -> int:
+        return self.popen.pid
+
+class ProcessSupervisor:
+    """Tracks launched processes, reaps them as they exit and stops them on request
     
-    # File settings
-    BUNDLE_DIR: Path = Path(__file__).parent.absolute()
-    LOG_DIR: Path = Path("/tmp/cursor_launcher")
-    DATABASE_FILE: Path = Path("/tmp/cursor_launcher/launcher.db")
+    Each child runs in its own session so stop() can signal its whole
+    process group. A reaper thread waits on pidfds where the kernel supports
+    them and otherwise polls every `poll_interval` seconds; either way exits
+    are collected without blocking callers and no zombies are left behind.
+    """
     
-    # GUI settings
-    WINDOW_WIDTH: int = 800
-    WINDOW_HEIGHT: int = 600
-    THEME: str = "default"
+    CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
     
-    # Allowed operations for security
-    ALLOWED_OPERATIONS: List[str] = None
+    def __init__(self, stop_timeout: float = 10.0, poll_interval: float = 0.5):
+        self.stop_timeout = stop_timeout
+        self.poll_interval = poll_interval
+        self._instances: Dict[int, ManagedInstance] = {}
+        self.recent_exits: deque = deque(maxlen=20)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._use_pidfd = hasattr(os, 'pidfd_open') and hasattr(select, 'poll')
+        self._pidfds: Dict[int, int] = {}
+        self._poller = select.poll() if self._use_pidfd else None
+        self._wake_r, self._wake_w = os.pipe() if self._use_pidfd else (None, None)
+        if self._poller is not None:
+            self._poller.register(self._wake_r, select.POLLIN)
+        self._thread = threading.Thread(target=self._run, name="process-reaper", daemon=True)
     
-    def __post_init__(self):
-        if self.ALLOWED_OPERATIONS is None:
-            self.ALLOWED_OPERATIONS = [
-                'status', 'version', 'check', 'info', 'help', 'launch',
-                'stop', 'restart', 'health', 'logs', 'config'
-            ]
+    def start(self) -> 'ProcessSupervisor':
+        self._thread.start()
+        return self
+    
+    def close(self):
+        """Stop reaping; running instances are left alive and reparented on exit"""
+        self._stop.set()
+        self._wake()
+        self._thread.join(self.poll_interval + 1)
+        if self._wake_r is not None:
+            for fd in [self._wake_r, self._wake_w, *self._pidfds]:
+                os.close(fd)
+            self._pidfds.clear()
+    
+    def _wake(self):
+        if self._wake_w is not None:
+            os.write(self._wake_w, b'x')
+    
+    def launch(self, argv: List[str], cwd: str) -> ManagedInstance:
+        popen = subprocess.Popen(argv, cwd=cwd, start_new_session=True,
+                                 stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+        instance = ManagedInstance(popen=popen, argv=list(argv), cwd=cwd)
+        with self._lock:
+            self._instances[popen.pid] = instance
+            if self._use_pidfd:
+                try:
+                    fd = os.pidfd_open(popen.pid)
+                except OSError:
+                    # Kernel without pidfd support: fall back to polling for good
+                    self._use_pidfd = False
+                else:
+                    self._pidfds[fd] = popen.pid
+                    self._poller.register(fd, select.POLLIN)
+        self._wake()
+        logger.info("Launched %s as pid %s", argv[0], popen.pid)
+        return instance
+    
+    def instances(self) -> List[ManagedInstance]:
+        with self._lock:
+            return list(self._instances.values())
+    
+    def _run(self):
+        while not self._stop.is_set():
+            if self._use_pidfd:
+                for fd, _event in self._poller.poll(self.poll_interval * 1000):
+                    if fd == self._wake_r:
+                        os.read(self._wake_r, 4096)
+                    else:
+                        self._reap_pidfd(fd)
+            else:
+                self._stop.wait(self.poll_interval)
+                for instance in self.instances():
+                    self._reap(instance)
+    
+    def _reap_pidfd(self, fd: int):
+        with self._lock:
+            pid = self._pidfds.pop(fd, None)
+            self._poller.unregister(fd)
+        os.close(fd)
+        instance = self._instances.get(pid)
+        if instance is not None:
+            self._reap(instance)
+    
+    def _reap(self, instance: ManagedInstance):
+        returncode = instance.popen.poll()
+        if returncode is None:
+            return
+        with self._lock:
+            if self._instances.pop(instance.pid, None) is None:
+                return
+        instance.ended_at = time.time()
+        self.recent_exits.append(instance)
+        instance.exited.set()
+        logger.info("Instance %s exited with status %s", instance.pid, returncode)
+    
+    def stop(self, pid: Optional[int] = None, timeout: Optional[float] = None) -> List[Dict]:
+        """SIGTERM the selected instances, SIGKILL whatever outlives `timeout`"""
+        targets = self.instances() if pid is None else [i for i in self.instances() if i.pid == pid]
+        timeout = self.stop_timeout if timeout is None else timeout
         
-        # Create directories
-        self.LOG_DIR.mkdir(exist_ok=True)
-        self.DATABASE_FILE.parent.mkdir(exist_ok=True)
+        for instance in targets:
+            self._signal(instance, signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        forced = set()
+        for instance in targets:
+            if not instance.exited.wait(max(0.0, deadline - time.monotonic())):
+                forced.add(instance.pid)
+                self._signal(instance, signal.SIGKILL)
+        for instance in targets:
+            # A killed process still has to be reaped before it is reported
+            if not instance.exited.wait(self.poll_interval + 2):
+                self._reap(instance)
+        
+        return [{'pid': i.pid, 'returncode': i.popen.returncode, 'forced': i.pid in forced}
+                for i in targets]
+    
+    @staticmethod
+    def _signal(instance: ManagedInstance, signum: int):
+        try:
+            os.killpg(instance.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            # Group already gone, or the leader left it; signal the process itself
+            try:
+                instance.popen.send_signal(signum)
+            except ProcessLookupError:
+                pass
+    
+    def stats(self, instance: ManagedInstance) -> Dict:
+        """Uptime, CPU and RSS of one instance read from /proc/<pid>/stat"""
+        uptime = (instance.ended_at or time.time()) - instance.started_at
+        result = {'pid': instance.pid, 'command': instance.argv[0], 'uptime_seconds': round(uptime, 1),
+                  'cpu_seconds': None, 'cpu_percent': None, 'rss_bytes': None}
+        try:
+            with open(f"/proc/{instance.pid}/stat", 'rb') as f:
+                data = f.read()
+        except OSError:
+            return result
+        # The command name may contain spaces; the fields after it do not
+        fields = data[data.rindex(b')') + 2:].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / self.CLOCK_TICKS
+        now = time.monotonic()
+        previous = instance.last_cpu or (0.0, now - max(uptime, 1e-6))
+        instance.last_cpu = (cpu_seconds, now)
+        elapsed = now - previous[1]
+        
+        result['cpu_seconds'] = round(cpu_seconds, 2)
+        result['cpu_percent'] = round((cpu_seconds - previous[0]) / elapsed * 100, 1) if elapsed > 0 else 0.0
+        result['rss_bytes'] = int(fields[21]) * self.PAGE_SIZE
+        return result
 
-# Global configuration
-config = LauncherConfig()
+_process_supervisor: Optional[ProcessSupervisor] = None
+_process_supervisor_lock = threading.Lock()
 
-class DatabaseManager:
-    """Professional database management with proper error handling"""
+def get_process_supervisor() -> ProcessSupervisor:
+    """Return the process-wide supervisor, starting its reaper on first use"""
+    global _process_supervisor
+    if _process_supervisor is None:
+        with _process_supervisor_lock:
+            if _process_supervisor is None:
+                _process_supervisor = ProcessSupervisor(
+                    stop_timeout=config.PROCESS_STOP_TIMEOUT_SECONDS,
+                    poll_interval=config.PROCESS_POLL_INTERVAL_SECONDS
+                ).start()
+    return _process_supervisor
+
+def shutdown_process_supervisor():
+    """Stop the reaper thread if it was started; launched instances keep running"""
+    global _process_supervisor
+    with _process_supervisor_lock:
+        if _process_supervisor is not None:
+            _process_supervisor.close()
+            _process_supervisor = None
+
+@dataclass(frozen=True)
+class BundleExecutable:
+    """One launchable Cursor build found in the bundle directory"""
+    path: Path
+    version: Optional[str]
+    kind: str
     
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self.initialize_database()
+    @property
+    def version_key(self) -> Tuple[int, ...]:
+        return tuple(int(part) for part in re.findall(r'\d+', self.version or ''))
+
+class BundleInventory:
+    """Index of the Cursor executables and AppImages under the bundle directory
     
-    def initialize_database(self):
-        """Initialize database schema"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Session table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS sessions (
-                        id TEXT PRIMARY KEY,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        expires_at TIMESTAMP NOT NULL,
-                        data TEXT
-                    )
-                """)
-                
-                # Operations log table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS operations_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        operation TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        details TEXT,
-                        duration_ms INTEGER
-                    )
-                """)
-                
-                # Configuration table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS config_store (
-                        key TEXT PRIMARY KEY,
-                        value TEXT NOT NULL,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                conn.commit()
-                logger.info("Database initialized successfully")
-        except Exception as e:
-            logger.error(f"Database initialization failed: {e}")
-            raise
+    The tree is scanned once, `depth` levels deep, and the index is reused
+    until the mtime of one of the scanned directories changes. That check is
+    a handful of stat() calls and runs at most every `check_interval` seconds,
+    so lookups are dictionary hits.
+    """
     
-    @contextmanager
-    def get_connection(self):
-        """Get database connection with proper cleanup"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+    # cursor, Cursor.exe, cursor-0.42.3-x86_64.AppImage, cursor_1.2.AppImage, ...
+    EXECUTABLE_RE = re.compile(
+        r'^cursor(?:[-_](?P<version>\d+(?:\.\d+)*)[\w.-]*?)?(?P<ext>\.appimage|\.exe)?$', re.IGNORECASE
+    )
+    # Names the launcher has always looked for, preferred when present
+    LEGACY_NAMES = ('cursor', 'cursor.exe', 'Cursor', 'Cursor.exe')
     
-    def log_operation(self, operation: str, status: str, details: str = "", duration_ms: int = 0):
-        """Log operation to database"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO operations_log (operation, status, details, duration_ms) VALUES (?, ?, ?, ?)",
-                    (operation, status, details, duration_ms)
+    def __init__(self, root: Path, depth: int = 2, check_interval: float = 1.0):
+        self.root = root
+        self.depth = depth
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._dir_mtimes: Dict[str, int] = {}
+        self._checked_at = 0.0
+        self._by_key: Dict[str, BundleExecutable] = {}
+        self._entries: List[BundleExecutable] = []
+        self._default: Optional[BundleExecutable] = None
+        self.scans = 0
+    
+    def _stale(self) -> bool:
+        if not self._dir_mtimes:
+            return True
+        for directory, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+    
+    def _refresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval and self._dir_mtimes:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval and self._dir_mtimes:
+                return
+            if self._stale():
+                self._scan()
+            self._checked_at = time.monotonic()
+    
+    def _scan(self):
+        dir_mtimes: Dict[str, int] = {}
+        entries: List[BundleExecutable] = []
+        pending = [(str(self.root), 0)]
+        while pending:
+            directory, level = pending.pop()
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as it:
+                    children = list(it)
+            except OSError:
+                continue
+            for entry in children:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if level + 1 < self.depth:
+                            pending.append((entry.path, level + 1))
+                        continue
+                    match = self.EXECUTABLE_RE.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                ext = (match.group('ext') or '').lower()
+                if ext != '.exe' and not os.access(entry.path, os.X_OK):
+                    continue
+                kind = {'.appimage': 'appimage', '.exe': 'exe'}.get(ext, 'binary')
+                entries.append(BundleExecutable(Path(entry.path), match.group('version'), kind))
+        
+        entries.sort(key=lambda e: (e.version_key, -len(e.path.parts), e.path.name), reverse=True)
+        by_key: Dict[str, BundleExecutable] = {}
+        for executable in entries:
+            by_key.setdefault(executable.path.name.lower(), executable)
+            if executable.version:
+                by_key.setdefault(executable.version, executable)
+        legacy = [self.root / name for name in self.LEGACY_NAMES]
+        default = next((e for path in legacy for e in entries if e.path == path), None)
+        
+        self._entries = entries
+        self._by_key = by_key
+        self._default = default or (entries[0] if entries else None)
+        self._dir_mtimes = dir_mtimes
+        self.scans += 1
+        logger.debug("Indexed %s executables under %s (%s directories)", len(entries), self.root, len(dir_mtimes))
+    
+    def find(self, key: Optional[str] = None) -> Optional[BundleExecutable]:
+        """Executable for a version or file name, or the default build when key is None"""
+        self._refresh()
+        if key is None:
+            return self._default
+        return self._by_key.get(key) or self._by_key.get(key.lower())
+    
+    def executables(self) -> List[BundleExecutable]:
+        """All indexed executables, newest version first"""
+        self._refresh()
+        return list(self._entries)
+    
+    def versions(self) -> List[str]:
+        return list(dict.fromkeys(e.version for e in self.executables() if e.version))
+
+_bundle_inventory: Optional[BundleInventory] = None
+_bundle_inventory_lock = threading.Lock()
+
+def get_bundle_inventory() -> BundleInventory:
+    """Return the process-wide inventory of the configured bundle directory"""
+    global _bundle_inventory
+    if _bundle_inventory is None or _bundle_inventory.root != config.BUNDLE_DIR:
+        with _bundle_inventory_lock:
+            if _bundle_inventory is None or _bundle_inventory.root != config.BUNDLE_DIR:
+                _bundle_inventory = BundleInventory(
+                    config.BUNDLE_DIR,
+                    depth=config.BUNDLE_SCAN_DEPTH,
+                    check_interval=config.BUNDLE_CHECK_INTERVAL_SECONDS
                 )
-                conn.commit()
-        except Exception as e:
-            logger.error(f"Failed to log operation: {e}")
+    return _bundle_inventory
+
+def shutdown_services():
+    """Stop background services and flush the shared database, in dependency order"""
+    shutdown_process_supervisor()
+    shutdown_resource_sampler()
+    shutdown_health_service()
+    shutdown_session_store()
+    shutdown_config_store()
+    shutdown_database()
 
 class SystemHealthMonitor:
     """Professional system health monitoring"""
     
     def __init__(self):
-        self.start_time = time.time()
-        self.operation_count = 0
-        self.error_count = 0
+        self.start_time = PROCESS_START_TIME
+    
+    @property
+    def operation_count(self) -> int:
+        return int(operations_total.total())
+    
+    @property
+    def error_count(self) -> int:
+        return int(operations_total.total(status='error'))
     
     def get_system_info(self) -> Dict:
-        """Get comprehensive system information"""
-        try:
-            import psutil
-            
-            return {
-                'platform': {
-                    'system': platform.system(),
-                    'release': platform.release(),
-                    'machine': platform.machine(),
-                    'python_version': platform.python_version()
-                },
-                'resources': {
-                    'cpu_percent': psutil.cpu_percent(),
-                    'memory_percent': psutil.virtual_memory().percent,
-                    'disk_percent': psutil.disk_usage('/').percent
-                },
-                'application': {
-                    'uptime': time.time() - self.start_time,
-                    'operations': self.operation_count,
-                    'errors': self.error_count,
-                    'bundle_dir': str(config.BUNDLE_DIR)
-                }
+        """Get comprehensive system information from the latest resource sample"""
+        import platform
+        info = {
+            'platform': {
+                'system': platform.system(),
+                'release': platform.release(),
+                'machine': platform.machine(),
+                'python_version': platform.python_version()
+            },
+            'application': {
+                'uptime': time.time() - self.start_time,
+                'operations': self.operation_count,
+                'errors': self.error_count,
+                'bundle_dir': str(config.BUNDLE_DIR)
             }
-        except ImportError:
-            return {
-                'platform': {
-                    'system': platform.system(),
-                    'release': platform.release(),
-                    'machine': platform.machine(),
-                    'python_version': platform.python_version()
-                },
-                'application': {
-                    'uptime': time.time() - self.start_time,
-                    'operations': self.operation_count,
-                    'errors': self.error_count,
-                    'bundle_dir': str(config.BUNDLE_DIR)
+        }
+        
+        inventory = get_bundle_inventory()
+        default = inventory.find()
+        info['bundle'] = {
+            'executables': len(inventory.executables()),
+            'versions': ", ".join(inventory.versions()) or "-",
+            'default': str(default.path) if default else "-"
+        }
+        
+        sampler = get_resource_sampler()
+        if sampler.available:
+            sample = sampler.latest()
+            if sample is None:
+                info['resources'] = {'status': 'collecting first sample'}
+            else:
+                info['resources'] = {
+                    'cpu_percent': sample['cpu_percent'],
+                    'memory_percent': sample['memory_percent'],
+                    'disk_percent': sample['disk_percent'],
+                    'launcher_rss_mb': round(sample['process_rss_bytes'] / (1024 * 1024), 1),
+                    'sampled_at': utc_isoformat(sample['timestamp'])
                 }
-            }
+        return info
     
     def perform_health_check(self) -> Dict:
-        """Perform comprehensive health check"""
-        health = {'overall': 'healthy', 'checks': {}}
-        
-        # Check bundle directory
-        try:
-            if config.BUNDLE_DIR.exists():
-                health['checks']['bundle_directory'] = 'healthy'
-            else:
-                health['checks']['bundle_directory'] = 'warning: directory not found'
-                health['overall'] = 'warning'
-        except Exception as e:
-            health['checks']['bundle_directory'] = f'error: {e}'
-            health['overall'] = 'unhealthy'
-        
-        # Check database
-        try:
-            db = DatabaseManager(config.DATABASE_FILE)
-            with db.get_connection() as conn:
-                conn.execute("SELECT 1")
-            health['checks']['database'] = 'healthy'
-        except Exception as e:
-            health['checks']['database'] = f'error: {e}'
-            health['overall'] = 'unhealthy'
-        
-        return health
+        """Return the latest background health snapshot"""
+        return get_health_service().snapshot()
+
+@dataclass
+class OperationSpec:
+    """Handler and execution metadata for one launcher operation
+    
+    `stream` optionally yields the output in chunks for streaming callers;
+    `handler` still produces the complete output for everyone else. Specs
+    with `accepts_args` receive the operation's arguments as a second
+    parameter and are never served from the result cache when given any.
+    """
+    name: str
+    handler: Callable[..., str]
+    description: str = ""
+    idempotent: bool = False
+    cache_ttl_seconds: float = 0.0
+    timeout_seconds: Optional[float] = None
+    stream: Optional[Callable[..., Iterable[str]]] = None
+    accepts_args: bool = False
+
+class OperationRegistry:
+    """Name-to-spec dispatch table plus the set of operations allowed to run"""
+    
+    def __init__(self, allowed: List[str]):
+        self._specs: Dict[str, OperationSpec] = {}
+        # dict rather than set to keep the configured order for messages
+        self._allowed: Dict[str, None] = dict.fromkeys(allowed)
+        self._lock = threading.Lock()
+        # Bumped on every registration so cached listings such as `help` expire
+        self.version = 0
+    
+    def register(self, spec: OperationSpec, allow: bool = True) -> OperationSpec:
+        with self._lock:
+            self._specs[spec.name] = spec
+            if allow:
+                self._allowed[spec.name] = None
+            self.version += 1
+        return spec
+    
+    def get(self, name: str) -> Optional[OperationSpec]:
+        return self._specs.get(name)
+    
+    def is_allowed(self, name: str) -> bool:
+        return name in self._allowed
+    
+    def allowed_names(self) -> List[str]:
+        return list(self._allowed)
     
-    def increment_operations(self):
-        self.operation_count += 1
+    def specs(self) -> List[OperationSpec]:
+        return list(self._specs.values())
+
+operation_registry = OperationRegistry(config.ALLOWED_OPERATIONS)
+
+# Operation arguments are `key=value` pairs or bare flags
+_OPERATION_ARG_RE = re.compile(r'^[A-Za-z_]+(=[\w.:/@+-]+)?$')
+
+def split_operation(operation: str) -> Tuple[str, List[str]]:
+    """Split an operation string into its normalised name and raw arguments"""
+    parts = str(operation).split()
+    if not parts:
+        return '', []
+    return parts[0].lower(), parts[1:]
+
+def register_operation(name: str, description: str = "", idempotent: bool = False,
+                       cache_ttl_seconds: float = 0.0, timeout_seconds: Optional[float] = None,
+                       allow: bool = True):
+    """Decorator registering a handler as a launcher operation
     
-    def increment_errors(self):
-        self.error_count += 1
+    The handler receives the SecureCommandExecutor and returns the output text.
+    """
+    def decorator(handler: Callable[['SecureCommandExecutor'], str]):
+        operation_registry.register(OperationSpec(
+            name=name.strip().lower(),
+            handler=handler,
+            description=description,
+            idempotent=idempotent,
+            cache_ttl_seconds=cache_ttl_seconds,
+            timeout_seconds=timeout_seconds
+        ), allow=allow)
+        return handler
+    return decorator
 
 class SecureCommandExecutor:
     """Professional secure command execution with validation"""
     
-    def __init__(self, db_manager: DatabaseManager):
+    # Shared by all executors; only used for operations declaring a timeout
+    _timeout_pool: Optional[ThreadPoolExecutor] = None
+    _timeout_pool_lock = threading.Lock()
+    
+    # Timed-out handlers still occupying a timeout pool worker
+    _abandoned: Set[Future] = set()
+    
+    # Shared by all executors for concurrent batch items
+    _batch_pool: Optional[ThreadPoolExecutor] = None
+    
+    def __init__(self, db_manager: DatabaseManager, registry: Optional[OperationRegistry] = None):
         self.db = db_manager
+        self.registry = registry or operation_registry
+        # name -> (expiry, (config store version, registry version), output)
+        self._result_cache: Dict[str, Tuple[float, Tuple[int, int], str]] = {}
     
     def validate_operation(self, operation: str) -> Tuple[bool, str]:
         """Validate operation for security"""
@@ -316,10 +2881,18 @@ class SecureCommandExecutor:
         if len(operation) > config.MAX_COMMAND_LENGTH:
             return False, f"Operation too long (max {config.MAX_COMMAND_LENGTH} chars)"
         
-        clean_operation = operation.strip().lower()
+        name, args = split_operation(operation)
+        
+        if not self.registry.is_allowed(name):
+            return False, f"Operation not allowed. Allowed: {', '.join(self.registry.allowed_names())}"
         
-        if clean_operation not in config.ALLOWED_OPERATIONS:
-            return False, f"Operation not allowed. Allowed: {', '.join(config.ALLOWED_OPERATIONS)}"
+        if args:
+            spec = self.registry.get(name)
+            if spec is None or not spec.accepts_args:
+                return False, f"Operation '{name}' takes no arguments"
+            for arg in args:
+                if not _OPERATION_ARG_RE.match(arg):
+                    return False, f"Invalid argument '{arg}'"
         
         return True, "Operation is valid"
     
@@ -329,58 +2902,213 @@ class SecureCommandExecutor:
         is_valid, message = self.validate_operation(operation)
         
         if not is_valid:
-            result = {'status': 'error', 'message': message, 'output': ''}
-            logger.audit(f"OPERATION_REJECTED:{operation}", message)
-            return result
+            return self._reject(operation, message, start_time)
         
+        operation_lower, args = split_operation(operation)
         try:
-            logger.audit(f"OPERATION_EXECUTED:{operation}")
+            logger.audit("OPERATION_EXECUTED", "", operation=operation)
             
             # Route to appropriate handler
-            operation_lower = operation.strip().lower()
+            spec = self.registry.get(operation_lower)
             
-            if operation_lower == 'status':
-                output = self._op_status()
-            elif operation_lower == 'version':
-                output = self._op_version()
-            elif operation_lower == 'check':
-                output = self._op_check()
-            elif operation_lower == 'info':
-                output = self._op_info()
-            elif operation_lower == 'help':
-                output = self._op_help()
-            elif operation_lower == 'health':
-                output = self._op_health()
-            elif operation_lower == 'launch':
-                output = self._op_launch()
-            elif operation_lower == 'config':
-                output = self._op_config()
-            else:
+            if spec is None:
                 output = f"Operation '{operation}' recognized but not implemented"
+            else:
+                output = self._run_spec(spec, args)
+        except Exception as e:
+            return dict(self._finish(operation, operation_lower, start_time, error=e), output='')
+        
+        return dict(self._finish(operation, operation_lower, start_time), output=output)
+    
+    def stream_operation(self, operation: str) -> Iterator[Dict]:
+        """Execute an operation, yielding its output as it is produced
+        
+        Yields {'event': 'chunk', 'data': text} events, then one
+        {'event': 'done', ...} event carrying status, message and duration_ms.
+        Closing the generator early records the operation as cancelled.
+        """
+        start_time = time.time()
+        is_valid, message = self.validate_operation(operation)
+        
+        if not is_valid:
+            result = self._reject(operation, message, start_time)
+            result.pop('output')
+            yield dict(result, event='done')
+            return
+        
+        operation_lower, args = split_operation(operation)
+        chunks: Iterable[str] = ()
+        try:
+            logger.audit("OPERATION_EXECUTED", "", operation=operation)
+            spec = self.registry.get(operation_lower)
             
-            duration = int((time.time() - start_time) * 1000)
-            self.db.log_operation(operation, 'success', '', duration)
-            
-            return {
-                'status': 'success',
-                'message': 'Operation completed successfully',
-                'output': output,
-                'duration_ms': duration
-            }
+            if spec is None:
+                chunks = [f"Operation '{operation}' recognized but not implemented"]
+            elif spec.stream is not None:
+                chunks = spec.stream(self, args) if spec.accepts_args else spec.stream(self)
+            else:
+                chunks = [self._run_spec(spec, args)]
             
+            for chunk in chunks:
+                if chunk:
+                    yield {'event': 'chunk', 'data': chunk}
+        except (GeneratorExit, KeyboardInterrupt):
+            if hasattr(chunks, 'close'):
+                chunks.close()
+            self._finish(operation, operation_lower, start_time, cancelled=True)
+            raise
         except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            error_msg = str(e)
-            logger.error(f"Error executing operation '{operation}': {error_msg}")
-            logger.audit(f"OPERATION_ERROR:{operation}", error_msg)
-            self.db.log_operation(operation, 'error', error_msg, duration)
-            
-            return {
-                'status': 'error',
-                'message': f'Operation failed: {error_msg}',
-                'output': '',
-                'duration_ms': duration
-            }
+            yield dict(self._finish(operation, operation_lower, start_time, error=e), event='done')
+            return
+        
+        yield dict(self._finish(operation, operation_lower, start_time), event='done')
+    
+    def _reject(self, operation: str, message: str, start_time: float) -> Dict:
+        """Record and build the result for an operation that failed validation"""
+        elapsed = time.time() - start_time
+        logger.audit("OPERATION_REJECTED", message, operation=operation)
+        self._record_metrics('invalid', 'error', elapsed)
+        return {'status': 'error', 'message': message, 'output': '', 'duration_ms': int(elapsed * 1000)}
+    
+    def _finish(self, operation: str, operation_lower: str, start_time: float,
+                error: Optional[Exception] = None, cancelled: bool = False) -> Dict:
+        """Log, audit and count a completed operation; return its result without output"""
+        elapsed = time.time() - start_time
+        duration = int(elapsed * 1000)
+        
+        if error is not None:
+            error_msg = str(error)
+            logger.error("Error executing operation '%s': %s", operation, error_msg)
+            logger.audit("OPERATION_ERROR", error_msg, operation=operation)
+            self.db.log_operation(operation_lower, 'error', error_msg, duration)
+            self._record_metrics(operation_lower, 'error', elapsed)
+            return {'status': 'error', 'message': f'Operation failed: {error_msg}', 'duration_ms': duration}
+        
+        if cancelled:
+            logger.audit("OPERATION_CANCELLED", "", operation=operation)
+            self.db.log_operation(operation_lower, 'cancelled', '', duration)
+            self._record_metrics(operation_lower, 'cancelled', elapsed)
+            return {'status': 'cancelled', 'message': 'Operation cancelled', 'duration_ms': duration}
+        
+        self.db.log_operation(operation_lower, 'success', '', duration)
+        self._record_metrics(operation_lower, 'success', elapsed)
+        return {'status': 'success', 'message': 'Operation completed successfully', 'duration_ms': duration}
+    
+    def execute_batch(self, operations: List[str]) -> List[Dict]:
+        """Execute several operations, running idempotent ones concurrently
+        
+        Consecutive idempotent operations form a group that runs on the shared
+        batch pool; any other operation waits for the group before it and runs
+        alone, so side effects keep their submission order. Results are
+        returned in submission order.
+        """
+        results: List[Optional[Dict]] = [None] * len(operations)
+        group: List[int] = []
+        
+        def run_group():
+            if len(group) == 1:
+                results[group[0]] = self.execute_operation(operations[group[0]])
+            elif group:
+                pool = self._get_batch_pool()
+                futures = {i: pool.submit(self.execute_operation, operations[i]) for i in group}
+                for i, future in futures.items():
+                    results[i] = future.result()
+            group.clear()
+        
+        for index, operation in enumerate(operations):
+            spec = self.registry.get(split_operation(operation)[0])
+            if spec is None or spec.idempotent:
+                # Unknown or rejected operations have no side effects either
+                group.append(index)
+            else:
+                run_group()
+                results[index] = self.execute_operation(operation)
+        run_group()
+        
+        return [dict(result, index=i, operation=operations[i]) for i, result in enumerate(results)]
+    
+    @classmethod
+    def _get_batch_pool(cls) -> ThreadPoolExecutor:
+        if cls._batch_pool is None:
+            with cls._timeout_pool_lock:
+                if cls._batch_pool is None:
+                    cls._batch_pool = ThreadPoolExecutor(
+                        max_workers=config.BATCH_MAX_WORKERS, thread_name_prefix="batch"
+                    )
+        return cls._batch_pool
+    
+    def _run_spec(self, spec: OperationSpec, args: Optional[List[str]] = None) -> str:
+        """Run an operation handler, serving idempotent results from the cache"""
+        cacheable = spec.idempotent and spec.cache_ttl_seconds > 0 and not args
+        if cacheable:
+            # Cached output may reflect stored settings or the set of registered
+            # operations, so a config write or a new registration expires it
+            versions = (get_config_store().version, self.registry.version)
+            cached = self._result_cache.get(spec.name)
+            if cached is not None and cached[0] > time.monotonic() and cached[1] == versions:
+                return cached[2]
+        
+        call_args = (self, args or []) if spec.accepts_args else (self,)
+        if spec.timeout_seconds:
+            output = self._run_with_timeout(spec, call_args)
+        else:
+            output = spec.handler(*call_args)
+        
+        if cacheable:
+            self._result_cache[spec.name] = (time.monotonic() + spec.cache_ttl_seconds, versions, output)
+        return output
+    
+    def invalidate_cache(self, operation: Optional[str] = None):
+        """Drop cached results for one operation, or for all of them"""
+        if operation is None:
+            self._result_cache.clear()
+        else:
+            self._result_cache.pop(operation, None)
+    
+    @classmethod
+    def _run_with_timeout(cls, spec: OperationSpec, call_args: tuple) -> str:
+        """Run a handler on the timeout pool, refusing work while too many workers are stuck"""
+        with cls._timeout_pool_lock:
+            if len(cls._abandoned) >= config.OPERATION_MAX_ABANDONED:
+                raise RuntimeError(
+                    f"{len(cls._abandoned)} timed-out operations are still running; try again later"
+                )
+        
+        future = cls._get_timeout_pool().submit(spec.handler, *call_args)
+        try:
+            return future.result(timeout=spec.timeout_seconds)
+        except FutureTimeout:
+            with cls._timeout_pool_lock:
+                cls._abandoned.add(future)
+            future.add_done_callback(cls._release_abandoned)
+            operations_abandoned_total.inc(spec.name)
+            raise TimeoutError(f"timed out after {spec.timeout_seconds}s")
+    
+    @classmethod
+    def _release_abandoned(cls, future: Future):
+        with cls._timeout_pool_lock:
+            cls._abandoned.discard(future)
+    
+    @classmethod
+    def abandoned_operations(cls) -> int:
+        """Number of timed-out handlers still holding a timeout pool worker"""
+        with cls._timeout_pool_lock:
+            return len(cls._abandoned)
+    
+    @classmethod
+    def _get_timeout_pool(cls) -> ThreadPoolExecutor:
+        if cls._timeout_pool is None:
+            with cls._timeout_pool_lock:
+                if cls._timeout_pool is None:
+                    cls._timeout_pool = ThreadPoolExecutor(
+                        max_workers=config.OPERATION_MAX_WORKERS, thread_name_prefix="operation"
+                    )
+        return cls._timeout_pool
+    
+    @staticmethod
+    def _record_metrics(operation: str, status: str, elapsed_seconds: float):
+        operations_total.inc(operation, status)
+        operation_duration_seconds.observe(elapsed_seconds, operation)
     
     # Operation implementations
     def _op_status(self) -> str:
@@ -396,21 +3124,37 @@ Operations: {info['application']['operations']}
 Errors: {info['application']['errors']}
 Bundle Directory: {info['application']['bundle_dir']}
 Status: Operational
-"""
+{self._format_instances()}"""
+    
+    @staticmethod
+    def _format_instances() -> str:
+        supervisor = get_process_supervisor()
+        instances = supervisor.instances()
+        if not instances:
+            return "Instances: none running\n"
+        lines = [f"Instances: {len(instances)} running"]
+        for instance in instances:
+            stats = supervisor.stats(instance)
+            cpu = f"{stats['cpu_percent']:.1f}%" if stats['cpu_percent'] is not None else "-"
+            rss = f"{stats['rss_bytes'] / 1024**2:.1f} MB" if stats['rss_bytes'] is not None else "-"
+            lines.append(f"  pid {stats['pid']:<7} up {stats['uptime_seconds']:.0f}s  cpu {cpu}  rss {rss}  {stats['command']}")
+        return "\n".join(lines) + "\n"
     
     def _op_version(self) -> str:
         return f"{config.APP_NAME} v{config.VERSION}"
     
     def _op_check(self) -> str:
+        return "".join(self._stream_check())
+    
+    def _stream_check(self) -> Iterator[str]:
         monitor = SystemHealthMonitor()
         health = monitor.perform_health_check()
         
-        checks = []
-        for component, status in health['checks'].items():
+        yield f"HEALTH CHECK RESULTS\n{'='*20}\n"
+        for index, (component, status) in enumerate(health['checks'].items()):
             symbol = "✓" if "healthy" in status else "⚠" if "warning" in status else "✗"
-            checks.append(f"{symbol} {component.replace('_', ' ').title()}: {status}")
-        
-        return f"HEALTH CHECK RESULTS\n{'='*20}\n" + "\n".join(checks)
+            separator = "" if index == 0 else "\n"
+            yield f"{separator}{symbol} {component.replace('_', ' ').title()}: {status}"
     
     def _op_info(self) -> str:
         monitor = SystemHealthMonitor()
@@ -426,19 +3170,15 @@ Status: Operational
         return "SYSTEM INFORMATION\n" + "=" * 18 + "\n" + "\n".join(details)
     
     def _op_help(self) -> str:
+        operations = "\n".join(
+            f"  {spec.name:<8} - {spec.description}" for spec in self.registry.specs()
+        )
         return f"""
 CURSOR BUNDLE LAUNCHER HELP
 ============================
 
 Available Operations:
-  status   - Show application status and metrics
-  version  - Display version information
-  check    - Perform system health checks
-  info     - Show detailed system information
-  help     - Display this help message
-  health   - Show health check results in JSON format
-  launch   - Launch Cursor IDE (if available)
-  config   - Show current configuration
+{operations}
 
 Professional Features:
   • Secure operation validation and execution
@@ -455,45 +3195,631 @@ Bundle Directory: {config.BUNDLE_DIR}
     def _op_health(self) -> str:
         monitor = SystemHealthMonitor()
         health = monitor.perform_health_check()
-        return json.dumps(health, indent=2)
+        return json_dumps(health, pretty=True)
     
-    def _op_launch(self) -> str:
+    def _op_launch(self, args: List[str]) -> str:
+        version = None
+        for arg in args:
+            key, _, value = arg.partition('=')
+            if key.lower() != 'version' or not value:
+                raise ValueError(f"invalid argument '{arg}'")
+            version = value
+        
         try:
-            # Look for Cursor executable in bundle directory
-            cursor_exe = None
-            possible_names = ['cursor', 'cursor.exe', 'Cursor', 'Cursor.exe']
-            
-            for name in possible_names:
-                path = config.BUNDLE_DIR / name
-                if path.exists():
-                    cursor_exe = path
-                    break
+            inventory = get_bundle_inventory()
+            cursor_exe = inventory.find(version)
             
             if cursor_exe:
-                subprocess.Popen([str(cursor_exe)], cwd=str(config.BUNDLE_DIR))
-                return f"Launched Cursor IDE from {cursor_exe}"
+                instance = get_process_supervisor().launch([str(cursor_exe.path)], str(cursor_exe.path.parent))
+                return f"Launched Cursor IDE from {cursor_exe.path} (pid {instance.pid})"
+            elif version:
+                available = ", ".join(inventory.versions()) or "none"
+                return f"Cursor version {version} not found in bundle directory (available: {available})"
             else:
                 return "Cursor executable not found in bundle directory"
                 
         except Exception as e:
             return f"Failed to launch Cursor IDE: {e}"
     
+    def _op_stop(self, args: List[str]) -> str:
+        pid, timeout = self._parse_process_args(args)
+        results = get_process_supervisor().stop(pid, timeout)
+        if not results:
+            return f"No running instance with pid {pid}" if pid else "No running instances"
+        return "\n".join(
+            f"Stopped pid {r['pid']} (exit status {r['returncode']}{', forced' if r['forced'] else ''})"
+            for r in results
+        )
+    
+    def _op_restart(self, args: List[str]) -> str:
+        pid, timeout = self._parse_process_args(args)
+        supervisor = get_process_supervisor()
+        targets = [i for i in supervisor.instances() if pid is None or i.pid == pid]
+        if not targets:
+            if pid:
+                return f"No running instance with pid {pid}"
+            return self._op_launch([])
+        lines = [self._op_stop(args)]
+        for instance in targets:
+            relaunched = supervisor.launch(instance.argv, instance.cwd)
+            lines.append(f"Relaunched {instance.argv[0]} as pid {relaunched.pid}")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _parse_process_args(args: List[str]) -> Tuple[Optional[int], Optional[float]]:
+        """Parse `stop`/`restart` arguments: pid= and timeout="""
+        pid, timeout = None, None
+        for arg in args:
+            key, _, value = arg.partition('=')
+            key = key.lower()
+            if key == 'pid' and value.isdigit():
+                pid = int(value)
+            elif key == 'timeout' and value:
+                timeout = min(SecureCommandExecutor._parse_duration(value), config.PROCESS_STOP_TIMEOUT_SECONDS * 3)
+            else:
+                raise ValueError(f"invalid argument '{arg}'")
+        return pid, timeout
+    
+    def _op_logs(self, args: List[str]) -> str:
+        return "".join(self._stream_logs(args, allow_follow=False))
+    
+    def _stream_logs(self, args: List[str], allow_follow: bool = True) -> Iterator[str]:
+        options = self._parse_logs_args(args)
+        tailer = LogTailer(config.LOG_DIR, LOG_FILES[options['file']], LogQuery(
+            level=options['level'], since_seconds=options['since'], grep=options['grep']
+        ))
+        records = tailer.tail(options['lines'])
+        
+        title = f"LOGS: {tailer.log_name}"
+        yield f"{title}\n{'=' * len(title)}\n"
+        yield "\n".join(records) if records else "(no matching log records)"
+        
+        if options['follow']:
+            if not allow_follow:
+                yield "\n\nFollow mode needs a streaming client (CLI, GUI or /api/execute/stream)"
+                return
+            deadline = time.monotonic() + options['timeout']
+            for chunk in tailer.follow(deadline):
+                yield "\n" + chunk
+    
+    @staticmethod
+    def _parse_logs_args(args: List[str]) -> Dict:
+        """Parse `logs` arguments: file=, lines=, level=, since=, grep=, timeout= and follow"""
+        options = {'file': 'launcher', 'lines': config.LOGS_DEFAULT_LINES, 'level': None,
+                   'since': None, 'grep': None, 'follow': False,
+                   'timeout': config.LOGS_FOLLOW_MAX_SECONDS}
+        for arg in args:
+            key, _, value = arg.partition('=')
+            key = key.lower()
+            if key == 'follow' and not value:
+                options['follow'] = True
+            elif key == 'file' and value.lower() in LOG_FILES:
+                options['file'] = value.lower()
+            elif key == 'lines' and value.isdigit() and int(value) > 0:
+                options['lines'] = min(int(value), config.LOGS_MAX_LINES)
+            elif key == 'level' and value:
+                options['level'] = value
+            elif key in ('since', 'timeout') and value:
+                options[key] = SecureCommandExecutor._parse_duration(value)
+            elif key == 'grep' and value:
+                options['grep'] = value
+            else:
+                raise ValueError(f"invalid logs argument '{arg}'")
+        options['timeout'] = min(options['timeout'], config.LOGS_FOLLOW_MAX_SECONDS)
+        return options
+    
+    @staticmethod
+    def _parse_duration(value: str) -> float:
+        """Parse durations such as 90, 30s, 10m, 2h or 1d into seconds"""
+        units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+        number, unit = (value[:-1], value[-1].lower()) if value[-1:].isalpha() else (value, 's')
+        try:
+            seconds = float(number) * units[unit]
+        except (KeyError, ValueError):
+            raise ValueError(f"invalid duration '{value}'")
+        if seconds <= 0:
+            raise ValueError(f"invalid duration '{value}'")
+        return seconds
+    
     def _op_config(self) -> str:
         config_dict = asdict(config)
         # Remove sensitive information
         config_dict.pop('SECRET_KEY', None)
-        return json.dumps(config_dict, indent=2, default=str)
+        store = get_config_store()
+        config_dict['config_store'] = {'version': store.version, 'values': store.all()}
+        return json_dumps(config_dict, pretty=True)
+
+# Built-in operations
+for _spec in (
+    OperationSpec('status', SecureCommandExecutor._op_status, "Show application status and metrics",
+                  idempotent=True),
+    OperationSpec('version', SecureCommandExecutor._op_version, "Display version information",
+                  idempotent=True, cache_ttl_seconds=3600),
+    OperationSpec('check', SecureCommandExecutor._op_check, "Perform system health checks",
+                  idempotent=True, stream=SecureCommandExecutor._stream_check),
+    OperationSpec('info', SecureCommandExecutor._op_info, "Show detailed system information",
+                  idempotent=True),
+    OperationSpec('help', SecureCommandExecutor._op_help, "Display this help message",
+                  idempotent=True, cache_ttl_seconds=3600),
+    OperationSpec('health', SecureCommandExecutor._op_health, "Show health check results in JSON format",
+                  idempotent=True),
+    OperationSpec('launch', SecureCommandExecutor._op_launch, "Launch Cursor IDE (if available) [version=]",
+                  timeout_seconds=30, accepts_args=True),
+    OperationSpec('stop', SecureCommandExecutor._op_stop, "Stop launched instances [pid= timeout=]",
+                  timeout_seconds=60, accepts_args=True),
+    OperationSpec('restart', SecureCommandExecutor._op_restart, "Restart launched instances [pid= timeout=]",
+                  timeout_seconds=60, accepts_args=True),
+    OperationSpec('config', SecureCommandExecutor._op_config, "Show current configuration",
+                  idempotent=True, cache_ttl_seconds=60),
+    OperationSpec('logs', SecureCommandExecutor._op_logs,
+                  "Show recent log records [file= lines= level= since= grep= follow timeout=]",
+                  idempotent=True, stream=SecureCommandExecutor._stream_logs, accepts_args=True),
+):
+    operation_registry.register(_spec)
+del _spec
+
+class GuiTask:
+    """One operation submitted to the GuiWorkerPool"""
+    
+    def __init__(self, operation: str, on_chunk: Optional[Callable[[str], None]],
+                 on_done: Optional[Callable[[Dict], None]]):
+        self.operation = operation
+        self.on_chunk = on_chunk
+        self.on_done = on_done
+        self.cancelled = threading.Event()
+        self.done = False
+
+class GuiWorkerPool:
+    """Runs operations off the Tk main thread and marshals their events back to it
+    
+    Worker threads never touch Tk. They queue (task, event) pairs which the
+    main thread drains from a root.after() timer, spending at most
+    `budget_ms` per tick so input and redraws keep being serviced. The timer
+    only runs while tasks are in flight.
+    """
+    
+    def __init__(self, root, executor: 'SecureCommandExecutor', max_workers: int = 4,
+                 poll_ms: int = 15, budget_ms: float = 8.0,
+                 on_busy: Optional[Callable[[bool], None]] = None):
+        self.root = root
+        self.executor = executor
+        self.poll_ms = poll_ms
+        self.budget = budget_ms / 1000
+        self.on_busy = on_busy
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gui-worker")
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._active: List[GuiTask] = []
+        self._after_id = None
+    
+    def submit(self, operation: str, on_chunk: Optional[Callable[[str], None]] = None,
+               on_done: Optional[Callable[[Dict], None]] = None) -> GuiTask:
+        """Start an operation; callbacks run on the main thread"""
+        task = GuiTask(operation, on_chunk, on_done)
+        self._active.append(task)
+        if len(self._active) == 1 and self.on_busy:
+            self.on_busy(True)
+        self._pool.submit(self._run, task)
+        if self._after_id is None:
+            self._after_id = self.root.after(self.poll_ms, self._drain)
+        return task
+    
+    def cancel(self, task: GuiTask):
+        """Detach a task now; its worker closes the operation at the next event"""
+        if task.done:
+            return
+        task.cancelled.set()
+        self._complete(task, {'status': 'cancelled', 'message': 'Operation cancelled', 'duration_ms': 0})
+    
+    def close(self):
+        for task in list(self._active):
+            self.cancel(task)
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _run(self, task: GuiTask):
+        if task.cancelled.is_set():
+            return
+        events = self.executor.stream_operation(task.operation)
+        result = None
+        try:
+            for event in events:
+                if task.cancelled.is_set():
+                    # Records the operation as cancelled
+                    events.close()
+                    return
+                if event['event'] == 'chunk':
+                    self._events.put((task, event['data']))
+                else:
+                    result = event
+        except Exception as e:
+            logger.error("GUI operation error: %s", e)
+            result = {'status': 'error', 'message': f"Unexpected error: {e}", 'duration_ms': 0}
+        self._events.put((task, result))
+    
+    def _drain(self):
+        deadline = time.perf_counter() + self.budget
+        while time.perf_counter() < deadline:
+            try:
+                task, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if task.done:
+                continue
+            try:
+                if isinstance(payload, dict):
+                    self._complete(task, payload)
+                elif task.on_chunk:
+                    task.on_chunk(payload)
+            except Exception as e:
+                logger.error("GUI callback error for '%s': %s", task.operation, e)
+        
+        if self._active or not self._events.empty():
+            self._after_id = self.root.after(self.poll_ms, self._drain)
+        else:
+            self._after_id = None
+    
+    def _complete(self, task: GuiTask, result: Dict):
+        task.done = True
+        self._active.remove(task)
+        if not self._active and self.on_busy:
+            self.on_busy(False)
+        if task.on_done:
+            task.on_done(result)
+
+class OutputPane:
+    """Bounded, incrementally rendered text output backed by a spool file
+    
+    Appended text is written to a temporary spool file and queued; the queue
+    is inserted into the widget `chunk_chars` at a time, one slice per event
+    loop tick. The widget keeps at most `max_lines` lines below a fixed
+    header, discarding the oldest first. When output arrives faster than it
+    can be drawn, queued text beyond `max_pending_chars` is skipped the same
+    way. Discarded output stays in the spool and "Load earlier output" reads
+    it back `load_more_lines` at a time.
+    """
+    
+    def __init__(self, parent, max_lines: int = 5000, chunk_chars: int = 32 * 1024,
+                 max_pending_chars: int = 1024 * 1024, load_more_lines: int = 1000, **text_options):
+        self.frame = ttk.Frame(parent)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+        self.more_button = ttk.Button(self.frame, command=self.load_more)
+        self.text = scrolledtext.ScrolledText(self.frame, **text_options)
+        self.text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.default_max_lines = max_lines
+        self.chunk_chars = chunk_chars
+        self.max_pending_chars = max_pending_chars
+        self.load_more_lines = load_more_lines
+        self._spool = None
+        self._flush_id = None
+        self.reset()
+    
+    def reset(self, header: str = ""):
+        """Clear the pane and start a new spool, showing `header` above the output"""
+        if self._flush_id is not None:
+            self.text.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._close_spool()
+        self.max_lines = self.default_max_lines
+        self.header_lines = 0
+        self._pending: deque = deque()
+        self._pending_chars = 0
+        self._spool_size = 0
+        # Spool offset of the first output character shown below the header
+        self._visible_start = 0
+        self.text.delete(1.0, tk.END)
+        self.set_header(header)
+        self._update_more_button()
+    
+    def set_header(self, header: str):
+        """Replace the header lines; `header` should end with a newline"""
+        if self.header_lines:
+            self.text.delete(1.0, f"{self.header_lines + 1}.0")
+        self.text.insert(1.0, header)
+        self.header_lines = header.count("\n")
+    
+    def append(self, data: str):
+        """Queue output for display; returns immediately"""
+        if not data:
+            return
+        if self._spool is None:
+            import tempfile
+            self._spool = tempfile.NamedTemporaryFile(prefix="launcher-output-", suffix=".log")
+        encoded = data.encode('utf-8', errors='replace')
+        self._spool.write(encoded)
+        self._pending.append((self._spool_size, data))
+        self._spool_size += len(encoded)
+        self._pending_chars += len(data)
+        
+        if self._pending_chars > self.max_pending_chars:
+            # Rendering cannot keep up: jump ahead to the newest output
+            while self._pending_chars > self.max_pending_chars // 2 and len(self._pending) > 1:
+                self._pending_chars -= len(self._pending.popleft()[1])
+            self.text.delete(f"{self.header_lines + 1}.0", tk.END)
+            self._visible_start = self._pending[0][0]
+            self._update_more_button()
+        
+        if self._flush_id is None:
+            self._flush_id = self.text.after(1, self._flush)
+    
+    def _flush(self):
+        self._flush_id = None
+        if not self._pending:
+            return
+        offset, data = self._pending.popleft()
+        if len(data) > self.chunk_chars:
+            head, rest = data[:self.chunk_chars], data[self.chunk_chars:]
+            self._pending.appendleft((offset + len(head.encode('utf-8', errors='replace')), rest))
+            data = head
+        self._pending_chars -= len(data)
+        self.text.insert(tk.END, data)
+        self._trim()
+        if self._pending:
+            self._flush_id = self.text.after(1, self._flush)
+    
+    def _trim(self):
+        # The last line is the one still being written (empty after a newline)
+        body_lines = int(self.text.index('end-1c').split('.')[0]) - 1 - self.header_lines
+        excess = body_lines - self.max_lines
+        if excess <= 0:
+            return
+        first = f"{self.header_lines + 1}.0"
+        last = f"{self.header_lines + 1 + excess}.0"
+        discarded = self.text.get(first, last)
+        self.text.delete(first, last)
+        self._visible_start += len(discarded.encode('utf-8', errors='replace'))
+        self._update_more_button()
+    
+    def load_more(self):
+        """Show up to `load_more_lines` earlier lines from the spool above the current output"""
+        if self._spool is None or self._visible_start <= 0:
+            return
+        self._spool.flush()
+        pieces: List[str] = []
+        for line in _iter_lines_reverse(Path(self._spool.name), self._visible_start):
+            pieces.append(line)
+            if len(pieces) > self.load_more_lines:
+                break
+        # The first piece ends at the visible start; each later one ends with a newline
+        earlier = "\n".join(reversed(pieces))
+        self.text.insert(f"{self.header_lines + 1}.0", earlier)
+        self._visible_start -= len(earlier.encode('utf-8', errors='replace'))
+        self.max_lines += len(pieces) - 1
+        self._update_more_button()
+    
+    def _update_more_button(self):
+        if self._visible_start > 0:
+            self.more_button.config(text=f"Load earlier output ({self._visible_start / 1024:,.0f} KB not shown)")
+            self.more_button.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        else:
+            self.more_button.grid_remove()
+    
+    def _close_spool(self):
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+    
+    def close(self):
+        if self._flush_id is not None:
+            self.text.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._close_spool()
+
+class MetricsHistory:
+    """Fixed-length history of operation and resource metrics for the dashboard
+    
+    Each sample() turns the process-wide counters and latency histogram into
+    per-interval rates and percentiles, and copies the newest resource
+    sample if the sampler has taken one since. Reads are in-memory only.
+    """
+    
+    SERIES = ('operations_per_second', 'error_percent', 'latency_p50_ms', 'latency_p99_ms',
+              'cpu_percent', 'memory_percent', 'disk_percent', 'process_rss_mb')
+    
+    def __init__(self, capacity: int = 120):
+        self.series: Dict[str, deque] = {name: deque(maxlen=capacity) for name in self.SERIES}
+        # Appends per series, so readers can tell which series changed
+        self.updates: Dict[str, int] = dict.fromkeys(self.SERIES, 0)
+        self._last: Optional[Tuple[float, float, float, List[float]]] = None
+        self._last_resource_ts = 0.0
+    
+    def sample(self):
+        now = time.monotonic()
+        total = operations_total.total()
+        errors = operations_total.total(status='error')
+        buckets = self._bucket_counts()
+        
+        if self._last is not None:
+            last_time, last_total, last_errors, last_buckets = self._last
+            elapsed = max(now - last_time, 1e-6)
+            count = total - last_total
+            delta = [current - previous for current, previous in zip(buckets, last_buckets)]
+            self._append('operations_per_second', count / elapsed)
+            self._append('error_percent', (errors - last_errors) / count * 100 if count else 0.0)
+            self._append('latency_p50_ms', self._percentile(delta, 0.50))
+            self._append('latency_p99_ms', self._percentile(delta, 0.99))
+        self._last = (now, total, errors, buckets)
+        
+        sampler = get_resource_sampler()
+        latest = sampler.latest() if sampler.available else None
+        if latest is not None and latest['timestamp'] != self._last_resource_ts:
+            self._last_resource_ts = latest['timestamp']
+            for name in ('cpu_percent', 'memory_percent', 'disk_percent'):
+                self._append(name, latest[name])
+            self._append('process_rss_mb', latest['process_rss_bytes'] / 1024**2)
+    
+    def _append(self, name: str, value: float):
+        self.series[name].append(value)
+        self.updates[name] += 1
+    
+    @staticmethod
+    def _bucket_counts() -> List[float]:
+        """Per-bucket latency counts summed over every operation"""
+        counts = [0.0] * (len(operation_duration_seconds.buckets) + 1)
+        for values in operation_duration_seconds.series().values():
+            for index, value in enumerate(values[:-1]):
+                counts[index] += value
+        return counts
+    
+    @staticmethod
+    def _percentile(counts: List[float], fraction: float) -> float:
+        """Upper bound in ms of the bucket holding the given fraction of observations"""
+        total = sum(counts)
+        if not total:
+            return 0.0
+        bounds = operation_duration_seconds.buckets
+        cumulative = 0.0
+        for index, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= fraction * total:
+                return bounds[min(index, len(bounds) - 1)] * 1000
+        return bounds[-1] * 1000
+
+class Sparkline:
+    """One titled line chart drawn as a fixed set of canvas items
+    
+    The items are created once; update() only moves the line's coordinates
+    and rewrites the value text, so Tk repaints just their bounding boxes.
+    """
+    
+    def __init__(self, canvas, title: str, unit: str, fixed_max: Optional[float] = None):
+        self.canvas = canvas
+        self.title = title
+        self.unit = unit
+        self.fixed_max = fixed_max
+        self.frame_item = canvas.create_rectangle(0, 0, 0, 0, outline="#cccccc")
+        self.title_item = canvas.create_text(0, 0, anchor=tk.NW, text=title, font=('Arial', 9))
+        self.value_item = canvas.create_text(0, 0, anchor=tk.NE, text="-", font=('Arial', 9, 'bold'))
+        self.line_item = canvas.create_line(0, 0, 0, 0, fill="#1f77b4", width=1.5)
+        self.box = (0, 0, 0, 0)
+    
+    def place(self, x0: float, y0: float, x1: float, y1: float):
+        self.box = (x0, y0, x1, y1)
+        self.canvas.coords(self.frame_item, x0, y0, x1, y1)
+        self.canvas.coords(self.title_item, x0 + 6, y0 + 4)
+        self.canvas.coords(self.value_item, x1 - 6, y0 + 4)
+    
+    def update(self, values: deque, capacity: int, available: bool = True):
+        if not available:
+            self.canvas.itemconfigure(self.value_item, text="n/a")
+            self.canvas.coords(self.line_item, 0, 0, 0, 0)
+            return
+        if not values:
+            return
+        x0, y0, x1, y1 = self.box
+        top, bottom = y0 + 22, y1 - 6
+        left, right = x0 + 6, x1 - 6
+        peak = self.fixed_max or max(max(values), 1e-9)
+        step = (right - left) / max(capacity - 1, 1)
+        start = right - step * (len(values) - 1)
+        coords = []
+        for index, value in enumerate(values):
+            coords.append(start + index * step)
+            coords.append(bottom - (bottom - top) * min(value / peak, 1.0))
+        if len(coords) == 2:
+            coords.extend(coords)
+        self.canvas.coords(self.line_item, *coords)
+        self.canvas.itemconfigure(self.value_item, text=f"{values[-1]:,.1f} {self.unit}")
+
+class DashboardView:
+    """Canvas of metric sparklines refreshed on a timer within a frame budget
+    
+    History is sampled every `interval_ms`; charts are redrawn only while
+    the dashboard is visible and only when their series changed. A redraw
+    that runs out of `budget_ms` leaves the remaining charts dirty for the
+    next tick.
+    """
+    
+    CHARTS = (
+        ('operations_per_second', "Operations", "/s", None),
+        ('error_percent', "Error rate", "%", 100.0),
+        ('latency_p50_ms', "Latency p50", "ms", None),
+        ('latency_p99_ms', "Latency p99", "ms", None),
+        ('cpu_percent', "Host CPU", "%", 100.0),
+        ('memory_percent', "Host memory", "%", 100.0),
+        ('disk_percent', "Disk usage", "%", 100.0),
+        ('process_rss_mb', "Launcher RSS", "MB", None),
+    )
+    RESOURCE_SERIES = ('cpu_percent', 'memory_percent', 'disk_percent', 'process_rss_mb')
+    
+    def __init__(self, parent, history: MetricsHistory, interval_ms: int = 1000,
+                 budget_ms: float = 4.0, columns: int = 2):
+        self.history = history
+        self.interval_ms = interval_ms
+        self.budget = budget_ms / 1000
+        self.columns = columns
+        self.visible = False
+        self.canvas = tk.Canvas(parent, background="white", highlightthickness=0)
+        self.charts = {name: Sparkline(self.canvas, title, unit, fixed_max)
+                       for name, title, unit, fixed_max in self.CHARTS}
+        self._drawn: Dict[str, int] = {}
+        self._dirty: deque = deque()
+        self._after_id = None
+        self.canvas.bind('<Configure>', self._layout)
+    
+    def start(self):
+        self._after_id = self.canvas.after(self.interval_ms, self._tick)
+    
+    def stop(self):
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def set_visible(self, visible: bool):
+        self.visible = visible
+        if visible:
+            self._mark_all_dirty()
+            self._redraw()
+    
+    def _layout(self, event=None):
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        rows = -(-len(self.charts) // self.columns)
+        cell_w, cell_h = width / self.columns, height / rows
+        for index, chart in enumerate(self.charts.values()):
+            row, column = divmod(index, self.columns)
+            chart.place(column * cell_w + 4, row * cell_h + 4, (column + 1) * cell_w - 4, (row + 1) * cell_h - 4)
+        self._mark_all_dirty()
+        if self.visible:
+            self._redraw()
+    
+    def _mark_all_dirty(self):
+        self._drawn.clear()
+        self._dirty = deque(self.charts)
+    
+    def _tick(self):
+        self._after_id = self.canvas.after(self.interval_ms, self._tick)
+        self.history.sample()
+        if self.visible:
+            self._redraw()
+    
+    def _redraw(self):
+        for name in self.charts:
+            if name not in self._dirty and self._drawn.get(name) != self.history.updates[name]:
+                self._dirty.append(name)
+        
+        deadline = time.perf_counter() + self.budget
+        resources_available = get_resource_sampler().available
+        while self._dirty and time.perf_counter() < deadline:
+            name = self._dirty.popleft()
+            series = self.history.series[name]
+            available = resources_available or name not in self.RESOURCE_SERIES
+            self.charts[name].update(series, series.maxlen, available)
+            self._drawn[name] = self.history.updates[name]
 
 class ProfessionalGUI:
     """Professional GUI interface using tkinter"""
     
     def __init__(self):
-        if not GUI_AVAILABLE:
+        if not load_gui():
             raise RuntimeError("GUI components not available")
         
-        self.db = DatabaseManager(config.DATABASE_FILE)
+        self.db = get_database()
         self.executor = SecureCommandExecutor(self.db)
         self.monitor = SystemHealthMonitor()
+        self.current_task: Optional[GuiTask] = None
         
         self.setup_gui()
         logger.info("Professional GUI initialized")
@@ -504,10 +3830,22 @@ class ProfessionalGUI:
         self.root.title(config.APP_NAME)
         self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
+        self.workers = GuiWorkerPool(
+            self.root, self.executor,
+            max_workers=config.GUI_WORKERS,
+            poll_ms=config.GUI_POLL_INTERVAL_MS,
+            budget_ms=config.GUI_FRAME_BUDGET_MS,
+            on_busy=self.set_busy
+        )
+        
+        # Operations and dashboard tabs
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Create main frame
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(main_frame, text="Operations")
         
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
@@ -530,10 +3868,21 @@ class ProfessionalGUI:
         execute_btn = ttk.Button(main_frame, text="Execute", command=self.execute_operation)
         execute_btn.grid(row=1, column=2, padx=(10, 0))
         
+        # Cancel button, enabled while an operation runs
+        self.cancel_btn = ttk.Button(main_frame, text="Cancel", command=self.cancel_operation, state=tk.DISABLED)
+        self.cancel_btn.grid(row=1, column=3, padx=(10, 0))
+        
         # Output area
         ttk.Label(main_frame, text="Output:").grid(row=2, column=0, sticky=(tk.W, tk.N), padx=(0, 10), pady=(20, 0))
-        self.output_text = scrolledtext.ScrolledText(main_frame, width=80, height=25, wrap=tk.WORD)
-        self.output_text.grid(row=2, column=1, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(20, 0))
+        self.output = OutputPane(
+            main_frame,
+            max_lines=config.GUI_OUTPUT_MAX_LINES,
+            chunk_chars=config.GUI_OUTPUT_CHUNK_CHARS,
+            max_pending_chars=config.GUI_OUTPUT_MAX_PENDING_CHARS,
+            load_more_lines=config.GUI_OUTPUT_LOAD_MORE_LINES,
+            width=80, height=25, wrap=tk.WORD
+        )
+        self.output.frame.grid(row=2, column=1, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(20, 0))
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -541,6 +3890,22 @@ class ProfessionalGUI:
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
         
+        # Busy indicator
+        self.progress = ttk.Progressbar(main_frame, mode='indeterminate', length=80)
+        self.progress.grid(row=3, column=3, sticky=tk.E, padx=(10, 0), pady=(10, 0))
+        
+        # Dashboard tab
+        self.dashboard = DashboardView(
+            self.notebook, MetricsHistory(config.GUI_DASHBOARD_HISTORY),
+            interval_ms=config.GUI_DASHBOARD_INTERVAL_MS,
+            budget_ms=config.GUI_DASHBOARD_FRAME_BUDGET_MS
+        )
+        self.notebook.add(self.dashboard.canvas, text="Dashboard")
+        self.notebook.bind('<<NotebookTabChanged>>', lambda event: self.dashboard.set_visible(
+            self.notebook.select() == str(self.dashboard.canvas)
+        ))
+        self.dashboard.start()
+        
         # Menu bar
         self.create_menu()
         
@@ -566,63 +3931,100 @@ class ProfessionalGUI:
         help_menu.add_command(label="Help", command=self.show_help)
         help_menu.add_command(label="About", command=self.show_about)
     
+    def set_busy(self, busy: bool):
+        """Show or hide the busy indicator"""
+        if busy:
+            self.progress.start(15)
+        else:
+            self.progress.stop()
+    
     def show_initial_status(self):
         """Show initial status information"""
-        result = self.executor.execute_operation('status')
-        self.output_text.insert(tk.END, result['output'])
-        self.output_text.insert(tk.END, "\n" + "="*50 + "\n")
-        self.output_text.insert(tk.END, "Type 'help' for available operations.\n")
+        def done(result):
+            self.current_task = None
+            self.cancel_btn.config(state=tk.DISABLED)
+            if result['status'] == 'cancelled':
+                return
+            self.output.append("\n" + "="*50 + "\n")
+            self.output.append("Type 'help' for available operations.\n")
+        
+        self.current_task = self.workers.submit(
+            'status', on_chunk=self.output.append, on_done=done
+        )
+        self.cancel_btn.config(state=tk.NORMAL)
+    
+    def cancel_operation(self):
+        """Cancel the operation whose output is shown"""
+        if self.current_task is not None:
+            self.workers.cancel(self.current_task)
     
     def execute_operation(self, event=None):
-        """Execute the entered operation"""
+        """Execute the entered operation on a worker, rendering output as it streams in"""
         operation = self.operation_var.get().strip()
         if not operation:
             return
         
+        # One output pane, so a new operation replaces the one being shown
+        if self.current_task is not None:
+            self.workers.cancel(self.current_task)
+        
         self.status_var.set(f"Executing: {operation}")
+        self.output.reset(self._output_header(operation, "running", "-"))
         
-        try:
-            self.monitor.increment_operations()
-            result = self.executor.execute_operation(operation)
+        def done(result):
+            if task is self.current_task:
+                self.current_task = None
+                self.cancel_btn.config(state=tk.DISABLED)
+            else:
+                return
             
-            # Clear output and show result
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, f"Operation: {operation}\n")
-            self.output_text.insert(tk.END, f"Status: {result['status']}\n")
-            self.output_text.insert(tk.END, f"Duration: {result['duration_ms']}ms\n")
-            self.output_text.insert(tk.END, "="*50 + "\n")
-            self.output_text.insert(tk.END, result['output'])
+            # Fill in the status lines reserved above
+            self.output.set_header(self._output_header(operation, result['status'], f"{result['duration_ms']}ms"))
             
             if result['status'] == 'error':
-                self.monitor.increment_errors()
+                self.output.append(result['message'])
                 self.status_var.set(f"Error: {result['message']}")
+            elif result['status'] == 'cancelled':
+                self.status_var.set("Operation cancelled")
             else:
                 self.status_var.set("Operation completed successfully")
-            
-        except Exception as e:
-            self.monitor.increment_errors()
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, f"Unexpected error: {e}")
-            self.status_var.set("Unexpected error occurred")
-            logger.error(f"GUI operation error: {e}")
+        
+        task = self.workers.submit(
+            operation, on_chunk=self.output.append, on_done=done
+        )
+        self.current_task = task
+        self.cancel_btn.config(state=tk.NORMAL)
         
         # Clear input
         self.operation_var.set("")
     
+    @staticmethod
+    def _output_header(operation: str, status: str, duration: str) -> str:
+        return f"Operation: {operation}\nStatus: {status}\nDuration: {duration}\n" + "="*50 + "\n"
+    
+    def show_operation_popup(self, operation: str, title: str):
+        """Run an operation on a worker and show its output in a popup"""
+        chunks: List[str] = []
+        
+        def done(result):
+            if result['status'] == 'success':
+                messagebox.showinfo(title, "".join(chunks))
+            elif result['status'] == 'error':
+                messagebox.showerror(title, result['message'])
+        
+        self.workers.submit(operation, on_chunk=chunks.append, on_done=done)
+    
     def show_health_check(self):
         """Show health check in popup"""
-        result = self.executor.execute_operation('check')
-        messagebox.showinfo("Health Check", result['output'])
+        self.show_operation_popup('check', "Health Check")
     
     def show_system_info(self):
         """Show system info in popup"""
-        result = self.executor.execute_operation('info')
-        messagebox.showinfo("System Information", result['output'])
+        self.show_operation_popup('info', "System Information")
     
     def show_help(self):
         """Show help in popup"""
-        result = self.executor.execute_operation('help')
-        messagebox.showinfo("Help", result['output'])
+        self.show_operation_popup('help', "Help")
     
     def show_about(self):
         """Show about dialog"""
@@ -649,24 +4051,340 @@ Features:
             logger.info("Starting GUI main loop")
             self.root.mainloop()
         except Exception as e:
-            logger.error(f"GUI error: {e}")
+            logger.error("GUI error: %s", e)
             raise
+        finally:
+            self.dashboard.stop()
+            self.workers.close()
+            self.output.close()
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second up to `burst`"""
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def take(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens; return 0 on success, else the seconds until they exist"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return 0.0
+            if cost > self.burst:
+                return math.inf
+            return (cost - self.tokens) / self.rate
+    
+    def refund(self, cost: float = 1.0):
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + cost)
+
+class RateLimiter:
+    """Per-client token buckets behind one global bucket
+    
+    Client buckets live in an LRU bounded by `max_clients`; an evicted
+    client simply starts again with a full bucket.
+    """
+    
+    def __init__(self, client_rate: float, client_burst: float, global_rate: float,
+                 global_burst: float, max_clients: int = 10000):
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_clients = max_clients
+        self.global_bucket = TokenBucket(global_rate, global_burst) if global_rate > 0 else None
+        self._clients: 'OrderedDict[str, TokenBucket]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _client_bucket(self, client: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._clients.get(client)
+            if bucket is None:
+                bucket = self._clients[client] = TokenBucket(self.client_rate, self.client_burst)
+                if len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+            else:
+                self._clients.move_to_end(client)
+            return bucket
+    
+    def check(self, client: str, cost: float = 1.0) -> Tuple[float, Optional[str]]:
+        """Return (0, None) if admitted, else (retry_after_seconds, shed reason)"""
+        bucket = self._client_bucket(client) if self.client_rate > 0 else None
+        if bucket is not None:
+            wait = bucket.take(cost)
+            if wait:
+                return wait, 'client_rate'
+        if self.global_bucket is not None:
+            wait = self.global_bucket.take(cost)
+            if wait:
+                # The client should not pay for capacity it was refused
+                if bucket is not None:
+                    bucket.refund(cost)
+                return wait, 'global_rate'
+        return 0.0, None
+
+class AdmissionController:
+    """Bounded in-flight limit with a FIFO queue of waiting requests
+    
+    A released slot is handed directly to the oldest waiter, so a steady
+    stream of new arrivals cannot overtake requests already queued.
+    """
+    
+    def __init__(self, max_in_flight: int, max_queue: int, queue_timeout: float):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> Optional[str]:
+        """Take an in-flight slot; return None on success, else the shed reason"""
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not self._waiters:
+                self._in_flight += 1
+                requests_in_flight.inc()
+                return None
+            if len(self._waiters) >= self.max_queue:
+                return 'queue_full'
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+            requests_queue_depth.inc()
+        
+        requests_queued_total.inc()
+        started = time.monotonic()
+        granted = waiter.wait(self.queue_timeout)
+        if not granted:
+            with self._lock:
+                # release() may have handed over the slot just after the wait timed out
+                granted = waiter.is_set()
+                if not granted:
+                    self._waiters.remove(waiter)
+                    requests_queue_depth.dec()
+        admission_wait_seconds.observe(time.monotonic() - started)
+        return None if granted else 'queue_timeout'
+    
+    def release(self):
+        with self._lock:
+            if self._waiters:
+                # The slot passes to the next waiter; in-flight count is unchanged
+                self._waiters.popleft().set()
+                requests_queue_depth.dec()
+            else:
+                self._in_flight -= 1
+                requests_in_flight.dec()
+
+def create_json_provider(app) -> 'JSONProvider':
+    """Build a Flask JSON provider that encodes through json_dumpb
+    
+    jsonify() and request.get_json() keep working unchanged. Responses are
+    compact and unsorted, and indented only in debug mode.
+    """
+    
+    class FastJSONProvider(JSONProvider):
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return json_dumps(obj, pretty='indent' in kwargs)
+        
+        def loads(self, s, **kwargs: Any) -> Any:
+            return json_loads(s)
+        
+        def response(self, *args: Any, **kwargs: Any):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                json_dumpb(obj, pretty=self._app.debug) + b"\n", mimetype='application/json'
+            )
+    
+    return FastJSONProvider(app)
+
+def create_session_interface(store: SessionStore) -> 'SessionInterface':
+    """Build a Flask session interface keeping session data in `store`
+    
+    The cookie only carries an unguessable session id, so sessions work
+    across worker processes without sharing a signing key.
+    """
+    
+    class ServerSideSession(CallbackDict, SessionMixin):
+        def __init__(self, initial: Optional[Dict] = None, sid: Optional[str] = None):
+            def on_update(self):
+                self.modified = True
+            super().__init__(initial, on_update)
+            self.sid = sid
+            self.new = sid is None
+            self.modified = False
+    
+    class StoreSessionInterface(SessionInterface):
+        def open_session(self, app, request):
+            sid = request.cookies.get(self.get_cookie_name(app))
+            if sid:
+                data = store.get(sid)
+                if data is not None:
+                    return ServerSideSession(data, sid=sid)
+            return ServerSideSession()
+        
+        def save_session(self, app, session, response):
+            name = self.get_cookie_name(app)
+            domain = self.get_cookie_domain(app)
+            path = self.get_cookie_path(app)
+            
+            if not session:
+                if session.sid is not None and session.modified:
+                    store.delete(session.sid)
+                    response.delete_cookie(name, domain=domain, path=path)
+                return
+            
+            if not session.modified and not store.needs_refresh(session.sid):
+                return
+            
+            sid = session.sid or store.new_id()
+            expires_at = store.save(sid, dict(session))
+            response.set_cookie(
+                name, sid,
+                expires=datetime.fromtimestamp(expires_at, timezone.utc),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app)
+            )
+    
+    return StoreSessionInterface()
+
+@lru_cache(maxsize=None)
+def _load_brotli():
+    """Return the brotli module if installed, else None"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+def _negotiate_encoding(brotli) -> Optional[str]:
+    """Best content coding the client accepts: br if available, then gzip"""
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+def compress_response(response, min_bytes: int = 1024, gzip_level: int = 6):
+    """Compress a buffered JSON response in place when the client accepts it"""
+    if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+            or 'Content-Encoding' in response.headers or response.mimetype != 'application/json'):
+        return
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    if len(body) < min_bytes:
+        return
+    brotli = _load_brotli()
+    encoding = _negotiate_encoding(brotli)
+    if encoding == 'br':
+        response.set_data(brotli.compress(body, quality=4))
+    elif encoding == 'gzip':
+        response.set_data(gzip.compress(body, compresslevel=gzip_level, mtime=0))
+    else:
+        return
+    response.headers['Content-Encoding'] = encoding
 
-def create_web_interface():
-    """Create optional web interface"""
-    if not WEB_AVAILABLE:
+class StaticPage:
+    """A pre-rendered page kept with precompressed variants and strong ETags
+    
+    Conditional requests that match the ETag of the variant they would
+    receive are answered with 304 and no body. If-None-Match uses weak
+    comparison, so a W/ prefix added by a proxy still matches.
+    """
+    
+    def __init__(self, html: str, max_age: int = 60):
+        import hashlib
+        body = html.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.max_age = max_age
+        self.brotli = _load_brotli()
+        self.variants: Dict[Optional[str], Tuple[bytes, str]] = {
+            None: (body, f'"{digest}"'),
+            'gzip': (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gzip"'),
+        }
+        if self.brotli is not None:
+            self.variants['br'] = (self.brotli.compress(body, quality=11), f'"{digest}-br"')
+    
+    def response(self):
+        encoding = _negotiate_encoding(self.brotli)
+        body, etag = self.variants[encoding]
+        headers = {
+            'ETag': etag,
+            'Cache-Control': f'public, max-age={self.max_age}',
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding is not None:
+            headers['Content-Encoding'] = encoding
+        if request.if_none_match.contains_weak(etag.strip('"')):
+            return Response(status=304, headers=headers)
+        return Response(body, mimetype='text/html', headers=headers)
+
+def create_web_interface(max_in_flight: Optional[int] = None):
+    """Create optional web interface
+    
+    `max_in_flight` overrides MAX_IN_FLIGHT_OPERATIONS; a server with a fixed
+    thread pool passes its thread count so the limit can actually be reached.
+    """
+    if not load_web():
         return None
     
     app = Flask(__name__)
-    app.secret_key = config.SECRET_KEY
+    app.secret_key = config.secret_key()
+    app.session_interface = create_session_interface(get_session_store())
+    app.json = create_json_provider(app)
     
-    db = DatabaseManager(config.DATABASE_FILE)
+    db = get_database()
     executor = SecureCommandExecutor(db)
     monitor = SystemHealthMonitor()
+    analytics = OperationAnalytics(db)
+    limiter = RateLimiter(
+        config.RATE_LIMIT_CLIENT_PER_SECOND, config.RATE_LIMIT_CLIENT_BURST,
+        config.RATE_LIMIT_GLOBAL_PER_SECOND, config.RATE_LIMIT_GLOBAL_BURST,
+        max_clients=config.RATE_LIMIT_MAX_CLIENTS
+    )
+    admission = AdmissionController(
+        max_in_flight or config.MAX_IN_FLIGHT_OPERATIONS, config.ADMISSION_QUEUE_SIZE,
+        config.ADMISSION_QUEUE_TIMEOUT_SECONDS
+    )
+    
+    def admit(cost: int = 1):
+        """Return a rejection response, or None once the request holds an in-flight slot"""
+        retry_after, reason = limiter.check(request.remote_addr or 'unknown', cost)
+        status = 429
+        if reason is None:
+            reason = admission.acquire()
+            if reason is None:
+                return None
+            # Overload rather than client misbehaviour
+            retry_after, status = admission.queue_timeout, 503
+        
+        requests_shed_total.inc(reason)
+        response = jsonify({
+            'error': 'Too many requests' if status == 429 else 'Server busy',
+            'reason': reason,
+            'retry_after': None if math.isinf(retry_after) else round(retry_after, 3)
+        })
+        response.status_code = status
+        if not math.isinf(retry_after):
+            response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+    
+    # The page only depends on startup configuration: render and compress it once
+    page = StaticPage(app.jinja_env.from_string(WEB_TEMPLATE).render(config=config),
+                      max_age=config.WEB_PAGE_MAX_AGE_SECONDS)
     
     @app.route('/')
     def index():
-        return render_template_string(WEB_TEMPLATE)
+        return page.response()
+    
+    @app.after_request
+    def compress_api_response(response):
+        if request.path.startswith('/api/'):
+            compress_response(response, config.WEB_COMPRESS_MIN_BYTES, config.WEB_GZIP_LEVEL)
+        return response
     
     @app.route('/api/execute', methods=['POST'])
     def api_execute():
@@ -674,22 +4392,413 @@ def create_web_interface():
         if not data or 'operation' not in data:
             return jsonify({'error': 'Operation required'}), 400
         
-        monitor.increment_operations()
-        result = executor.execute_operation(data['operation'])
+        rejection = admit()
+        if rejection is not None:
+            return rejection
+        try:
+            result = executor.execute_operation(data['operation'])
+        finally:
+            admission.release()
+        return jsonify(result)
+    
+    @app.route('/api/execute/stream', methods=['GET', 'POST'])
+    def api_execute_stream():
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            operation = data.get('operation')
+        else:
+            operation = request.args.get('operation')
+        if not operation:
+            return jsonify({'error': 'Operation required'}), 400
+        if request.method == 'GET':
+            # GET is for EventSource clients; it must not be able to change anything
+            spec = executor.registry.get(split_operation(operation)[0])
+            if spec is None or not spec.idempotent:
+                response = jsonify({'error': 'Only idempotent operations can be streamed with GET; use POST'})
+                response.headers['Allow'] = 'POST'
+                return response, 405
+        
+        rejection = admit()
+        if rejection is not None:
+            return rejection
         
-        if result['status'] == 'error':
-            monitor.increment_errors()
+        def events():
+            for event in executor.stream_operation(operation):
+                name = event.pop('event')
+                yield f"event: {name}\ndata: {json_dumps(event)}\n\n"
         
-        return jsonify(result)
+        response = Response(events(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+        # The slot is held until the stream ends or the client goes away
+        response.call_on_close(admission.release)
+        return response
+    
+    @app.route('/api/execute/batch', methods=['POST'])
+    def api_execute_batch():
+        data = request.get_json(silent=True)
+        operations = data.get('operations') if isinstance(data, dict) else None
+        if not isinstance(operations, list) or not operations:
+            return jsonify({'error': 'operations must be a non-empty list'}), 400
+        if not all(isinstance(op, str) for op in operations):
+            return jsonify({'error': 'every operation must be a string'}), 400
+        if len(operations) > config.BATCH_MAX_OPERATIONS:
+            return jsonify({'error': f'at most {config.BATCH_MAX_OPERATIONS} operations per batch'}), 400
+        
+        rejection = admit(cost=len(operations))
+        if rejection is not None:
+            return rejection
+        
+        start_time = time.time()
+        try:
+            results = executor.execute_batch(operations)
+        finally:
+            admission.release()
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'errors': sum(1 for r in results if r['status'] == 'error'),
+            'duration_ms': int((time.time() - start_time) * 1000)
+        })
     
     @app.route('/api/status')
     def api_status():
         return jsonify(monitor.get_system_info())
     
+    @app.route('/api/timeseries')
+    def api_timeseries():
+        sampler = get_resource_sampler()
+        if not sampler.available:
+            return jsonify({'error': 'Resource sampling unavailable (psutil not installed)'}), 503
+        try:
+            since = float(request.args['since']) if 'since' in request.args else None
+            limit = int(request.args['limit']) if 'limit' in request.args else None
+        except ValueError:
+            return jsonify({'error': 'since must be a unix timestamp and limit an integer'}), 400
+        
+        return jsonify({
+            'interval_seconds': sampler.interval_seconds,
+            'capacity': sampler.capacity,
+            'series': sampler.series(since, limit)
+        })
+    
+    @app.route('/metrics')
+    def prometheus_metrics():
+        return Response(metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+    
+    @app.route('/api/stats')
+    def api_stats():
+        try:
+            window = int(request.args.get('window', 3600))
+            bucket = int(request.args.get('bucket', 300))
+        except ValueError:
+            return jsonify({'error': 'window and bucket must be integers (seconds)'}), 400
+        if window <= 0 or bucket <= 0:
+            return jsonify({'error': 'window and bucket must be positive'}), 400
+        
+        return jsonify(analytics.stats(window, bucket, request.args.get('operation')))
+    
     return app
 
+def _make_pooled_server(host: str, port: int, app, threads: int, client_timeout: float,
+                        queue_timeout: float = 2.0, fd: Optional[int] = None):
+    """Build a werkzeug server that handles connections on a fixed pool of worker threads
+    
+    Connections wait in the pool's queue while every thread is busy. One
+    that waited longer than `queue_timeout` is answered 503 with
+    Retry-After instead of being passed to `app`.
+    """
+    from werkzeug.serving import ThreadedWSGIServer, WSGIRequestHandler
+    
+    shed_body = json_dumpb({
+        'error': 'Server busy', 'reason': 'connection_queue_timeout', 'retry_after': round(queue_timeout, 3)
+    })
+    shed_headers = [
+        ('Content-Type', 'application/json'),
+        ('Content-Length', str(len(shed_body))),
+        ('Retry-After', str(max(1, math.ceil(queue_timeout)))),
+    ]
+    local = threading.local()
+    
+    def dispatch(environ, start_response):
+        if local.shed:
+            start_response('503 SERVICE UNAVAILABLE', shed_headers)
+            return [shed_body]
+        return app(environ, start_response)
+    
+    class PooledRequestHandler(WSGIRequestHandler):
+        # HTTP/1.1 for chunked streaming responses; werkzeug still closes
+        # the connection after each response
+        protocol_version = "HTTP/1.1"
+        # A client that stalls while sending its request gives its worker back after this long
+        timeout = client_timeout
+    
+    class PooledWSGIServer(ThreadedWSGIServer):
+        def __init__(self):
+            self.pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="http-worker")
+            super().__init__(host, port, dispatch, handler=PooledRequestHandler, fd=fd)
+        
+        def process_request(self, request, client_address):
+            self.pool.submit(self._process_queued, request, client_address, time.monotonic())
+        
+        def _process_queued(self, request, client_address, accepted: float):
+            local.shed = time.monotonic() - accepted > queue_timeout
+            if local.shed:
+                requests_shed_total.inc('connection_queue_timeout')
+            self.process_request_thread(request, client_address)
+        
+        def drain(self):
+            """Wait for queued and in-flight requests once serve_forever has returned"""
+            self.pool.shutdown(wait=True)
+    
+    return PooledWSGIServer()
+
+class LauncherWebServer:
+    """Production serving mode: pre-forked worker processes, each with a thread pool
+    
+    With one worker the server runs in the current process. With more, the
+    parent binds the socket, forks the workers, restarts any that die and
+    forwards SIGTERM/SIGINT to them for a graceful shutdown.
+    Workers send their log records to the parent, which alone writes and
+    rotates the log files.
+    """
+    
+    RESPAWN_MIN_UPTIME_SECONDS = 1.0
+    MAX_FAST_RESPAWNS = 5
+    
+    def __init__(self, host: str, port: int, workers: int = 1, threads: int = 8,
+                 client_timeout: float = 5.0, shutdown_timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.threads = max(1, threads)
+        self.client_timeout = client_timeout
+        self.shutdown_timeout = shutdown_timeout
+        
+        self._children: Dict[int, float] = {}
+        self._stopping = False
+        self._fast_respawns = 0
+        # Parent ends of the workers' log sockets and the threads reading them
+        self._log_readers: List[Tuple[socket.socket, threading.Thread]] = []
+    
+    def serve(self) -> int:
+        logger.info(
+            "Starting web interface on http://%s:%s (%s worker(s) x %s thread(s))",
+            self.host, self.port, self.workers, self.threads
+        )
+        if self.workers == 1 or not hasattr(os, 'fork'):
+            return self._serve_worker()
+        # Generated before forking so every worker signs with the same key
+        config.secret_key()
+        return self._serve_prefork()
+    
+    def _serve_worker(self, fd: Optional[int] = None) -> int:
+        # Requests beyond the thread count wait in the server's queue rather
+        # than in admission control, so the in-flight limit must fit the pool
+        app = create_web_interface(max_in_flight=min(config.MAX_IN_FLIGHT_OPERATIONS, self.threads))
+        server = _make_pooled_server(
+            self.host, self.port, app, self.threads, self.client_timeout,
+            queue_timeout=config.ADMISSION_QUEUE_TIMEOUT_SECONDS, fd=fd
+        )
+        
+        def request_stop(signum, frame):
+            # shutdown() blocks until serve_forever returns, so it needs its own thread
+            threading.Thread(target=server.shutdown, name="http-shutdown", daemon=True).start()
+        
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        server.serve_forever()
+        # The listening socket is closed by now; finish what was already accepted
+        server.drain()
+        logger.info("Web worker %s stopped", os.getpid())
+        return 0
+    
+    def _serve_prefork(self) -> int:
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        listener = socket.create_server((self.host, self.port), family=family, backlog=128)
+        listener.set_inheritable(True)
+        
+        def request_stop(signum, frame):
+            if self._stopping:
+                return
+            self._stopping = True
+            self._signal_children(signal.SIGTERM)
+            killer = threading.Timer(self.shutdown_timeout, self._signal_children, (signal.SIGKILL,))
+            killer.daemon = True
+            killer.start()
+        
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        
+        try:
+            for _ in range(self.workers):
+                self._spawn(listener)
+            
+            while self._children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                started = self._children.pop(pid, None)
+                if started is None or self._stopping:
+                    continue
+                
+                logger.warning("Web worker %s exited with status %s; restarting", pid, status)
+                if time.time() - started < self.RESPAWN_MIN_UPTIME_SECONDS:
+                    self._fast_respawns += 1
+                    if self._fast_respawns > self.MAX_FAST_RESPAWNS:
+                        logger.error("Web workers keep exiting at startup; shutting down")
+                        request_stop(None, None)
+                        continue
+                self._spawn(listener)
+        finally:
+            listener.close()
+            # Let the readers log what the workers sent before exiting
+            for _, reader in self._log_readers:
+                reader.join(self.shutdown_timeout)
+        return 0
+    
+    def _spawn(self, listener: socket.socket):
+        # Workers send their log records here; only this process writes,
+        # rotates and archives the log files
+        parent_end, child_end = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            parent_end.close()
+            for other_end, _ in self._log_readers:
+                other_end.close()
+            logger.forward_to(child_end)
+            code = 1
+            try:
+                code = self._serve_worker(fd=listener.fileno())
+            except Exception as e:
+                logger.error("Web worker %s failed: %s", os.getpid(), e)
+            finally:
+                shutdown_services()
+                logger.close()
+                os._exit(code)
+        child_end.close()
+        self._children[pid] = time.time()
+        self._log_readers = [(end, reader) for end, reader in self._log_readers if reader.is_alive()]
+        self._log_readers.append((parent_end, logger.receive_from(parent_end)))
+    
+    def _signal_children(self, signum: int):
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+def parse_web_options(argv: List[str]) -> 'argparse.Namespace':
+    """Parse the options that follow --web"""
+    import argparse
+    parser = argparse.ArgumentParser(prog="06-launcherplus.py --web", add_help=False)
+    parser.add_argument('--host', default=config.WEB_HOST)
+    parser.add_argument('--port', type=int, default=config.WEB_PORT)
+    parser.add_argument('--workers', type=int, default=config.WEB_WORKERS)
+    parser.add_argument('--threads', type=int, default=config.WEB_THREADS)
+    parser.add_argument('--dev', action='store_true')
+    return parser.parse_args(argv)
+
+class LauncherDaemon:
+    """Keeps one warm executor serving operations over a Unix domain socket
+    
+    Each request is a JSON line such as {"operation": "status"}. The reply is
+    the operation's stream_operation events, one JSON object per line, ending
+    with the 'done' event; a connection may carry any number of requests.
+    The socket is only accessible to the user running the daemon.
+    """
+    
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+    
+    def _claim_socket(self):
+        """Remove a stale socket file, refusing to replace a live daemon"""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+        else:
+            raise RuntimeError(f"Launcher daemon already listening on {self.socket_path}")
+        finally:
+            probe.close()
+    
+    def serve(self) -> int:
+        import socketserver
+        
+        self._claim_socket()
+        executor = SecureCommandExecutor(get_database())
+        # Warm the background services so the first status/health call is cheap
+        get_health_service()
+        get_resource_sampler()
+        
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    line = self.rfile.readline(config.MAX_COMMAND_LENGTH + 1024)
+                    if not line:
+                        return
+                    try:
+                        operation = json_loads(line)['operation']
+                        if not isinstance(operation, str):
+                            raise TypeError("operation must be a string")
+                    except (ValueError, KeyError, TypeError) as e:
+                        self._send({'event': 'done', 'status': 'error',
+                                    'message': f'Invalid request: {e}', 'duration_ms': 0})
+                        continue
+                    
+                    events = executor.stream_operation(operation)
+                    try:
+                        for event in events:
+                            self._send(event)
+                    except OSError:
+                        # Client went away mid-stream; records the operation as cancelled
+                        events.close()
+                        return
+            
+            def _send(self, event: Dict):
+                self.wfile.write(json_dumpb(event) + b'\n')
+        
+        # Bind under a restrictive umask: chmod after bind would leave a window
+        # in which other local users could connect to the command socket
+        previous_umask = os.umask(0o177)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        server.daemon_threads = True
+        
+        def request_stop(signum, frame):
+            threading.Thread(target=server.shutdown, name="daemon-shutdown", daemon=True).start()
+        
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        logger.info("Launcher daemon listening on %s", self.socket_path)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+        logger.info("Launcher daemon stopped")
+        return 0
+
+def parse_daemon_options(argv: List[str]) -> 'argparse.Namespace':
+    """Parse the options that follow --daemon"""
+    import argparse
+    parser = argparse.ArgumentParser(prog="06-launcherplus.py --daemon", add_help=False)
+    parser.add_argument('--socket', type=Path, default=config.DAEMON_SOCKET_PATH)
+    return parser.parse_args(argv)
+
 # Simple web template
-WEB_TEMPLATE = """
+WEB_TEMPLATE = r"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -708,7 +4817,7 @@ WEB_TEMPLATE = """
 <body>
     <div class="container">
         <div class="header">
-            <h1>Cursor Bundle Launcher Pro</h1>
+            <h1>{{ config.APP_NAME }}</h1>
             <p>Professional Web Interface</p>
         </div>
         <div class="input-group">
@@ -723,19 +4832,50 @@ WEB_TEMPLATE = """
             const operation = document.getElementById('operation').value;
             if (!operation) return;
             
-            fetch('/api/execute', {
+            const output = document.getElementById('output');
+            const header = document.createTextNode(`Operation: ${operation}\nStatus: running\n${'='.repeat(50)}\n`);
+            const body = document.createTextNode('');
+            output.replaceChildren(header, body);
+            document.getElementById('operation').value = '';
+            
+            // Server-Sent Events over a POST body, parsed from the response stream
+            fetch('/api/execute/stream', {
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
                 body: JSON.stringify({operation: operation})
             })
-            .then(response => response.json())
-            .then(data => {
-                document.getElementById('output').textContent = 
-                    `Operation: ${operation}\\nStatus: ${data.status}\\nDuration: ${data.duration_ms}ms\\n${'='.repeat(50)}\\n${data.output}`;
-                document.getElementById('operation').value = '';
+            .then(async response => {
+                if (!response.ok) {
+                    const error = await response.json().catch(() => ({}));
+                    const retry = response.headers.get('Retry-After');
+                    header.data = `Operation: ${operation}\nStatus: ${error.error || response.status}\n${'='.repeat(50)}\n`;
+                    body.appendData(retry ? `Retry in ${retry}s` : '');
+                    return;
+                }
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const {value, done} = await reader.read();
+                    if (done) break;
+                    buffer += decoder.decode(value, {stream: true});
+                    let boundary;
+                    while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+                        const frame = buffer.slice(0, boundary);
+                        buffer = buffer.slice(boundary + 2);
+                        const name = (frame.match(/^event: (.*)$/m) || [])[1];
+                        const data = JSON.parse((frame.match(/^data: (.*)$/m) || [])[1] || '{}');
+                        if (name === 'chunk') {
+                            body.appendData(data.data);
+                        } else if (name === 'done') {
+                            header.data = `Operation: ${operation}\nStatus: ${data.status}\nDuration: ${data.duration_ms}ms\n${'='.repeat(50)}\n`;
+                            if (data.status === 'error') body.appendData(data.message);
+                        }
+                    }
+                }
             })
             .catch(error => {
-                document.getElementById('output').textContent = `Error: ${error}`;
+                output.textContent = `Error: ${error}`;
             });
         }
         
@@ -747,89 +4887,139 @@ WEB_TEMPLATE = """
 </html>
 """
 
+def print_help():
+    """Print command line usage"""
+    print(f"{config.APP_NAME} v{config.VERSION} - Professional Launcher")
+    print()
+    print("USAGE:")
+    print("    python 06-launcherplus-improved-v2.py [OPTIONS]")
+    print()
+    print("OPTIONS:")
+    print("    --gui      Launch GUI interface (default)")
+    print("    --web      Launch web interface on localhost:8080")
+    print("    --cli      Launch command line interface")
+    print("    --daemon   Serve operations on a Unix socket for 06-launcherplus-client.py")
+    print("    --help     Show this help message")
+    print()
+    print("WEB OPTIONS (after --web):")
+    print("    --host HOST       Bind address (default 127.0.0.1)")
+    print("    --port PORT       Bind port (default 8080)")
+    print("    --workers N       Worker processes (default 1)")
+    print("    --threads N       Request threads per worker (default 8)")
+    print("    --dev             Use the Flask development server")
+    print()
+    print("DAEMON OPTIONS (after --daemon):")
+    print(f"    --socket PATH     Socket path (default {config.DAEMON_SOCKET_PATH})")
+    print()
+    print("ENVIRONMENT:")
+    print(f"    LAUNCHER_DATA_DIR     Logs, database and daemon socket (default {DATA_DIR})")
+    print("    LAUNCHER_SECRET_KEY   Session signing key shared by all processes")
+    print()
+    print("EXAMPLES:")
+    print("    python 06-launcherplus-improved-v2.py")
+    print("    python 06-launcherplus-improved-v2.py --web")
+    print("    python 06-launcherplus-improved-v2.py --web --host 0.0.0.0 --workers 4")
+    print("    python 06-launcherplus-improved-v2.py --cli")
+    print("    python 06-launcherplus-improved-v2.py --daemon &")
+    print("    python 06-launcherplus-client.py status")
+    print()
+
+def run_cli():
+    """Interactive command line mode"""
+    db = get_database()
+    executor = SecureCommandExecutor(db)
+    
+    print(f"{config.APP_NAME} v{config.VERSION} - CLI Mode")
+    print("Type 'help' for available operations, 'exit' to quit.")
+    
+    while True:
+        try:
+            operation = input("\n> ").strip()
+            if operation.lower() in ['exit', 'quit']:
+                break
+            if operation:
+                print("=" * 50)
+                events = executor.stream_operation(operation)
+                try:
+                    for event in events:
+                        if event['event'] == 'chunk':
+                            print(event['data'], end='', flush=True)
+                        else:
+                            result = event
+                except KeyboardInterrupt:
+                    # Ends a `logs follow` without leaving the CLI
+                    result = {'status': 'cancelled', 'duration_ms': 0}
+                print(f"\n{'=' * 50}")
+                print(f"Status: {result['status']}")
+                if result['status'] == 'error':
+                    print(f"Message: {result['message']}")
+                print(f"Duration: {result['duration_ms']}ms")
+        except (KeyboardInterrupt, EOFError):
+            break
+        except Exception as e:
+            print(f"Error: {e}")
+    
+    print("\nGoodbye!")
+
 def main():
     """Main application entry point"""
+    # Arguments are handled before anything is logged, so --help and usage
+    # errors never open log files, the database or the GUI/web toolkits
+    mode = sys.argv[1] if len(sys.argv) > 1 else '--gui'
+    if mode in ['--help', '-h', 'help']:
+        print_help()
+        sys.exit(0)
+    if mode not in ['--gui', '--web', '--cli', '--daemon']:
+        print(f"Unknown option: {mode}")
+        print("Usage: python 06-launcherplus-improved-v2.py [--gui|--web|--cli|--daemon|--help]")
+        sys.exit(1)
+    
+    web_options = parse_web_options(sys.argv[2:]) if mode == '--web' else None
+    daemon_options = parse_daemon_options(sys.argv[2:]) if mode == '--daemon' else None
+    if mode == '--web' and not load_web():
+        print("Web interface not available")
+        sys.exit(1)
+    if mode == '--gui' and not load_gui():
+        print("GUI not available. Use --cli for command line mode or --web for web interface.")
+        sys.exit(1)
+    
     try:
-        logger.info(f"Starting {config.APP_NAME} v{config.VERSION}")
-        logger.info(f"Bundle directory: {config.BUNDLE_DIR}")
+        logger.info("Starting %s v%s", config.APP_NAME, config.VERSION)
+        logger.info("Bundle directory: %s", config.BUNDLE_DIR)
         logger.audit("APPLICATION_START", f"Version {config.VERSION}")
         
-        # Check command line arguments
-        if len(sys.argv) > 1:
-            if sys.argv[1] in ['--help', '-h', 'help']:
-                # Help option
-                print(f"{config.APP_NAME} v{config.VERSION} - Professional Launcher")
-                print()
-                print("USAGE:")
-                print("    python 06-launcherplus-improved-v2.py [OPTIONS]")
-                print()
-                print("OPTIONS:")
-                print("    --gui      Launch GUI interface (default)")
-                print("    --web      Launch web interface on localhost:8080")
-                print("    --cli      Launch command line interface")
-                print("    --help     Show this help message")
-                print()
-                print("EXAMPLES:")
-                print("    python 06-launcherplus-improved-v2.py")
-                print("    python 06-launcherplus-improved-v2.py --web")
-                print("    python 06-launcherplus-improved-v2.py --cli")
-                print()
-                sys.exit(0)
-            elif sys.argv[1] == '--web':
-                # Web interface mode
+        if mode == '--web':
+            if web_options.dev:
+                # Flask development server, kept for debugging and comparison
                 web_app = create_web_interface()
-                if web_app:
-                    logger.info("Starting web interface on http://localhost:8080")
-                    web_app.run(host='127.0.0.1', port=8080, debug=False)
-                else:
-                    print("Web interface not available")
-                    sys.exit(1)
-            elif sys.argv[1] == '--cli':
-                # CLI mode
-                db = DatabaseManager(config.DATABASE_FILE)
-                executor = SecureCommandExecutor(db)
-                
-                print(f"{config.APP_NAME} v{config.VERSION} - CLI Mode")
-                print("Type 'help' for available operations, 'exit' to quit.")
-                
-                while True:
-                    try:
-                        operation = input("\n> ").strip()
-                        if operation.lower() in ['exit', 'quit']:
-                            break
-                        if operation:
-                            result = executor.execute_operation(operation)
-                            print(f"\nStatus: {result['status']}")
-                            print(f"Duration: {result['duration_ms']}ms")
-                            print("=" * 50)
-                            print(result['output'])
-                    except KeyboardInterrupt:
-                        break
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                print("\nGoodbye!")
+                logger.info("Starting development web server on http://%s:%s", web_options.host, web_options.port)
+                web_app.run(host=web_options.host, port=web_options.port, debug=False)
             else:
-                print(f"Unknown option: {sys.argv[1]}")
-                print("Usage: python 06-launcherplus-improved-v2.py [--gui|--web|--cli|--help]")
-                sys.exit(1)
+                LauncherWebServer(
+                    web_options.host, web_options.port,
+                    workers=web_options.workers,
+                    threads=web_options.threads,
+                    client_timeout=config.WEB_CLIENT_TIMEOUT_SECONDS,
+                    shutdown_timeout=config.WEB_SHUTDOWN_TIMEOUT_SECONDS
+                ).serve()
+        elif mode == '--cli':
+            run_cli()
+        elif mode == '--daemon':
+            LauncherDaemon(daemon_options.socket).serve()
         else:
-            # Default GUI mode
-            if GUI_AVAILABLE:
-                gui = ProfessionalGUI()
-                gui.run()
-            else:
-                print("GUI not available. Use --cli for command line mode or --web for web interface.")
-                sys.exit(1)
+            gui = ProfessionalGUI()
+            gui.run()
     
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         logger.error(traceback.format_exc())
         sys.exit(1)
     finally:
+        shutdown_services()
         logger.audit("APPLICATION_STOP")
+        logger.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
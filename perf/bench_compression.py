@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Bytes on the wire and requests/sec for the web UI page and JSON API.
+
+Drives the Flask app in-process through its test client, so requests/sec
+is server-side handling cost without socket overhead. Each row pairs a
+"before" request (uncompressed, unconditional, or the page re-rendered per
+request as the / route used to) with the "after" request a browser makes
+now. Usage:
+
+    python perf/bench_compression.py [--seconds 2]
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, Optional
+
+from benchlib import load_launcher, print_table
+
+IDENTITY = {'Accept-Encoding': 'identity'}
+BROWSER = {'Accept-Encoding': 'gzip, deflate, br'}
+
+
+def wire_bytes(response) -> int:
+    """Status line, headers and body as they would be sent over HTTP/1.1"""
+    headers = sum(len(name) + len(value) + 4 for name, value in response.headers.items())
+    return len(f"HTTP/1.1 {response.status}\r\n\r\n") + headers + len(response.get_data())
+
+
+def measure(client, seconds: float, method: str, path: str, headers: Dict[str, str],
+            json_body: Optional[Dict] = None) -> Dict[str, object]:
+    send = client.post if method == 'POST' else client.get
+    response = send(path, headers=headers, json=json_body)
+    count, end = 0, time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < end:
+        send(path, headers=headers, json=json_body)
+        count += 1
+    return {
+        'status': response.status_code,
+        'encoding': response.headers.get('Content-Encoding', '-'),
+        'wire_bytes': wire_bytes(response),
+        'requests_per_sec': count / (time.perf_counter() - start),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    # Measure handling cost, not the rate limiter
+    launcher.config.RATE_LIMIT_CLIENT_PER_SECOND = 0
+    launcher.config.RATE_LIMIT_GLOBAL_PER_SECOND = 0
+    app = launcher.create_web_interface()
+    if app is None:
+        print("Flask is not available")
+        return 2
+
+    import flask
+
+    @app.route('/bench/render-per-request')
+    def render_per_request():
+        return flask.render_template_string(launcher.WEB_TEMPLATE, config=launcher.config)
+
+    client = app.test_client()
+    etag = client.get('/', headers=BROWSER).headers['ETag']
+    logs = {'operation': 'logs lines=500'}
+    scenarios = [
+        ('page', 'before: rendered per request', 'GET', '/bench/render-per-request', IDENTITY, None),
+        ('page', 'after: first visit', 'GET', '/', BROWSER, None),
+        ('page', 'after: revalidation', 'GET', '/', dict(BROWSER, **{'If-None-Match': etag}), None),
+        ('logs lines=500', 'before: identity', 'POST', '/api/execute', IDENTITY, logs),
+        ('logs lines=500', 'after: compressed', 'POST', '/api/execute', BROWSER, logs),
+        ('/api/status', 'before: identity', 'GET', '/api/status', IDENTITY, None),
+        ('/api/status', 'after: compressed', 'GET', '/api/status', BROWSER, None),
+    ]
+
+    rows = []
+    for target, variant, method, path, headers, body in scenarios:
+        rows.append(dict(target=target, variant=variant,
+                         **measure(client, args.seconds, method, path, headers, body)))
+    launcher.shutdown_services()
+
+    print_table(f"Bytes on the wire and requests/sec, {args.seconds:g}s per row", rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Concurrent writer benchmark for DatabaseManager.log_operation.
+
+Compares the original per-call connection (rollback journal, one connect per
+insert) with the pooled WAL connections, synchronous and write-behind. Usage:
+
+    python perf/bench_database.py [--threads 8] [--ops 500]
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchlib import load_launcher, print_table
+
+
+def legacy_log_operation(db_path: Path, operation: str, status: str, details: str, duration_ms: int):
+    """The pre-pool implementation: connect, insert, commit, close"""
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    try:
+        conn.execute(
+            "INSERT INTO operations_log (operation, status, details, duration_ms) VALUES (?, ?, ?, ?)",
+            (operation, status, details, duration_ms)
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run_writers(write, threads: int, ops: int, flush=None) -> float:
+    """Run `threads` writers issuing `ops` inserts each; return ops/sec"""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for i in range(ops):
+            write('status', 'success', '', i)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    if flush is not None:
+        flush()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--ops', type=int, default=500)
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = Path(tmp) / 'legacy.db'
+        schema = launcher.DatabaseManager(legacy_db)
+        schema.close()
+        with sqlite3.connect(str(legacy_db)) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        rate = run_writers(
+            lambda *row: legacy_log_operation(legacy_db, *row), args.threads, args.ops
+        )
+        rows.append({'mode': 'per-call connect (before)', 'threads': args.threads, 'ops_per_sec': rate})
+
+        pooled = launcher.DatabaseManager(Path(tmp) / 'pooled.db')
+        rate = run_writers(pooled.log_operation, args.threads, args.ops)
+        pooled.close()
+        rows.append({'mode': 'WAL connection pool', 'threads': args.threads, 'ops_per_sec': rate})
+
+        batched = launcher.DatabaseManager(Path(tmp) / 'batched.db', write_behind=True)
+        rate = run_writers(batched.log_operation, args.threads, args.ops, flush=batched.flush)
+        batched.close()
+        rows.append({'mode': 'WAL pool + write-behind', 'threads': args.threads, 'ops_per_sec': rate})
+
+    print_table("operations_log concurrent writers", rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tk event-loop latency of the launcher GUI while operations run.
+
+Opens the ProfessionalGUI window, schedules a heartbeat every --tick-ms and
+records how late each one fires while a mix of slow and fast operations
+runs, including one that streams several megabytes of output: first on
+the GUI worker pool, then inline on the main thread for comparison.
+Then leaves the dashboard tab open with no operations and reports the
+process CPU it costs. Exits non-zero when the worker-pool run misses a
+heartbeat by more than --max-lag-ms or the idle dashboard uses more than
+--max-dashboard-cpu percent. Needs a display (use xvfb-run on headless
+hosts). Usage:
+
+    python perf/bench_gui.py [--seconds 3] [--tick-ms 10] [--max-lag-ms 50]
+                             [--dashboard-seconds 10] [--max-dashboard-cpu 3]
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from benchlib import load_launcher, percentile, print_table
+
+OPERATIONS = ['bench_slow', 'status', 'bench_large', 'check', 'info', 'health', 'help']
+
+
+def slow_stream(executor):
+    """A streaming operation that blocks its thread between chunks"""
+    for index in range(10):
+        time.sleep(0.05)
+        yield f"chunk {index}\n" * 200
+
+
+def large_stream(executor):
+    """About 5 MB of output in 64 KB chunks, far beyond the output pane's line cap"""
+    line = "x" * 63 + "\n"
+    for _ in range(80):
+        yield line * 1024
+
+
+def measure(gui, seconds: float, tick_ms: int, run_operation) -> Dict[str, float]:
+    """Keep operations running for `seconds` and return heartbeat lateness stats"""
+    lags: List[float] = []
+    end = time.perf_counter() + seconds
+    state = {'expected': time.perf_counter() + tick_ms / 1000, 'next_op': 0}
+
+    def heartbeat():
+        now = time.perf_counter()
+        lags.append((now - state['expected']) * 1000)
+        if now >= end:
+            gui.root.quit()
+            return
+        state['expected'] = now + tick_ms / 1000
+        gui.root.after(tick_ms, heartbeat)
+
+    def feed():
+        if time.perf_counter() >= end:
+            return
+        run_operation(OPERATIONS[state['next_op'] % len(OPERATIONS)])
+        state['next_op'] += 1
+        gui.root.after(100, feed)
+
+    gui.root.after(tick_ms, heartbeat)
+    gui.root.after(0, feed)
+    gui.root.mainloop()
+    return {
+        'operations': state['next_op'],
+        'ticks': len(lags),
+        'p50_lag_ms': percentile(lags, 50),
+        'p99_lag_ms': percentile(lags, 99),
+        'max_lag_ms': max(lags, default=0.0),
+    }
+
+
+def measure_dashboard(gui, seconds: float) -> Dict[str, float]:
+    """Show the dashboard tab for `seconds` and return the process CPU it used"""
+    gui.notebook.select(gui.dashboard.canvas)
+    gui.root.after(int(seconds * 1000), gui.root.quit)
+    wall, cpu = time.perf_counter(), time.process_time()
+    gui.root.mainloop()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return {'seconds': wall, 'cpu_percent': cpu / wall * 100}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--tick-ms', type=int, default=10)
+    parser.add_argument('--max-lag-ms', type=float, default=50.0)
+    parser.add_argument('--dashboard-seconds', type=float, default=10.0)
+    parser.add_argument('--max-dashboard-cpu', type=float, default=3.0)
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    if not launcher.load_gui():
+        print("tkinter is not available")
+        return 2
+    launcher.operation_registry.register(launcher.OperationSpec(
+        'bench_slow', lambda executor: "".join(slow_stream(executor)), "Benchmark operation",
+        idempotent=True, stream=slow_stream
+    ))
+    launcher.operation_registry.register(launcher.OperationSpec(
+        'bench_large', lambda executor: "".join(large_stream(executor)), "Benchmark operation",
+        idempotent=True, stream=large_stream
+    ))
+    launcher.config.ALLOWED_OPERATIONS.extend(['bench_slow', 'bench_large'])
+
+    try:
+        gui = launcher.ProfessionalGUI()
+    except launcher.tk.TclError as e:
+        print(f"Cannot open a display: {e}")
+        return 2
+
+    def pooled(operation):
+        gui.operation_var.set(operation)
+        gui.execute_operation()
+
+    def inline(operation):
+        gui.executor.execute_operation(operation)
+
+    rows = []
+    for mode, run_operation in (('worker pool', pooled), ('main thread', inline)):
+        rows.append(dict(mode=mode, **measure(gui, args.seconds, args.tick_ms, run_operation)))
+    # Let cancelled and queued operations drain before measuring the idle dashboard
+    gui.root.after(2000, gui.root.quit)
+    gui.root.mainloop()
+    dashboard = measure_dashboard(gui, args.dashboard_seconds)
+    gui.dashboard.stop()
+    gui.workers.close()
+    gui.root.destroy()
+    launcher.shutdown_services()
+
+    print_table(f"Event-loop heartbeat lateness, {args.tick_ms}ms ticks", rows)
+    print_table("Idle dashboard cost", [dashboard])
+    failures = []
+    if rows[0]['max_lag_ms'] > args.max_lag_ms:
+        failures.append(f"worker pool: max lag {rows[0]['max_lag_ms']:.1f}ms exceeds {args.max_lag_ms:.0f}ms")
+    if dashboard['cpu_percent'] > args.max_dashboard_cpu:
+        failures.append(f"dashboard: {dashboard['cpu_percent']:.1f}% CPU exceeds {args.max_dashboard_cpu:.0f}%")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON encoding cost of the launcher's hot payloads.
+
+Compares, per payload, stdlib json with indent=2 (what the health and
+config reports used), stdlib json as Flask's default provider configures
+it (compact, sorted keys) and the launcher's json_dumpb, which uses orjson
+when installed. Then times /api/status end to end with Flask's default
+JSON provider and with the launcher's. Usage:
+
+    python perf/bench_json.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+
+from benchlib import load_launcher, print_table, time_calls
+
+
+def build_payloads(launcher):
+    """The response and report bodies the launcher serializes most"""
+    executor = launcher.SecureCommandExecutor(launcher.get_database())
+    monitor = launcher.SystemHealthMonitor()
+    sampler = launcher.get_resource_sampler()
+    now = time.time()
+    points = sampler.capacity
+    return {
+        'execute result (info)': executor.execute_operation('info'),
+        'system info': monitor.get_system_info(),
+        'health report': monitor.perform_health_check(),
+        'config report': asdict(launcher.config),
+        'timeseries (full ring)': {
+            'interval_seconds': sampler.interval_seconds,
+            'capacity': points,
+            'series': {name: [now - i if name == 'timestamp' else i * 0.37 for i in range(points)]
+                       for name in sampler.FIELDS},
+        },
+        'batch results (50)': {
+            'results': [dict(executor.execute_operation('version'), index=i, operation='version')
+                        for i in range(launcher.config.BATCH_MAX_OPERATIONS)],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    backend = 'orjson' if launcher._load_orjson() is not None else 'stdlib json'
+    encoders = {
+        'stdlib indent=2': lambda value: json.dumps(value, indent=2, default=str).encode('utf-8'),
+        'stdlib flask default': lambda value: json.dumps(
+            value, separators=(',', ':'), sort_keys=True, default=str).encode('utf-8'),
+        f'json_dumpb ({backend})': launcher.json_dumpb,
+    }
+
+    rows = []
+    for payload_name, payload in build_payloads(launcher).items():
+        for encoder_name, encode in encoders.items():
+            stats = time_calls(lambda: encode(payload), args.iterations)
+            rows.append({'payload': payload_name, 'encoder': encoder_name,
+                         'bytes': len(encode(payload)), 'p50_us': stats['p50_us'],
+                         'p99_us': stats['p99_us']})
+    print_table(f"Encoding cost, {args.iterations} calls per row", rows)
+
+    # Rate limiting would throttle the loop below
+    launcher.config.RATE_LIMIT_CLIENT_PER_SECOND = 0
+    launcher.config.RATE_LIMIT_GLOBAL_PER_SECOND = 0
+    app = launcher.create_web_interface()
+    if app is not None:
+        from flask.json.provider import DefaultJSONProvider
+        client = app.test_client()
+        request_rows = []
+        for provider_name, provider in (('flask default', DefaultJSONProvider(app)),
+                                        (f'launcher ({backend})', launcher.create_json_provider(app))):
+            app.json = provider
+            stats = time_calls(lambda: client.get('/api/status'), args.iterations)
+            request_rows.append({'provider': provider_name, 'p50_us': stats['p50_us'],
+                                 'p99_us': stats['p99_us'],
+                                 'requests_per_sec': 1e6 / stats['mean_us']})
+        print_table("/api/status through the test client", request_rows)
+
+    launcher.shutdown_services()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
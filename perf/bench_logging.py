@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Per-call overhead benchmark for ProfessionalLogger.
+
+Measures the time a caller spends inside info()/audit()/debug() with the
+queue-based pipeline against the same handlers attached synchronously.
+Exits non-zero when the pipeline's p99 exceeds --max-p99-us. Usage:
+
+    python perf/bench_logging.py [--calls 20000] [--max-p99-us 50]
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from benchlib import load_launcher, print_table, time_calls
+
+
+def synchronous_logger(log_dir: Path) -> logging.Logger:
+    """The pre-queue setup: every handler runs on the calling thread"""
+    log = logging.getLogger("bench.sync")
+    log.setLevel(logging.DEBUG)
+    log.handlers.clear()
+    log.propagate = False
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+    )
+    for filename, level in (('launcher.log', logging.INFO), ('error.log', logging.ERROR)):
+        handler = logging.FileHandler(log_dir / filename)
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        log.addHandler(handler)
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(logging.INFO)
+    console.setFormatter(formatter)
+    log.addHandler(console)
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--max-p99-us', type=float, default=50.0)
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            sync_log = synchronous_logger(Path(tmp))
+            queued = launcher.ProfessionalLogger("bench.queued", log_dir=tmp, queue_size=args.calls * 4)
+
+            cases = [
+                ('sync', 'info', lambda: sync_log.info("operation %s finished", 'status')),
+                ('sync', 'debug', lambda: sync_log.debug("operation %s finished", 'status')),
+                ('queued', 'info', lambda: queued.info("operation %s finished", 'status')),
+                ('queued', 'audit', lambda: queued.audit("OPERATION_EXECUTED:status")),
+                ('queued', 'debug', lambda: queued.debug("operation %s finished", 'status')),
+            ]
+            for mode, call, func in cases:
+                stats = time_calls(func, args.calls)
+                rows.append({'pipeline': mode, 'call': call, **stats})
+            queued.close()
+            for handler in sync_log.handlers:
+                handler.close()
+
+    print_table("ProfessionalLogger per-call overhead (microseconds)", rows)
+
+    worst = max(r['p99_us'] for r in rows if r['pipeline'] == 'queued')
+    if worst > args.max_p99_us:
+        print(f"FAIL: queued p99 {worst:.1f}us exceeds cap of {args.max_p99_us:.1f}us")
+        return 1
+    print(f"OK: queued p99 {worst:.1f}us within cap of {args.max_p99_us:.1f}us")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Startup time of the launcher in its --help, --cli and --web modes.
+
+Reports the median wall-clock time per mode, the slowest top-level imports
+from -X importtime, and whether the GUI/web toolkits were imported. Also
+times a `status` call through 06-launcherplus-client.py against a warm
+--daemon. Exits non-zero when a median exceeds its target or --help/--cli
+import tkinter or Flask. Usage:
+
+    python perf/bench_startup.py [--runs 7] [--max-help-ms 200] [--max-cli-ms 300]
+                                 [--max-web-ms 1500] [--max-client-ms 60]
+"""
+
+import argparse
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchlib import LAUNCHER_PATH, print_table
+
+CLIENT_PATH = LAUNCHER_PATH.with_name("06-launcherplus-client.py")
+
+# Modules that only the GUI and web modes should pay for
+DEFERRED_MODULES = ('tkinter', 'flask', 'werkzeug', 'jinja2')
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run_exiting(args: List[str], stdin: bytes, importtime: bool = False) -> Tuple[float, str]:
+    """Run a mode that exits by itself; return (seconds, stderr)"""
+    command = [sys.executable, *(['-X', 'importtime'] if importtime else []), str(LAUNCHER_PATH), *args]
+    start = time.perf_counter()
+    proc = subprocess.run(command, input=stdin, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    return time.perf_counter() - start, proc.stderr.decode(errors='replace')
+
+
+def run_web(importtime: bool = False) -> Tuple[float, str]:
+    """Start --web and time until it accepts a connection; return (seconds, stderr)"""
+    port = free_port()
+    command = [sys.executable, *(['-X', 'importtime'] if importtime else []), str(LAUNCHER_PATH),
+               '--web', '--port', str(port)]
+    start = time.perf_counter()
+    proc = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        deadline = start + 20
+        while time.perf_counter() < deadline:
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=0.05):
+                    break
+            except OSError:
+                time.sleep(0.005)
+        else:
+            raise RuntimeError("web server did not start")
+        elapsed = time.perf_counter() - start
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            _, stderr = proc.communicate(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            _, stderr = proc.communicate()
+    return elapsed, stderr.decode(errors='replace')
+
+
+def run_client(socket_path: Path, importtime: bool = False) -> Tuple[float, str]:
+    """Time one `status` call through the thin client; return (seconds, stderr)"""
+    command = [sys.executable, *(['-X', 'importtime'] if importtime else []), str(CLIENT_PATH),
+               '--socket', str(socket_path), 'status']
+    start = time.perf_counter()
+    proc = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if proc.returncode != 0 and not importtime:
+        raise RuntimeError(f"client failed: {proc.stderr.decode(errors='replace')}")
+    return time.perf_counter() - start, proc.stderr.decode(errors='replace')
+
+
+def start_daemon(socket_path: Path) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, str(LAUNCHER_PATH), '--daemon', '--socket', str(socket_path)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        if socket_path.exists():
+            return proc
+        time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("daemon did not start")
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Top-level imports and their cumulative microseconds from -X importtime output"""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented below the top-level one that caused them
+        if not name[1:].startswith(' '):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def imported_modules(stderr: str) -> List[str]:
+    names = [line.rsplit('|', 1)[-1].strip() for line in stderr.splitlines() if line.startswith('import time:')]
+    return sorted({name.split('.')[0] for name in names if name.split('.')[0] in DEFERRED_MODULES})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-help-ms', type=float, default=200.0)
+    parser.add_argument('--max-cli-ms', type=float, default=300.0)
+    parser.add_argument('--max-web-ms', type=float, default=1500.0)
+    parser.add_argument('--max-client-ms', type=float, default=60.0)
+    args = parser.parse_args()
+
+    socket_path = Path(tempfile.mkdtemp()) / "launcher.sock"
+    daemon = start_daemon(socket_path)
+
+    modes = {
+        '--help': (lambda importtime=False: run_exiting(['--help'], b'', importtime), args.max_help_ms),
+        '--cli': (lambda importtime=False: run_exiting(['--cli'], b'exit\n', importtime), args.max_cli_ms),
+        '--web': (run_web, args.max_web_ms),
+        'client status': (lambda importtime=False: run_client(socket_path, importtime), args.max_client_ms),
+    }
+
+    rows, failures = [], []
+    try:
+        for mode, (run, target_ms) in modes.items():
+            row, problems = measure(mode, run, target_ms, args)
+            rows.append(row)
+            failures.extend(problems)
+    finally:
+        daemon.send_signal(signal.SIGTERM)
+        daemon.wait(timeout=15)
+
+    print_table(f"Startup time, median of {args.runs} runs", rows)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+def measure(mode: str, run, target_ms: float, args) -> Tuple[Dict, List[str]]:
+    """Time one mode, print its slowest imports and return (row, failures)"""
+    samples = [run()[0] * 1000 for _ in range(args.runs)]
+    median = statistics.median(samples)
+    _, stderr = run(importtime=True)
+    imports = parse_importtime(stderr)
+    toolkits = imported_modules(stderr)
+
+    failures = []
+    if median > target_ms:
+        failures.append(f"{mode}: median {median:.1f}ms exceeds {target_ms:.0f}ms")
+    if mode != '--web' and toolkits:
+        failures.append(f"{mode}: imported {', '.join(toolkits)}")
+
+    slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    print_table(f"Slowest top-level imports for {mode}",
+                [{'module': name, 'cumulative_ms': us / 1000} for name, us in slowest])
+
+    row = {'mode': mode, 'median_ms': median, 'min_ms': min(samples), 'target_ms': target_ms,
+           'imports_ms': sum(imports.values()) / 1000, 'toolkits': ",".join(toolkits) or "-"}
+    return row, failures
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Throughput and tail latency of the launcher web interface.
+
+Starts the launcher twice, once on the Flask development server (--web --dev)
+and once in the built-in serving mode, then drives /api/execute and
+/api/status from concurrent clients. Rate limiting is switched off in the
+servers under test so the numbers measure serving rather than 429s, and
+the run fails if any request does not return 200. Usage:
+
+    python perf/bench_web.py [--clients 32] [--seconds 10] [--workers 2] [--threads 16]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from benchlib import percentile, print_table
+
+REQUESTS = {
+    '/api/execute': ('POST', json.dumps({'operation': 'status'}), {'Content-Type': 'application/json'}),
+    '/api/status': ('GET', None, {}),
+}
+
+
+# Loads the launcher through benchlib and disables the per-client and global
+# token buckets before handing the command line to main()
+SERVER_BOOTSTRAP = (
+    "import sys; sys.path.insert(0, {perf_dir!r}); from benchlib import load_launcher; "
+    "launcher = load_launcher(); "
+    "launcher.config.RATE_LIMIT_CLIENT_PER_SECOND = 0; "
+    "launcher.config.RATE_LIMIT_GLOBAL_PER_SECOND = 0; "
+    "launcher.main()"
+).format(perf_dir=os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(extra_args, port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, '-c', SERVER_BOOTSTRAP, '--web', '--port', str(port), *extra_args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def stop_server(proc: subprocess.Popen):
+    proc.send_signal(signal.SIGTERM)
+    try:
+        proc.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def drive(port: int, path: str, clients: int, seconds: float):
+    """Run `clients` persistent clients against one path; return rps, p50, p99, errors"""
+    method, body, headers = REQUESTS[path]
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        local = []
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise RuntimeError(response.status)
+                local.append((time.perf_counter() - start) * 1000)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+                conn.close()
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    began = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - began
+    return len(latencies) / elapsed, percentile(latencies, 50), percentile(latencies, 99), errors[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument('--threads', type=int, default=16)
+    args = parser.parse_args()
+
+    servers = [
+        ('flask dev server', ['--dev']),
+        (f'built-in {args.workers}x{args.threads}',
+         ['--workers', str(args.workers), '--threads', str(args.threads)]),
+    ]
+    rows = []
+    for label, extra in servers:
+        port = free_port()
+        proc = start_server(extra, port)
+        try:
+            for path in REQUESTS:
+                rps, p50, p99, errors = drive(port, path, args.clients, args.seconds)
+                rows.append({'server': label, 'path': path, 'req_per_sec': rps,
+                             'p50_ms': p50, 'p99_ms': p99, 'errors': errors})
+        finally:
+            stop_server(proc)
+
+    print_table(f"Web interface, {args.clients} concurrent clients", rows)
+    failures = [row for row in rows if row['errors']]
+    for row in failures:
+        print(f"FAIL {row['server']} {row['path']}: {row['errors']} non-200 or failed requests")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the launcher micro-benchmarks in this directory.
+
+The launcher lives in a file whose name is not a valid module name
+(06-launcherplus.py), so benchmarks load it by path through this module.
+"""
+
+import importlib.util
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+LAUNCHER_PATH = Path(__file__).resolve().parent.parent / "06-launcherplus.py"
+
+_launcher = None
+
+
+def load_launcher():
+    """Import 06-launcherplus.py once and return the module object"""
+    global _launcher
+    if _launcher is None:
+        spec = importlib.util.spec_from_file_location("launcherplus", LAUNCHER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _launcher = module
+    return _launcher
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted sample list"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def time_calls(func: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Time individual calls of func and summarise them in microseconds"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return {
+        'iterations': iterations,
+        'mean_us': statistics.fmean(samples),
+        'p50_us': percentile(samples, 50),
+        'p99_us': percentile(samples, 99),
+    }
+
+
+def print_table(title: str, rows: List[Dict[str, object]]):
+    """Print benchmark rows as an aligned text table"""
+    print(title)
+    print("=" * len(title))
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(_fmt(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(_fmt(row[c]).ljust(widths[c]) for c in columns))
+    print()
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    return str(value)
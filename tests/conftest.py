@@ -0,0 +1,111 @@
+"""
+Shared fixtures for the launcher test suite.
+
+The launcher is loaded through perf/benchlib.py, which the benchmarks use
+too. Every launcher process the tests start, in-process or as a
+subprocess, keeps its logs, database and socket in a temporary
+LAUNCHER_DATA_DIR. Wall-clock budget tests only run with --run-timing.
+"""
+
+import heapq
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "perf"))
+
+from benchlib import LAUNCHER_PATH, load_launcher  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-timing", action="store_true",
+                     help="run wall-clock budget tests, which are unreliable on loaded machines")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "timing: wall-clock budget test, needs --run-timing")
+    # Set before the launcher is imported; its paths are fixed at import time
+    config.launcher_data_dir = tempfile.mkdtemp(prefix="launcher-tests-")
+    os.environ["LAUNCHER_DATA_DIR"] = config.launcher_data_dir
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(getattr(config, "launcher_data_dir", ""), ignore_errors=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-timing"):
+        return
+    skip = pytest.mark.skip(reason="wall-clock budget test; pass --run-timing to run it")
+    for item in items:
+        if "timing" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def launcher():
+    """The launcher module, with its data directory in a temporary location"""
+    module = load_launcher()
+    assert module.DATA_DIR == Path(os.environ["LAUNCHER_DATA_DIR"])
+    yield module
+    module.shutdown_services()
+
+
+@pytest.fixture
+def database(launcher, tmp_path):
+    """A DatabaseManager over its own file, closed after the test"""
+    db = launcher.DatabaseManager(tmp_path / "launcher.db", pool_size=2)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def executor(launcher):
+    """An executor over a private registry, so tests can register operations freely"""
+    registry = launcher.OperationRegistry([])
+    return launcher.SecureCommandExecutor(launcher.get_database(), registry)
+
+
+class FakeRoot:
+    """Stand-in for a Tk root: runs after() callbacks on the calling thread"""
+    
+    def __init__(self):
+        self._timers = []
+        self._ids = itertools.count()
+        self.lateness_ms = []
+    
+    def after(self, ms, callback):
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (time.monotonic() + ms / 1000, timer_id, callback))
+        return timer_id
+    
+    def after_cancel(self, timer_id):
+        self._timers = [timer for timer in self._timers if timer[1] != timer_id]
+        heapq.heapify(self._timers)
+    
+    def pending(self) -> int:
+        return len(self._timers)
+    
+    def run(self, until, timeout: float = 5.0):
+        """Fire timers in due order until `until()` is true; fail after `timeout` seconds"""
+        deadline = time.monotonic() + timeout
+        while not until():
+            assert time.monotonic() < deadline, "timed out waiting for the event loop"
+            assert self._timers, "event loop ran out of timers"
+            due, _, callback = heapq.heappop(self._timers)
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.lateness_ms.append((time.monotonic() - due) * 1000)
+            callback()
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
@@ -0,0 +1,122 @@
+"""Tests for the operations rollups and the analytics queried from them"""
+
+import time
+from datetime import datetime, timezone
+
+
+def test_percentile_interpolates_inside_its_bucket(launcher):
+    percentile = launcher.OperationAnalytics._percentile
+    histogram = {1: 50, 10: 50}
+    
+    assert percentile(histogram, 100, 50, 10) == 1.0
+    # Bucket (5, 10] holds ranks 51-100; rank 95 sits 45/50 of the way through
+    assert percentile(histogram, 100, 95, 10) == 9.5
+    assert percentile(histogram, 100, 100, 10) == 10.0
+
+
+def test_percentile_caps_the_overflow_bucket_at_the_observed_maximum(launcher):
+    percentile = launcher.OperationAnalytics._percentile
+    
+    assert percentile({-1: 10}, 10, 50, 40000) == 35000.0
+    assert percentile({1: 4}, 4, 99, 0) == 0.0
+
+
+def test_percentile_of_no_samples_is_zero(launcher):
+    assert launcher.OperationAnalytics._percentile({}, 0, 99, 0) == 0.0
+
+
+def test_stats_summarise_logged_operations(launcher, database):
+    now = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+    database.write_operations([
+        (now, "probe", "error" if duration <= 5 else "success", "", duration)
+        for duration in range(1, 101)
+    ])
+    database.write_operations([(now, "other", "success", "", 1)])
+    
+    stats = launcher.OperationAnalytics(database).stats(3600, 300, operation="probe")
+    
+    assert list(stats["operations"]) == ["probe"]
+    summary = stats["operations"]["probe"]["summary"]
+    assert summary["count"] == 100
+    assert summary["errors"] == 5
+    assert summary["error_rate"] == 0.05
+    assert summary["avg_ms"] == 50.5
+    assert summary["max_ms"] == 100
+    assert summary["p50_ms"] == 50.0
+    assert summary["p99_ms"] == 99.0
+    assert sum(bucket["count"] for bucket in stats["operations"]["probe"]["buckets"]) == 100
+
+
+def test_stats_report_utc_timestamps(launcher, database):
+    database.write_operations([(time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()), "probe", "success", "", 3)])
+    
+    stats = launcher.OperationAnalytics(database).stats(3600, 300)
+    
+    generated_at = datetime.fromisoformat(stats["generated_at"].replace("Z", "+00:00"))
+    assert generated_at.tzinfo == timezone.utc
+    assert abs(generated_at.timestamp() - time.time()) < 60
+    bucket = stats["operations"]["probe"]["buckets"][-1]
+    assert bucket["start"].endswith("Z")
+    assert datetime.fromisoformat(bucket["start"][:-1]).replace(tzinfo=timezone.utc).timestamp() % 300 == 0
+
+
+ROWS = [
+    ("2026-01-01 00:00:05", "probe", "success", "", 0),
+    ("2026-01-01 00:00:30", "probe", "error", "", 5),
+    ("2026-01-01 00:00:59", "probe", "success", "", 6),
+    ("2026-01-01 00:01:00", "probe", "success", "", 30001),
+    ("2026-01-01 00:01:00", "other", "success", "", 2),
+]
+MINUTE = 1767225600  # 2026-01-01 00:00:00 UTC
+
+
+def _rollups(db):
+    with db.get_connection() as conn:
+        rollup = {
+            (r["operation"], r["bucket_start"]): (r["count"], r["error_count"], r["total_ms"], r["max_ms"])
+            for r in conn.execute("SELECT * FROM operations_rollup")
+        }
+        hist = {
+            (r["operation"], r["bucket_start"], r["le_ms"]): r["count"]
+            for r in conn.execute("SELECT * FROM operations_latency_hist")
+        }
+    return rollup, hist
+
+
+EXPECTED_ROLLUP = {
+    ("probe", MINUTE): (3, 1, 11, 6),
+    ("probe", MINUTE + 60): (1, 0, 30001, 30001),
+    ("other", MINUTE + 60): (1, 0, 2, 2),
+}
+EXPECTED_HIST = {
+    ("probe", MINUTE, 1): 1,
+    ("probe", MINUTE, 5): 1,
+    ("probe", MINUTE, 10): 1,
+    ("probe", MINUTE + 60, -1): 1,
+    ("other", MINUTE + 60, 2): 1,
+}
+
+
+def test_inserts_maintain_minute_rollups_and_latency_buckets(database):
+    database.write_operations(ROWS)
+    
+    assert _rollups(database) == (EXPECTED_ROLLUP, EXPECTED_HIST)
+
+
+def test_rows_written_before_the_trigger_existed_are_backfilled(launcher, database):
+    with database.get_connection() as conn:
+        conn.execute("DROP TRIGGER trg_operations_log_rollup")
+        conn.commit()
+    database.write_operations(ROWS)
+    assert _rollups(database) == ({}, {})
+    
+    reopened = launcher.DatabaseManager(database.db_path, pool_size=1)
+    try:
+        assert _rollups(reopened) == (EXPECTED_ROLLUP, EXPECTED_HIST)
+        # The trigger is back, so later rows are counted exactly once
+        reopened.write_operations([("2026-01-01 00:00:10", "probe", "success", "", 1)])
+        rollup, hist = _rollups(reopened)
+        assert rollup[("probe", MINUTE)] == (4, 1, 12, 6)
+        assert hist[("probe", MINUTE, 1)] == 2
+    finally:
+        reopened.close()
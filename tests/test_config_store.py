@@ -0,0 +1,56 @@
+"""Tests for the database-backed settings store"""
+
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def other_database(launcher, database):
+    """A second DatabaseManager on the same file, as another process would open it"""
+    db = launcher.DatabaseManager(database.db_path, pool_size=2)
+    yield db
+    db.close()
+
+
+def test_write_is_visible_locally_on_return(launcher, database):
+    store = launcher.ConfigStore(database)
+    version = store.version
+    
+    store.set("theme", {"name": "dark", "size": 12})
+    
+    assert store.get("theme") == {"name": "dark", "size": 12}
+    assert store.version > version
+
+
+def test_write_through_one_store_reaches_a_watching_store(launcher, database, other_database):
+    writer = launcher.ConfigStore(database)
+    reader = launcher.ConfigStore(other_database, watch_interval_seconds=0.05)
+    seen = []
+    reloaded = threading.Event()
+    reader.subscribe(lambda version: (seen.append(version), reloaded.set()))
+    reader.start()
+    try:
+        writer.set("theme", "dark")
+        assert reloaded.wait(5)
+        assert reader.get("theme") == "dark"
+        assert seen == [writer.version]
+        
+        reloaded.clear()
+        writer.delete("theme")
+        assert reloaded.wait(5)
+        assert reader.get("theme") is None
+        assert reader.version == writer.version
+    finally:
+        reader.stop()
+
+
+def test_reload_without_a_new_version_keeps_the_snapshot(launcher, database):
+    store = launcher.ConfigStore(database)
+    store.set("retries", 3)
+    snapshot = store._values
+    
+    assert store.reload() is False
+    assert store._values is snapshot
+    assert store.reload(force=True) is True
+    assert store.all() == {"retries": 3}
@@ -0,0 +1,34 @@
+"""Tests for the --daemon Unix socket server"""
+
+import os
+import signal
+import socketserver
+import stat
+import threading
+
+import pytest
+
+
+@pytest.mark.skipif(not hasattr(socketserver, "UnixStreamServer"), reason="needs Unix sockets")
+def test_socket_is_private_from_the_moment_it_is_bound(launcher, tmp_path, monkeypatch):
+    modes = []
+    original_bind = socketserver.UnixStreamServer.server_bind
+    
+    def server_bind(server):
+        original_bind(server)
+        modes.append(stat.S_IMODE(os.stat(server.server_address).st_mode))
+        # Let serve() return as soon as it starts serving
+        threading.Thread(target=server.shutdown, daemon=True).start()
+    
+    monkeypatch.setattr(socketserver.UnixStreamServer, "server_bind", server_bind)
+    monkeypatch.setattr(signal, "signal", lambda signum, handler: None)
+    previous_umask = os.umask(0o022)
+    try:
+        launcher.LauncherDaemon(tmp_path / "launcher.sock").serve()
+        umask_after = os.umask(0o022)
+    finally:
+        os.umask(previous_umask)
+    
+    assert modes == [0o600]
+    assert umask_after == 0o022
+    assert not (tmp_path / "launcher.sock").exists()
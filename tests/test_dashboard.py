@@ -0,0 +1,133 @@
+"""Tests for the GUI metrics dashboard: MetricsHistory sampling and DashboardView redraws"""
+
+import itertools
+import time
+import types
+
+import pytest
+
+
+class FakeCanvas:
+    """Just enough of tk.Canvas for Sparkline and DashboardView"""
+    
+    def __init__(self, *args, **options):
+        self._ids = itertools.count(1)
+        self.delay = 0.0
+    
+    def _create(self, *args, **options):
+        return next(self._ids)
+    
+    create_rectangle = create_text = create_line = _create
+    
+    def coords(self, item, *coords):
+        time.sleep(self.delay)
+    
+    def itemconfigure(self, item, **options):
+        pass
+    
+    def bind(self, sequence, callback):
+        pass
+    
+    def after(self, ms, callback):
+        return None
+    
+    def after_cancel(self, timer_id):
+        pass
+    
+    def winfo_width(self):
+        return 800
+    
+    def winfo_height(self):
+        return 600
+
+
+@pytest.fixture
+def sampler(launcher, monkeypatch):
+    """Replace the resource sampler with one whose latest sample the test controls"""
+    stub = types.SimpleNamespace(available=True, sample=None)
+    stub.latest = lambda: stub.sample
+    monkeypatch.setattr(launcher, "get_resource_sampler", lambda: stub)
+    return stub
+
+
+def test_sample_turns_counter_and_histogram_deltas_into_rates(launcher, sampler):
+    history = launcher.MetricsHistory(capacity=10)
+    history.sample()
+    first = history._last[0]
+    
+    launcher.operations_total.inc("dashboard_test", "success", amount=8)
+    launcher.operations_total.inc("dashboard_test", "error", amount=2)
+    for _ in range(9):
+        launcher.operation_duration_seconds.observe(0.003, "dashboard_test")
+    launcher.operation_duration_seconds.observe(0.4, "dashboard_test")
+    history.sample()
+    elapsed = history._last[0] - first
+    
+    assert history.series["operations_per_second"][-1] == pytest.approx(10 / elapsed)
+    assert history.series["error_percent"][-1] == pytest.approx(20.0)
+    # Percentiles report the upper bound of the bucket they fall in
+    assert history.series["latency_p50_ms"][-1] == pytest.approx(5.0)
+    assert history.series["latency_p99_ms"][-1] == pytest.approx(500.0)
+    
+    history.sample()
+    assert history.series["operations_per_second"][-1] == 0.0
+    assert history.series["error_percent"][-1] == 0.0
+    assert history.series["latency_p50_ms"][-1] == 0.0
+
+
+def test_sample_copies_each_resource_sample_once(launcher, sampler):
+    history = launcher.MetricsHistory(capacity=10)
+    sampler.sample = {'timestamp': 1.0, 'cpu_percent': 12.5, 'memory_percent': 40.0,
+                      'disk_percent': 70.0, 'process_rss_bytes': 64 * 1024**2}
+    
+    history.sample()
+    history.sample()
+    
+    assert list(history.series["cpu_percent"]) == [12.5]
+    assert list(history.series["process_rss_mb"]) == [64.0]
+    assert history.updates["cpu_percent"] == 1
+
+
+@pytest.fixture
+def dashboard(launcher, monkeypatch, sampler):
+    monkeypatch.setattr(launcher, "tk", types.SimpleNamespace(Canvas=FakeCanvas, NW="nw", NE="ne"))
+    drawn = []
+    original = launcher.Sparkline.update
+    
+    def update(chart, values, capacity, available=True):
+        drawn.append(chart.title)
+        original(chart, values, capacity, available)
+    
+    monkeypatch.setattr(launcher.Sparkline, "update", update)
+    history = launcher.MetricsHistory(capacity=10)
+    for name in history.SERIES:
+        history._append(name, 1.0)
+    view = launcher.DashboardView(None, history, budget_ms=1000.0)
+    view._layout()
+    view.drawn = drawn
+    return view
+
+
+def test_redraw_skips_unchanged_series(dashboard):
+    dashboard.set_visible(True)
+    assert len(dashboard.drawn) == len(dashboard.CHARTS)
+    
+    dashboard.drawn.clear()
+    dashboard._redraw()
+    assert dashboard.drawn == []
+    
+    dashboard.history._append("cpu_percent", 50.0)
+    dashboard._redraw()
+    assert dashboard.drawn == ["Host CPU"]
+
+
+def test_redraw_stops_at_the_budget_and_resumes_next_tick(dashboard):
+    dashboard.budget = 0.004
+    dashboard.canvas.delay = 0.003
+    
+    dashboard.set_visible(True)
+    assert 0 < len(dashboard.drawn) < len(dashboard.CHARTS)
+    
+    for _ in range(len(dashboard.CHARTS)):
+        dashboard._redraw()
+    assert sorted(dashboard.drawn) == sorted(title for _, title, _, _ in dashboard.CHARTS)
@@ -0,0 +1,169 @@
+"""Tests for the pooled SQLite layer and the write-behind operations log"""
+
+import sqlite3
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def pool(launcher, tmp_path):
+    pool = launcher.ConnectionPool(tmp_path / "pool.db", size=2, busy_timeout_ms=3000, synchronous="NORMAL")
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (value INTEGER)")
+        conn.commit()
+    yield pool
+    pool.close()
+
+
+def test_connections_use_wal_and_the_configured_pragmas(pool):
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 3000
+
+
+def test_released_connections_are_reused(pool):
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first
+
+
+def test_checkout_waits_once_the_pool_is_exhausted(pool):
+    first = pool.acquire()
+    second = pool.acquire()
+    
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+    
+    pool.release(second)
+    assert pool.acquire(timeout=0.05) is second
+    pool.release(first)
+    pool.release(second)
+
+
+def test_release_rolls_back_an_open_transaction(pool):
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO items VALUES (1)")
+        assert conn.in_transaction
+    
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_closed_pool_refuses_checkouts_and_closes_returned_connections(pool):
+    conn = pool.acquire()
+    pool.close()
+    
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool.acquire()
+    pool.release(conn)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_concurrent_writers_share_the_pool_without_losing_rows(pool):
+    def write(offset: int):
+        for value in range(offset, offset + 50):
+            with pool.connection(timeout=5) as conn:
+                conn.execute("INSERT INTO items VALUES (?)", (value,))
+                conn.commit()
+    
+    threads = [threading.Thread(target=write, args=(n * 50,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    with pool.connection() as conn:
+        values = [row[0] for row in conn.execute("SELECT value FROM items ORDER BY value")]
+    assert values == list(range(400))
+    assert pool._created <= pool.size
+
+
+def _record(operation: str = "probe", duration_ms: int = 1):
+    return ("2026-01-01 00:00:00", operation, "success", "", duration_ms)
+
+
+def _count_operations(db) -> int:
+    with db.get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM operations_log").fetchone()[0]
+
+
+@pytest.fixture
+def batches(database):
+    """Sizes of the batches written through `database.write_operations`"""
+    sizes = []
+    write = database.write_operations
+    
+    def record(records):
+        sizes.append(len(records))
+        write(records)
+    
+    database.write_operations = record
+    return sizes
+
+
+def test_writer_batches_queued_rows_up_to_the_batch_size(launcher, database, batches):
+    writer = launcher.OperationLogWriter(database, batch_size=10, flush_interval=0.2)
+    for index in range(25):
+        writer.submit(_record(duration_ms=index))
+    
+    writer.start()
+    writer.flush()
+    writer.close()
+    
+    assert batches == [10, 10, 5]
+    assert _count_operations(database) == 25
+
+
+def test_writer_flushes_a_partial_batch_after_the_interval(launcher, database, batches):
+    writer = launcher.OperationLogWriter(database, batch_size=100, flush_interval=0.05).start()
+    
+    writer.submit(_record())
+    writer.flush()
+    
+    assert batches == [1]
+    assert _count_operations(database) == 1
+    writer.close()
+
+
+def test_full_queue_makes_the_producer_write_synchronously(launcher, database, batches):
+    writer = launcher.OperationLogWriter(database, max_queue=2, enqueue_timeout=0.01)
+    
+    for _ in range(5):
+        writer.submit(_record())
+    
+    assert writer.sync_fallbacks == 3
+    assert batches == [1, 1, 1]
+    writer.close()
+    assert batches == [1, 1, 1, 2]
+    assert _count_operations(database) == 5
+
+
+def test_close_flushes_rows_still_waiting_for_their_batch(launcher, tmp_path, monkeypatch):
+    monkeypatch.setattr(launcher.config, "OPLOG_BATCH_SIZE", 1000)
+    monkeypatch.setattr(launcher.config, "OPLOG_FLUSH_INTERVAL_SECONDS", 60)
+    db = launcher.DatabaseManager(tmp_path / "launcher.db", pool_size=2, write_behind=True)
+    for _ in range(50):
+        db.log_operation("probe", "success", "", 1)
+    
+    db.close()
+    
+    reopened = launcher.DatabaseManager(tmp_path / "launcher.db", pool_size=1)
+    try:
+        assert _count_operations(reopened) == 50
+    finally:
+        reopened.close()
+
+
+def test_rows_submitted_after_close_are_written_directly(launcher, database, batches):
+    writer = launcher.OperationLogWriter(database).start()
+    writer.close()
+    
+    writer.submit(_record())
+    
+    assert batches == [1]
+    assert _count_operations(database) == 1
@@ -0,0 +1,94 @@
+"""Tests for GuiWorkerPool, driven by a fake Tk root on the test thread"""
+
+import threading
+import time
+
+import pytest
+
+
+def _register(launcher, executor, name, stream):
+    executor.registry.register(launcher.OperationSpec(
+        name, lambda executor: "".join(stream(executor)), "Test operation", idempotent=True, stream=stream
+    ))
+
+
+@pytest.fixture
+def pool(launcher, root, executor):
+    busy = []
+    workers = launcher.GuiWorkerPool(root, executor, max_workers=2, poll_ms=5, budget_ms=4.0,
+                                     on_busy=busy.append)
+    workers.busy = busy
+    yield workers
+    workers.close()
+
+
+def test_events_are_marshalled_to_the_main_thread_in_order(launcher, root, executor, pool):
+    def counting(executor):
+        for index in range(20):
+            yield f"line {index}\n"
+    _register(launcher, executor, "counting", counting)
+    main_thread = threading.current_thread()
+    chunks, results, threads = [], [], set()
+    
+    def on_chunk(data):
+        threads.add(threading.current_thread())
+        chunks.append(data)
+    
+    def on_done(result):
+        threads.add(threading.current_thread())
+        results.append(result)
+    
+    pool.submit("counting", on_chunk=on_chunk, on_done=on_done)
+    root.run(lambda: results)
+    
+    assert "".join(chunks) == "".join(f"line {index}\n" for index in range(20))
+    assert results[0]["status"] == "success"
+    assert threads == {main_thread}
+    assert pool.busy == [True, False]
+
+
+def test_cancel_completes_immediately_and_stops_the_worker(launcher, root, executor, pool):
+    started, closed = threading.Event(), threading.Event()
+    
+    def endless(executor):
+        started.set()
+        try:
+            while True:
+                time.sleep(0.01)
+                yield "tick\n"
+        finally:
+            closed.set()
+    _register(launcher, executor, "endless", endless)
+    chunks, results = [], []
+    
+    task = pool.submit("endless", on_chunk=chunks.append, on_done=results.append)
+    root.run(lambda: chunks)
+    pool.cancel(task)
+    
+    assert [result["status"] for result in results] == ["cancelled"]
+    assert closed.wait(2)
+    delivered = len(chunks)
+    root.run(lambda: root.pending() == 0)
+    assert len(chunks) == delivered
+    assert pool.busy == [True, False]
+
+
+def test_flood_of_output_keeps_heartbeat_on_time(launcher, root, executor, pool):
+    def flood(executor):
+        for _ in range(20000):
+            yield "x" * 80 + "\n"
+    _register(launcher, executor, "flood", flood)
+    results, heartbeats = [], []
+    
+    def heartbeat():
+        heartbeats.append(bool(results))
+        if not results:
+            root.after(10, heartbeat)
+    
+    root.after(10, heartbeat)
+    pool.submit("flood", on_chunk=lambda data: sum(range(300)), on_done=results.append)
+    root.run(lambda: heartbeats and heartbeats[-1], timeout=30)
+    
+    assert results[0]["status"] == "success"
+    # Each drain tick is bounded by budget_ms, so no timer fires far past its due time
+    assert max(root.lateness_ms) < 30
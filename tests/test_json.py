@@ -0,0 +1,69 @@
+"""Tests for the shared JSON layer; every test runs against orjson and stdlib json"""
+
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+
+@dataclass
+class Sample:
+    name: str
+    tags: frozenset
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, launcher, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    launcher._load_orjson.cache_clear()
+    yield request.param
+    launcher._load_orjson.cache_clear()
+
+
+def test_supported_types_encode_the_same_way(launcher, backend):
+    value = {
+        "path": Path("/opt/cursor"),
+        "ids": {3},
+        "when": datetime(2024, 5, 1, 12, 30, 15, 250000),
+        "sample": Sample("bundle", frozenset({"x"})),
+        1: "non-string key",
+    }
+    
+    assert json.loads(launcher.json_dumpb(value)) == {
+        "path": "/opt/cursor",
+        "ids": [3],
+        "when": "2024-05-01T12:30:15.250000",
+        "sample": {"name": "bundle", "tags": ["x"]},
+        "1": "non-string key",
+    }
+
+
+def test_non_finite_floats_become_null(launcher, backend):
+    value = {"nan": float("nan"), "values": [1.5, float("inf"), -float("inf")], "nested": (float("nan"),)}
+    
+    assert launcher.json_dumps(value) == '{"nan":null,"values":[1.5,null,null],"nested":[null]}'
+
+
+def test_unsupported_types_raise_type_error(launcher, backend):
+    with pytest.raises(TypeError):
+        launcher.json_dumps({"value": object()})
+
+
+def test_integers_beyond_64_bits_still_encode(launcher, backend):
+    assert launcher.json_dumps([2 ** 70]) == f"[{2 ** 70}]"
+
+
+def test_pretty_output_uses_two_space_indent(launcher, backend):
+    assert launcher.json_dumps({"a": [1]}, pretty=True) == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_round_trip(launcher, backend):
+    value = {"text": "naïve ✓", "number": 1.25, "flag": True, "none": None}
+    
+    assert launcher.json_loads(launcher.json_dumpb(value)) == value
@@ -0,0 +1,237 @@
+"""Tests for the queued logging pipeline and reading logs back"""
+
+import gzip
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+
+import pytest
+
+
+def _record(name: str) -> logging.LogRecord:
+    return logging.LogRecord(name, logging.INFO, __file__, 1, "message", None, None)
+
+
+def test_full_queue_drops_ordinary_records(launcher):
+    records = queue.Queue(maxsize=1)
+    records.put_nowait(_record("busy"))
+    overflow = []
+    handler = launcher.NonBlockingQueueHandler(
+        records, lossless_logger="app.audit", block_seconds=0.01, overflow=overflow.append
+    )
+    
+    handler.enqueue(_record("app"))
+    
+    assert handler.dropped == 1
+    assert handler.overflowed == 0
+    assert overflow == []
+
+
+def test_full_queue_writes_audit_records_through_overflow(launcher):
+    records = queue.Queue(maxsize=1)
+    records.put_nowait(_record("busy"))
+    overflow = []
+    handler = launcher.NonBlockingQueueHandler(
+        records, lossless_logger="app.audit", block_seconds=0.01, overflow=overflow.append
+    )
+    audit_record = _record("app.audit")
+    
+    handler.enqueue(audit_record)
+    
+    assert handler.dropped == 0
+    assert handler.overflowed == 1
+    assert overflow == [audit_record]
+
+
+def test_audit_records_survive_a_saturated_queue(launcher, tmp_path):
+    plogger = launcher.ProfessionalLogger("test_audit_lossless", log_dir=str(tmp_path), queue_size=1)
+    plogger.queue_handler.block_seconds = 0.0
+    try:
+        for index in range(200):
+            plogger.info("noise %d", index)
+            plogger.audit("OPERATION_EXECUTED", str(index), operation="status")
+    finally:
+        plogger.close()
+    
+    lines = (tmp_path / "audit.log").read_text().splitlines()
+    # Overflowed records are written ahead of queued ones, so order is not kept
+    details = sorted(int(line.rsplit("DETAILS:", 1)[1]) for line in lines)
+    assert details == list(range(200))
+    assert all("ACTION:OPERATION_EXECUTED:status | DETAILS:" in line for line in lines)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forwarded_records_are_written_only_by_the_receiver(launcher, tmp_path):
+    receiver = launcher.ProfessionalLogger("test_forward", log_dir=str(tmp_path / "parent"))
+    parent_end, child_end = socket.socketpair()
+    reader = receiver.receive_from(parent_end)
+    
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            parent_end.close()
+            sender = launcher.ProfessionalLogger("test_forward", log_dir=str(tmp_path / "child"))
+            sender.forward_to(child_end)
+            for index in range(50):
+                sender.info("forwarded %d", index)
+            sender.audit("OPERATION_EXECUTED", "", operation="status")
+            sender.close()
+            code = 0
+        finally:
+            os._exit(code)
+    child_end.close()
+    
+    assert os.waitpid(pid, 0)[1] == 0
+    reader.join(5)
+    receiver.close()
+    
+    assert not (tmp_path / "child").exists()
+    lines = (tmp_path / "parent" / "launcher.log").read_text().splitlines()
+    assert [line.rsplit(" - ", 1)[1] for line in lines if "forwarded" in line] == [
+        f"forwarded {index}" for index in range(50)
+    ]
+    assert "ACTION:OPERATION_EXECUTED:status" in (tmp_path / "parent" / "audit.log").read_text()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_two_processes_rotating_one_file_lose_no_records(launcher, tmp_path):
+    start_at = time.monotonic() + 0.2
+    
+    def writer(name: str):
+        archiver = launcher.LogArchiver(tmp_path)
+        handler = launcher.ArchivingFileHandler(tmp_path / "shared.log", archiver, max_bytes=2000)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        time.sleep(max(0.0, start_at - time.monotonic()))
+        for index in range(100):
+            handler.handle(logging.makeLogRecord({"msg": f"{name} record {index:03d} " + "x" * 40}))
+            time.sleep(0.001)
+        handler.close()
+        archiver.close()
+    
+    children = []
+    for name in ("first", "second"):
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                writer(name)
+                code = 0
+            finally:
+                os._exit(code)
+        children.append(pid)
+    assert all(os.waitpid(pid, 0)[1] == 0 for pid in children)
+    # Segments left uncompressed are archived by the next archiver to start
+    launcher.LogArchiver(tmp_path).close()
+    
+    lines = []
+    for segment in launcher.list_log_segments(tmp_path, "shared.log"):
+        with launcher.open_log_segment(segment) as stream:
+            lines.extend(stream.read().splitlines())
+    for name in ("first", "second"):
+        assert sorted(line.split()[2] for line in lines if line.startswith(name)) == [
+            f"{index:03d}" for index in range(100)
+        ]
+    assert len(launcher.list_log_segments(tmp_path, "shared.log")) > 2
+
+
+def _log_line(seconds_ago: float, level: str, message: str) -> str:
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time() - seconds_ago))
+    return f"{stamp},000 - app - {level} - [app.py:1] - {message}\n"
+
+
+def _segment_name(seconds_ago: float) -> str:
+    return "launcher.log." + time.strftime("%Y%m%d-%H%M%S", time.localtime(time.time() - seconds_ago))
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """launcher.log with a gzip segment, a plain segment and the active file"""
+    with gzip.open(tmp_path / (_segment_name(3600) + ".gz"), "wt") as segment:
+        segment.write(_log_line(7200, "INFO", "gz started"))
+        segment.write(_log_line(3700, "ERROR", "gz failure"))
+    (tmp_path / _segment_name(600)).write_text(
+        _log_line(1200, "INFO", "plain started")
+        + _log_line(700, "ERROR", "plain failure")
+        + "Traceback (most recent call last):\n"
+        + "ValueError: boom\n"
+    )
+    (tmp_path / "launcher.log").write_text(
+        "".join(_log_line(60 - index, "INFO", f"active {index}") for index in range(5))
+    )
+    return tmp_path
+
+
+def _tail(launcher, log_dir, count, **query):
+    return launcher.LogTailer(log_dir, "launcher.log", launcher.LogQuery(**query)).tail(count)
+
+
+def test_reverse_line_reader_crosses_block_boundaries(launcher, tmp_path):
+    lines = [f"line {index} " + "y" * (index % 7) for index in range(200)]
+    path = tmp_path / "plain.log"
+    path.write_text("\n".join(lines) + "\n")
+    
+    assert list(launcher._iter_lines_reverse(path, block_size=16)) == [""] + lines[::-1]
+
+
+def test_tail_reads_newest_records_first_across_segments(launcher, log_dir):
+    assert [record.rsplit(" - ", 1)[1] for record in _tail(launcher, log_dir, 3)] == [
+        "active 2", "active 3", "active 4"
+    ]
+    
+    records = _tail(launcher, log_dir, 9)
+    assert len(records) == 9
+    assert records[0].endswith("gz started")
+    assert records[-1].endswith("active 4")
+
+
+def test_tail_keeps_traceback_lines_with_their_record(launcher, log_dir):
+    assert _tail(launcher, log_dir, 10, level="error") == [
+        _log_line(3700, "ERROR", "gz failure").rstrip("\n"),
+        _log_line(700, "ERROR", "plain failure")
+        + "Traceback (most recent call last):\nValueError: boom",
+    ]
+
+
+def test_tail_filters_by_grep_over_plain_and_gzip_segments(launcher, log_dir):
+    records = _tail(launcher, log_dir, 10, grep="STARTED")
+    
+    assert [record.rsplit(" - ", 1)[1] for record in records] == ["gz started", "plain started"]
+
+
+def test_tail_since_skips_segments_rotated_before_the_window(launcher, log_dir):
+    # A segment rotated before the window must never be opened
+    (log_dir / (_segment_name(3600) + ".gz")).write_bytes(b"not gzip")
+    
+    records = _tail(launcher, log_dir, 10, since_seconds=900)
+    
+    assert [record.splitlines()[0].rsplit(" - ", 1)[1] for record in records] == [
+        "plain failure", "active 0", "active 1", "active 2", "active 3", "active 4"
+    ]
+
+
+def test_follow_continues_into_the_new_file_after_rotation(launcher, log_dir):
+    tailer = launcher.LogTailer(log_dir, "launcher.log", launcher.LogQuery())
+    tailer.tail(1)
+    active = log_dir / "launcher.log"
+    
+    def rotate():
+        time.sleep(0.1)
+        with open(active, "a") as stream:
+            stream.write(_log_line(0, "INFO", "before rotation"))
+        os.rename(active, log_dir / "launcher.log.99990101-000000")
+        active.write_text(_log_line(0, "INFO", "after rotation"))
+    
+    writer = threading.Thread(target=rotate)
+    writer.start()
+    try:
+        chunks = list(tailer.follow(time.monotonic() + 1.0, poll_interval=0.05))
+    finally:
+        writer.join()
+    
+    assert [line.rsplit(" - ", 1)[1] for line in "\n".join(chunks).splitlines()] == [
+        "before rotation", "after rotation"
+    ]
@@ -0,0 +1,65 @@
+"""Tests for operation dispatch and result caching"""
+
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def executor(launcher, executor):
+    """The shared private-registry executor, seeded with the built-in `help`"""
+    executor.registry.register(launcher.operation_registry.get("help"))
+    return executor
+
+
+def test_help_lists_operations_registered_after_it_was_cached(launcher, executor):
+    assert "late_op" not in executor.execute_operation("help")["output"]
+    
+    executor.registry.register(launcher.OperationSpec(
+        "late_op", lambda executor: "late", "Registered after help was cached", idempotent=True
+    ))
+    
+    assert "late_op" in executor.execute_operation("help")["output"]
+
+
+def test_help_is_served_from_cache_while_nothing_changes(executor):
+    first = executor.execute_operation("help")["output"]
+    cached = executor._result_cache["help"]
+    
+    assert executor.execute_operation("help")["output"] == first
+    assert executor._result_cache["help"] is cached
+
+
+def test_health_and_check_run_inline_off_the_timeout_pool(launcher):
+    for name in ("health", "check"):
+        assert launcher.operation_registry.get(name).timeout_seconds is None
+
+
+def test_timed_out_handlers_are_tracked_and_cap_the_pool(launcher, executor, monkeypatch):
+    monkeypatch.setattr(launcher.config, "OPERATION_MAX_ABANDONED", 2)
+    release = threading.Event()
+    executor.registry.register(launcher.OperationSpec(
+        "stuck", lambda executor: release.wait(5) and "done", "Blocks until released",
+        timeout_seconds=0.05
+    ))
+    
+    try:
+        for _ in range(2):
+            result = executor.execute_operation("stuck")
+            assert result["status"] == "error"
+            assert "timed out" in result["message"]
+        assert launcher.SecureCommandExecutor.abandoned_operations() == 2
+        
+        refused = executor.execute_operation("stuck")
+        assert refused["status"] == "error"
+        assert "still running" in refused["message"]
+        assert refused["duration_ms"] < 50
+    finally:
+        release.set()
+    
+    deadline = time.monotonic() + 5
+    while launcher.SecureCommandExecutor.abandoned_operations() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert launcher.SecureCommandExecutor.abandoned_operations() == 0
+    assert executor.execute_operation("stuck")["output"] == "done"
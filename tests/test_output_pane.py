@@ -0,0 +1,175 @@
+"""Tests for OutputPane against a minimal stand-in for the Tk text widget"""
+
+import types
+
+import pytest
+
+
+class FakeWidget:
+    """Just enough of ttk.Frame/Button and ScrolledText for OutputPane"""
+    
+    def __init__(self, *args, **options):
+        self.content = ""
+        self.options = {}
+        self.shown = False
+        self.timers = []
+    
+    def grid(self, **options):
+        self.shown = True
+    
+    def grid_remove(self):
+        self.shown = False
+    
+    def columnconfigure(self, *args, **options):
+        pass
+    
+    rowconfigure = columnconfigure
+    
+    def config(self, **options):
+        self.options.update(options)
+    
+    def _offset(self, index) -> int:
+        if index in ("end", "end-1c"):
+            return len(self.content)
+        line, column = map(int, str(index).split("."))
+        lines = self.content.split("\n")
+        if line > len(lines):
+            return len(self.content)
+        return sum(len(text) + 1 for text in lines[:line - 1]) + column
+    
+    def insert(self, index, text):
+        offset = self._offset(index)
+        self.content = self.content[:offset] + text + self.content[offset:]
+    
+    def delete(self, first, last="end"):
+        self.content = self.content[:self._offset(first)] + self.content[self._offset(last):]
+    
+    def get(self, first, last):
+        return self.content[self._offset(first):self._offset(last)]
+    
+    def index(self, index):
+        assert index == "end-1c"
+        return f"{self.content.count(chr(10)) + 1}.0"
+    
+    def after(self, ms, callback):
+        self.timers.append(callback)
+        return len(self.timers)
+    
+    def after_cancel(self, timer_id):
+        self.timers[timer_id - 1] = None
+
+
+@pytest.fixture
+def make_pane(launcher, monkeypatch):
+    monkeypatch.setattr(launcher, "tk", types.SimpleNamespace(W="w", E="e", N="n", S="s", END="end"))
+    monkeypatch.setattr(launcher, "ttk", types.SimpleNamespace(Frame=FakeWidget, Button=FakeWidget))
+    monkeypatch.setattr(launcher, "scrolledtext", types.SimpleNamespace(ScrolledText=FakeWidget))
+    panes = []
+    
+    def make(**options):
+        pane = launcher.OutputPane(None, **options)
+        pane.reset("Operation: test\nStatus: running\n")
+        panes.append(pane)
+        return pane
+    
+    yield make
+    for pane in panes:
+        pane.close()
+
+
+def _pump(pane) -> int:
+    """Run queued flush ticks; return how many ran"""
+    ticks = 0
+    while pane.text.timers:
+        callback = pane.text.timers.pop(0)
+        if callback is not None:
+            callback()
+            ticks += 1
+    return ticks
+
+
+def _body(pane) -> str:
+    return pane.text.content.split("\n", pane.header_lines)[pane.header_lines]
+
+
+def _lines(count: int) -> str:
+    return "".join(f"line {index}\n" for index in range(count))
+
+
+def test_output_is_inserted_one_chunk_per_tick(make_pane):
+    pane = make_pane(chunk_chars=1000)
+    output = _lines(300)
+    
+    pane.append(output)
+    
+    assert _body(pane) == ""
+    assert _pump(pane) == -(-len(output) // 1000)
+    assert _body(pane) == output
+
+
+def test_widget_keeps_only_the_newest_lines(make_pane):
+    pane = make_pane(max_lines=100, chunk_chars=1000)
+    output = _lines(1000)
+    
+    pane.append(output)
+    _pump(pane)
+    
+    assert _body(pane) == "".join(output.splitlines(keepends=True)[-100:])
+    assert pane.more_button.shown
+
+
+def test_rendering_jumps_ahead_when_too_much_is_pending(make_pane):
+    pane = make_pane(max_lines=100000, chunk_chars=1000, max_pending_chars=20000)
+    output = _lines(10000)
+    
+    for start in range(0, len(output), 5000):
+        pane.append(output[start:start + 5000])
+    ticks = _pump(pane)
+    
+    body = _body(pane)
+    assert len(body) <= 20000
+    assert output.endswith(body)
+    assert ticks <= 20
+    assert pane.more_button.shown
+
+
+def test_load_more_from_a_line_boundary(make_pane):
+    pane = make_pane(max_lines=100, load_more_lines=30)
+    output = _lines(1000)
+    pane.append(output)
+    _pump(pane)
+    
+    pane.load_more()
+    
+    assert _body(pane) == "".join(output.splitlines(keepends=True)[-130:])
+
+
+def test_load_more_from_mid_line(make_pane):
+    pane = make_pane(max_lines=100000, max_pending_chars=20000, load_more_lines=30)
+    output = _lines(10000)
+    # 4999-character appends leave the jump-ahead point in the middle of a line
+    for start in range(0, len(output), 4999):
+        pane.append(output[start:start + 4999])
+    _pump(pane)
+    shown = _body(pane)
+    assert not shown.startswith("line ")
+    
+    pane.load_more()
+    
+    body = _body(pane)
+    assert output.endswith(body)
+    assert body.startswith("line ")
+    assert body.count("\n") == shown.count("\n") + 30
+
+
+def test_load_more_stops_at_the_start_of_the_output(make_pane):
+    pane = make_pane(max_lines=100, load_more_lines=300)
+    output = _lines(1000)
+    pane.append(output)
+    _pump(pane)
+    
+    for _ in range(10):
+        pane.load_more()
+    
+    assert _body(pane) == output
+    assert not pane.more_button.shown
@@ -0,0 +1,71 @@
+"""Tests for launching, reaping and stopping supervised processes"""
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "killpg"), reason="needs POSIX process groups")
+
+
+@pytest.fixture(params=["pidfd", "polling"])
+def supervisor(launcher, request):
+    supervisor = launcher.ProcessSupervisor(stop_timeout=5, poll_interval=0.05)
+    if request.param == "polling":
+        supervisor._use_pidfd = False
+    elif not supervisor._use_pidfd:
+        pytest.skip("pidfd_open is not available")
+    supervisor.start()
+    yield supervisor
+    supervisor.stop(timeout=1)
+    supervisor.close()
+
+
+def _python(code: str):
+    return [sys.executable, "-c", code]
+
+
+def _assert_reaped(pid: int):
+    with pytest.raises(ChildProcessError):
+        os.waitpid(pid, os.WNOHANG)
+
+
+def test_child_exiting_on_its_own_is_reaped_with_its_status(supervisor, tmp_path):
+    instance = supervisor.launch(_python("import sys; sys.exit(3)"), str(tmp_path))
+    
+    assert instance.exited.wait(5)
+    assert instance.popen.returncode == 3
+    assert supervisor.instances() == []
+    assert list(supervisor.recent_exits) == [instance]
+    _assert_reaped(instance.pid)
+
+
+def test_stop_terminates_and_reaps_a_running_child(supervisor, tmp_path):
+    instance = supervisor.launch(_python("import time; time.sleep(30)"), str(tmp_path))
+    
+    assert supervisor.stop(instance.pid) == [
+        {"pid": instance.pid, "returncode": -signal.SIGTERM, "forced": False}
+    ]
+    assert instance.ended_at is not None
+    assert supervisor.instances() == []
+    _assert_reaped(instance.pid)
+
+
+def test_stop_kills_a_child_that_ignores_sigterm(supervisor, tmp_path):
+    ready = tmp_path / "ready"
+    instance = supervisor.launch(_python(
+        "import pathlib, signal, time\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        f"pathlib.Path({str(ready)!r}).touch()\n"
+        "time.sleep(30)\n"
+    ), str(tmp_path))
+    deadline = time.monotonic() + 5
+    while not ready.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    assert supervisor.stop(instance.pid, timeout=0.2) == [
+        {"pid": instance.pid, "returncode": -signal.SIGKILL, "forced": True}
+    ]
+    _assert_reaped(instance.pid)
@@ -0,0 +1,95 @@
+"""Tests for the server-side session store"""
+
+import time
+
+import pytest
+
+
+@pytest.fixture
+def store(launcher, database):
+    return launcher.SessionStore(database, timeout_minutes=30, capacity=2, cache_ttl_seconds=60)
+
+
+def _stored_sessions(database):
+    with database.get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+def _drop_row(database, sid):
+    with database.get_connection() as conn:
+        conn.execute("DELETE FROM sessions WHERE id = ?", (sid,))
+        conn.commit()
+
+
+def test_saved_session_is_read_back_as_a_copy(store):
+    sid = store.new_id()
+    expires_at = store.save(sid, {"user": "admin"})
+    
+    data = store.get(sid)
+    data["user"] = "changed"
+    
+    assert store.get(sid) == {"user": "admin"}
+    assert store.expires_at(sid) == expires_at
+    assert expires_at == pytest.approx(time.time() + 30 * 60, abs=5)
+
+
+def test_session_is_reread_from_the_database_once_its_cache_entry_is_stale(launcher, database):
+    fresh = launcher.SessionStore(database, cache_ttl_seconds=60)
+    stale = launcher.SessionStore(database, cache_ttl_seconds=0)
+    sid = fresh.new_id()
+    fresh.save(sid, {"n": 1})
+    stale.save(sid, {"n": 1})
+    
+    _drop_row(database, sid)
+    
+    assert fresh.get(sid) == {"n": 1}
+    assert stale.get(sid) is None
+    assert stale.expires_at(sid) is None
+
+
+def test_cache_evicts_the_least_recently_used_session(store, database):
+    first, second, third = (store.new_id() for _ in range(3))
+    store.save(first, {"n": 1})
+    store.save(second, {"n": 2})
+    store.get(first)
+    store.save(third, {"n": 3})
+    
+    assert store.expires_at(second) is None
+    assert store.expires_at(first) is not None
+    # Evicted sessions are still served from the database
+    assert store.get(second) == {"n": 2}
+
+
+def test_expired_session_is_not_returned(launcher, database):
+    store = launcher.SessionStore(database, timeout_minutes=0)
+    sid = store.new_id()
+    store.save(sid, {"user": "admin"})
+    
+    assert store.get(sid) is None
+    assert store.expires_at(sid) is None
+
+
+def test_needs_refresh_once_the_sliding_expiry_is_worth_extending(launcher, database):
+    store = launcher.SessionStore(database, timeout_minutes=30, refresh_seconds=60)
+    sid = store.new_id()
+    
+    assert store.needs_refresh(sid)
+    store.save(sid, {})
+    assert not store.needs_refresh(sid)
+    
+    store._remember(sid, {}, time.time() + 30 * 60 - 61)
+    assert store.needs_refresh(sid)
+
+
+def test_sweep_removes_only_expired_rows_in_batches(launcher, database):
+    expired = launcher.SessionStore(database, timeout_minutes=0, sweep_batch=2)
+    live = launcher.SessionStore(database, timeout_minutes=30)
+    for _ in range(5):
+        expired.save(expired.new_id(), {})
+    kept = live.new_id()
+    live.save(kept, {"user": "admin"})
+    
+    assert expired.sweep() == 5
+    assert expired._cache == {}
+    assert _stored_sessions(database) == 1
+    assert live.get(kept) == {"user": "admin"}
@@ -0,0 +1,67 @@
+"""Startup budgets for the modes that must not pay for the GUI and web toolkits
+
+The wall-clock budgets only run with --run-timing.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+from benchlib import LAUNCHER_PATH
+
+RUNS = 5
+# Budgets documented in perf/bench_startup.py
+MAX_HELP_MS = 200.0
+MAX_CLI_MS = 300.0
+DEFERRED_MODULES = ("tkinter", "flask", "werkzeug")
+
+# Runs the launcher's main() in-process, then reports which toolkits it imported
+CLI_PROBE = """
+import runpy, sys
+sys.argv = [{path!r}, '--cli']
+try:
+    runpy.run_path({path!r}, run_name='__main__')
+except SystemExit:
+    pass
+loaded = sorted({{name.split('.')[0] for name in sys.modules}} & set({modules!r}))
+print('LOADED:' + ','.join(loaded))
+"""
+
+
+def _environment(data_dir) -> dict:
+    return {**os.environ, "LAUNCHER_DATA_DIR": str(data_dir)}
+
+
+def _median_ms(args, stdin: bytes, data_dir) -> float:
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(LAUNCHER_PATH), *args], input=stdin, env=_environment(data_dir),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.timing
+@pytest.mark.parametrize("args, stdin, budget_ms", [
+    (["--help"], b"", MAX_HELP_MS),
+    (["--cli"], b"exit\n", MAX_CLI_MS),
+])
+def test_startup_within_budget(args, stdin, budget_ms, tmp_path):
+    median = _median_ms(args, stdin, tmp_path)
+    
+    assert median <= budget_ms, f"{args[0]} median {median:.1f}ms exceeds {budget_ms:.0f}ms"
+
+
+def test_cli_does_not_import_gui_or_web_toolkits(tmp_path):
+    probe = CLI_PROBE.format(path=str(LAUNCHER_PATH), modules=DEFERRED_MODULES)
+    result = subprocess.run([sys.executable, "-c", probe], input=b"exit\n", env=_environment(tmp_path),
+                            capture_output=True, check=True)
+    
+    last_line = result.stdout.decode().strip().splitlines()[-1]
+    assert last_line == "LOADED:"
+    assert (tmp_path / "launcher.db").exists()
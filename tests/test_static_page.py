@@ -0,0 +1,98 @@
+"""Tests for StaticPage content negotiation and conditional requests"""
+
+import gzip
+import sys
+import types
+
+import pytest
+
+HTML = "<!DOCTYPE html><html><body>" + "launcher " * 200 + "</body></html>"
+
+
+@pytest.fixture
+def app(launcher):
+    if not launcher.load_web():
+        pytest.skip("Flask is not installed")
+    return launcher.Flask(__name__)
+
+
+@pytest.fixture
+def fake_brotli(launcher, monkeypatch):
+    """Install a stand-in brotli module; the real one is an optional dependency"""
+    module = types.SimpleNamespace(compress=lambda body, quality: b"BR:" + body)
+    monkeypatch.setitem(sys.modules, "brotli", module)
+    launcher._load_brotli.cache_clear()
+    yield module
+    launcher._load_brotli.cache_clear()
+
+
+@pytest.fixture
+def page(launcher, app, fake_brotli):
+    return launcher.StaticPage(HTML, max_age=60)
+
+
+VARIANTS = [
+    ("identity", None, lambda body: body),
+    ("gzip", "gzip", gzip.decompress),
+    ("br, gzip", "br", lambda body: body[len(b"BR:"):]),
+]
+
+
+def _get(app, page, accept_encoding, if_none_match=None):
+    headers = {"Accept-Encoding": accept_encoding}
+    if if_none_match is not None:
+        headers["If-None-Match"] = if_none_match
+    with app.test_request_context("/", headers=headers):
+        return page.response()
+
+
+@pytest.mark.parametrize("accept_encoding, encoding, decode", VARIANTS)
+def test_serves_the_negotiated_variant(app, page, accept_encoding, encoding, decode):
+    response = _get(app, page, accept_encoding)
+    
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == encoding
+    assert decode(response.get_data()) == HTML.encode()
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize("accept_encoding, encoding, decode", VARIANTS)
+def test_matching_etag_gets_304(app, page, accept_encoding, encoding, decode):
+    etag = _get(app, page, accept_encoding).headers["ETag"]
+    
+    response = _get(app, page, accept_encoding, if_none_match=etag)
+    
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("accept_encoding, encoding, decode", VARIANTS)
+def test_weak_etag_from_a_proxy_still_matches(app, page, accept_encoding, encoding, decode):
+    etag = _get(app, page, accept_encoding).headers["ETag"]
+    
+    response = _get(app, page, accept_encoding, if_none_match=f'"stale", W/{etag}')
+    
+    assert response.status_code == 304
+
+
+def test_etag_of_another_variant_does_not_match(app, page):
+    gzip_etag = _get(app, page, "gzip").headers["ETag"]
+    
+    response = _get(app, page, "identity", if_none_match=gzip_etag)
+    
+    assert response.status_code == 200
+    assert response.get_data() == HTML.encode()
+
+
+def test_without_brotli_br_clients_get_gzip(launcher, app, monkeypatch):
+    monkeypatch.setitem(sys.modules, "brotli", None)
+    launcher._load_brotli.cache_clear()
+    try:
+        page = launcher.StaticPage(HTML)
+        response = _get(app, page, "br, gzip")
+    finally:
+        launcher._load_brotli.cache_clear()
+    
+    assert "br" not in page.variants
+    assert response.headers["Content-Encoding"] == "gzip"
@@ -0,0 +1,99 @@
+"""Tests for the Flask web interface"""
+
+import http.client
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def client(launcher):
+    if not launcher.load_web():
+        pytest.skip("Flask is not installed")
+    app = launcher.create_web_interface()
+    app.testing = True
+    return app.test_client()
+
+
+def _script(html: str) -> str:
+    return re.search(r"<script>(.*)</script>", html, re.S).group(1)
+
+
+def test_index_script_keeps_javascript_escapes(client):
+    script = _script(client.get("/").get_data(as_text=True))
+    
+    assert "buffer.indexOf('\\n\\n')" in script
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_index_script_is_valid_javascript(client, tmp_path):
+    path = tmp_path / "index.js"
+    path.write_text(_script(client.get("/").get_data(as_text=True)))
+    
+    result = subprocess.run(["node", "--check", str(path)], capture_output=True, text=True)
+    
+    assert result.returncode == 0, result.stderr
+
+
+def test_stream_get_runs_idempotent_operations(client):
+    response = client.get("/api/execute/stream?operation=version")
+    
+    assert response.status_code == 200
+    assert "event: done" in response.get_data(as_text=True)
+
+
+@pytest.mark.parametrize("operation", ["launch", "restart", "stop pid=1", "no_such_operation"])
+def test_stream_get_rejects_other_operations(client, operation):
+    response = client.get("/api/execute/stream", query_string={"operation": operation})
+    
+    assert response.status_code == 405
+    assert response.headers["Allow"] == "POST"
+
+
+@pytest.fixture
+def pooled_server(launcher):
+    """Production-mode server with 2 threads and a 0.2 s connection queue timeout"""
+    if not launcher.load_web():
+        pytest.skip("Flask is not installed")
+    launcher.operation_registry.register(launcher.OperationSpec(
+        "test_sleep", lambda executor: time.sleep(0.5) or "slept", "Sleeps for half a second"
+    ))
+    app = launcher.create_web_interface(max_in_flight=2)
+    server = launcher._make_pooled_server("127.0.0.1", 0, app, threads=2, client_timeout=5,
+                                          queue_timeout=0.2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.drain()
+    server.server_close()
+
+
+def test_pooled_server_sheds_connections_queued_past_the_timeout(launcher, pooled_server):
+    responses = []
+    lock = threading.Lock()
+    
+    def call():
+        conn = http.client.HTTPConnection("127.0.0.1", pooled_server.server_port, timeout=10)
+        conn.request("POST", "/api/execute", body='{"operation": "test_sleep"}',
+                     headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        with lock:
+            responses.append((response.status, response.getheader("Retry-After"), response.read()))
+        conn.close()
+    
+    shed_before = launcher.requests_shed_total.total(reason="connection_queue_timeout")
+    clients = [threading.Thread(target=call) for _ in range(8)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join(10)
+    
+    statuses = sorted(status for status, _, _ in responses)
+    assert statuses == [200] * 2 + [503] * 6
+    assert all(retry_after == "1" for status, retry_after, _ in responses if status == 503)
+    assert launcher.requests_shed_total.total(reason="connection_queue_timeout") - shed_before == 6